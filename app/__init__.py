@@ -1,28 +1,29 @@
-﻿from flask import Flask, Blueprint, jsonify, request
-from app.database import db
-from flask_cors import CORS
-import logging
+﻿from app.utils.startup_profile import startup_profile
+with startup_profile.phase('import: flask/sqlalchemy'):
+    from flask import Flask, Blueprint, jsonify, request
+    from app.database import db, init_db
+    from flask_cors import CORS
 import os
-from app.routes.device_routes import device_bp
-from app.routes.learning_routes import learning_bp
-from app.routes.main_routes import main_bp
-from app.routes.config_routes import bp as config_bp
-from logging.handlers import RotatingFileHandler
+with startup_profile.phase('import: routes/services'):
+    from app.routes.device_routes import device_bp
+    from app.routes.learning_routes import learning_bp
+    from app.routes.main_routes import main_bp
+    from app.routes.config_routes import bp as config_bp
+from app.models.cli_command import CommandParameter
+from app.utils.db_diagnostics import ensure_columns, ensure_indexes, report_query_plans, explain_query_plans
+from app.utils.compression import init_compression
+from app.utils.static_assets import init_static_assets
+from app.utils.json_provider import FastJSONProvider
+from app.utils.metrics import init_metrics
+from app.utils.logger import configure_logging, pipeline as logging_pipeline
 from app.config import Config
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('logs/app.log')
-    ]
-)
-
 # 글로벌 API 라우트를 처리하는 Blueprint 생성
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+# 템플릿이 참조하는 JS/CSS/favicon 은 저장소 최상위 static/ 에 있음
+STATIC_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+
 # 디바이스 API 경로 추가
 @api_bp.route('/devices', methods=['GET'])
 def get_devices_api():
@@ -34,15 +35,34 @@ def get_device_api(device_id):
     """디바이스 상세 API 라우트"""
     return jsonify({})  # 디바이스 라우트로 리다이렉션하지 않고 빈 객체 반환
 
+@api_bp.route('/diagnostics/query-plans', methods=['GET'])
+def get_query_plans_api():
+    """핫 쿼리 실행 계획 진단 API 라우트"""
+    reports = explain_query_plans(db.engine)
+    return jsonify({
+        'dialect': db.engine.dialect.name,
+        'full_scans': [report['name'] for report in reports if report['full_scan']],
+        'errors': [report['name'] for report in reports if report['error']],
+        'queries': reports
+    })
+
 def create_app(config_class=Config):
-    app = Flask(__name__, template_folder='templates')
+    startup_profile.reset()
+    app = Flask(__name__, template_folder='templates', static_folder=STATIC_FOLDER)
     CORS(app)
     
     # 설정
     app.config.from_object(config_class)
     
-    # 데이터베이스 초기화
-    db.init_app(app)
+    # JSON 직렬화 (orjson 이 있으면 사용, datetime 은 ISO 8601)
+    app.json = FastJSONProvider(app)
+    
+    # 데이터베이스 초기화 (연결 풀, SQLite PRAGMA 성능 프로필 적용)
+    with startup_profile.phase('init_db'):
+        init_db(app)
+    
+    # 요청 지표 수집 및 /metrics (응답 크기가 압축 후 값이 되도록 다른 응답 훅보다 먼저 등록)
+    init_metrics(app)
     
     # 보안 헤더 설정
     @app.after_request
@@ -51,19 +71,21 @@ def create_app(config_class=Config):
             response.headers[header] = value
         return response
     
-    # 로깅 설정
-    if not os.path.exists('logs'):
-        os.mkdir('logs')
+    # 응답 압축 (gzip/brotli) 및 정적 파일 지문/사전 압축
+    init_compression(app)
+    with startup_profile.phase('static assets'):
+        init_static_assets(app)
     
-    file_handler = RotatingFileHandler(
+    # 로깅 설정 (큐 파이프라인, 파일 쓰기는 리스너 스레드에서 처리)
+    configure_logging(debug_sample_rate=app.config.get('LOG_DEBUG_SAMPLE_RATE'))
+    logging_pipeline.add_file_handler(
         app.config['LOG_FILE'],
-        maxBytes=app.config['LOG_MAX_SIZE'],
-        backupCount=app.config['LOG_BACKUP_COUNT']
+        max_bytes=app.config['LOG_MAX_SIZE'],
+        backup_count=app.config['LOG_BACKUP_COUNT'],
+        level=app.config['LOG_LEVEL'],
+        fmt=app.config['LOG_FORMAT'],
+        logger_name=app.logger.name
     )
-    file_handler.setFormatter(logging.Formatter(app.config['LOG_FORMAT']))
-    file_handler.setLevel(app.config['LOG_LEVEL'])
-    
-    app.logger.addHandler(file_handler)
     app.logger.setLevel(app.config['LOG_LEVEL'])
     app.logger.info('네트워크 자동화 애플리케이션 시작')
     
@@ -75,6 +97,24 @@ def create_app(config_class=Config):
     app.register_blueprint(api_bp)  # 글로벌 API 라우트 등록
     
     with app.app_context():
-        db.create_all()
+        with startup_profile.phase('db.create_all'):
+            db.create_all()
+        # 기존 DB 에 새로 선언된 컬럼 추가 (create_all 은 기존 테이블을 변경하지 않음)
+        with startup_profile.phase('ensure_columns'):
+            ensure_columns(db.engine)
+        # 파라미터 연결 테이블이 추가되기 전의 DB 는 기존 명령어로 채움
+        with startup_profile.phase('backfill'):
+            CommandParameter.backfill(db.session.connection())
+            db.session.commit()
+        # 기존 DB 에 새로 선언된 인덱스를 추가하고 핫 쿼리 실행 계획 확인
+        with startup_profile.phase('ensure_indexes'):
+            ensure_indexes(db.engine)
+        if app.config.get('QUERY_PLAN_CHECK_ON_STARTUP', False):
+            with startup_profile.phase('query plan check'):
+                report_query_plans(db.engine)
+    
+    app.extensions['startup_profile'] = startup_profile.summary()
+    if app.config.get('STARTUP_PROFILE', True):
+        startup_profile.report(app.logger)
     
     return app
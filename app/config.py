@@ -6,6 +6,36 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or os.urandom(32)
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///network_automation.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # 데이터베이스 성능 프로필 (SQLite PRAGMA, 연결 풀)
+    SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_CACHE_SIZE = int(os.environ.get('SQLITE_CACHE_SIZE', -64000))  # 음수는 KiB 단위
+    SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+    SQLITE_BUSY_TIMEOUT = int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000))  # ms
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 20))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 3600))
+    # 시작 시 핫 쿼리 실행 계획(EXPLAIN QUERY PLAN)을 확인하여 전체 스캔을 경고 (기본 꺼짐, 진단 API 로도 확인 가능)
+    QUERY_PLAN_CHECK_ON_STARTUP = os.environ.get('QUERY_PLAN_CHECK_ON_STARTUP', 'false').lower() == 'true'
+    # create_app 완료 시 시작 단계별 소요 시간(import, DB 초기화 등)을 로그로 남김
+    STARTUP_PROFILE = os.environ.get('STARTUP_PROFILE', 'true').lower() == 'true'
+    # /metrics (Prometheus 텍스트 형식) 요청 지연/크기/오류 지표 수집
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+    
+    # 응답 압축 (brotli 패키지가 설치된 경우 brotli 우선, 없으면 gzip)
+    COMPRESS_ENABLED = os.environ.get('COMPRESS_ENABLED', 'true').lower() == 'true'
+    COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))  # bytes
+    COMPRESS_GZIP_LEVEL = 6
+    COMPRESS_BROTLI_QUALITY = 5
+    # 정적 파일 내용 해시 지문 + 사전 압축 (지문 URL 은 immutable 장기 캐시)
+    STATIC_FINGERPRINT = os.environ.get('STATIC_FINGERPRINT', 'true').lower() == 'true'
+    STATIC_CACHE_DIR = os.environ.get('STATIC_CACHE_DIR')  # 없으면 instance/static-cache
+    # 오프라인 문서 학습 API 가 읽을 수 있는 문서 디렉토리 (요청의 root 는 이 디렉토리 기준 상대 경로)
+    OFFLINE_DOCS_DIR = os.environ.get('OFFLINE_DOCS_DIR', 'config/docs')
+    # 스크립트 실행 시 등록된 장비에 실제로 SSH 접속 (기본 꺼짐: 시뮬레이션, 소요 시간은 실제 실행만 기록)
+    DEVICE_EXECUTION_ENABLED = os.environ.get('DEVICE_EXECUTION_ENABLED', 'false').lower() == 'true'
+    DEVICE_CONNECT_TIMEOUT = float(os.environ.get('DEVICE_CONNECT_TIMEOUT', 10))  # 초
     
     # 보안 관련 설정
     SESSION_COOKIE_SECURE = True
@@ -32,3 +62,5 @@ class Config:
     LOG_FILE = 'logs/network_automation.log'
     LOG_MAX_SIZE = 10 * 1024 * 1024  # 10MB
     LOG_BACKUP_COUNT = 5
+    # DEBUG 로그 샘플링: 호출 위치마다 처음 20개 이후에는 N개 중 1개만 기록 (1 이면 전부 기록)
+    LOG_DEBUG_SAMPLE_RATE = int(os.environ.get('LOG_DEBUG_SAMPLE_RATE', 10))
@@ -1,3 +1,91 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 
-db = SQLAlchemy() 
\ No newline at end of file
+db = SQLAlchemy()
+
+# SQLite 성능 프로필 기본값 (설정에 같은 이름의 키가 있으면 그 값을 사용)
+SQLITE_DEFAULTS = {
+    'SQLITE_JOURNAL_MODE': 'WAL',        # 읽기와 쓰기가 서로 막지 않도록 WAL 사용
+    'SQLITE_SYNCHRONOUS': 'NORMAL',      # WAL 에서는 NORMAL 도 손상 없이 안전 (전원 장애 시 마지막 트랜잭션만 유실 가능)
+    'SQLITE_CACHE_SIZE': -64000,         # 음수는 KiB 단위 (약 64MB)
+    'SQLITE_MMAP_SIZE': 256 * 1024 * 1024,
+    'SQLITE_BUSY_TIMEOUT': 5000,         # 잠금 대기 시간 (ms)
+    'SQLITE_TEMP_STORE': 'MEMORY'
+}
+
+# 연결 풀 설정 키 -> create_engine 인자
+POOL_SETTINGS = {
+    'DB_POOL_SIZE': 'pool_size',
+    'DB_MAX_OVERFLOW': 'max_overflow',
+    'DB_POOL_TIMEOUT': 'pool_timeout',
+    'DB_POOL_RECYCLE': 'pool_recycle',
+    'DB_POOL_PRE_PING': 'pool_pre_ping'
+}
+
+
+def is_memory_sqlite(uri):
+    url = make_url(uri)
+    return url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')
+
+
+def sqlite_pragmas(config):
+    """설정에서 연결마다 적용할 PRAGMA 문 목록을 만듭니다."""
+    settings = {key: config.get(key, default) for key, default in SQLITE_DEFAULTS.items()}
+    pragmas = []
+    if settings['SQLITE_JOURNAL_MODE']:
+        pragmas.append(f"PRAGMA journal_mode={settings['SQLITE_JOURNAL_MODE']}")
+    if settings['SQLITE_SYNCHRONOUS']:
+        pragmas.append(f"PRAGMA synchronous={settings['SQLITE_SYNCHRONOUS']}")
+    if settings['SQLITE_CACHE_SIZE']:
+        pragmas.append(f"PRAGMA cache_size={int(settings['SQLITE_CACHE_SIZE'])}")
+    if settings['SQLITE_MMAP_SIZE'] is not None:
+        pragmas.append(f"PRAGMA mmap_size={int(settings['SQLITE_MMAP_SIZE'])}")
+    if settings['SQLITE_BUSY_TIMEOUT'] is not None:
+        pragmas.append(f"PRAGMA busy_timeout={int(settings['SQLITE_BUSY_TIMEOUT'])}")
+    if settings['SQLITE_TEMP_STORE']:
+        pragmas.append(f"PRAGMA temp_store={settings['SQLITE_TEMP_STORE']}")
+    return pragmas
+
+
+def apply_sqlite_pragmas(engine, pragmas):
+    """엔진의 새 DB-API 연결마다 PRAGMA 를 실행하도록 connect 이벤트를 등록합니다."""
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def engine_options(config):
+    """SQLALCHEMY_ENGINE_OPTIONS 에 연결 풀 설정을 더한 create_engine 인자를 만듭니다.
+
+    메모리 SQLite 는 단일 연결 풀(StaticPool)을 사용하므로 풀 크기 설정을 적용하지 않습니다.
+    """
+    options = dict(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    uri = config.get('SQLALCHEMY_DATABASE_URI') or ''
+    if not uri or is_memory_sqlite(uri):
+        return options
+    for key, option in POOL_SETTINGS.items():
+        if config.get(key) is not None:
+            options.setdefault(option, config[key])
+    if make_url(uri).get_backend_name() == 'sqlite':
+        # 스레드 서버에서 풀 연결을 여러 스레드가 번갈아 사용하므로 스레드 검사 해제
+        connect_args = dict(options.get('connect_args') or {})
+        connect_args.setdefault('check_same_thread', False)
+        options['connect_args'] = connect_args
+    return options
+
+
+def init_db(app):
+    """성능 프로필(연결 풀, SQLite PRAGMA)을 적용하여 데이터베이스를 초기화합니다."""
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config)
+    db.init_app(app)
+    with app.app_context():
+        apply_sqlite_pragmas(db.engine, sqlite_pragmas(app.config))
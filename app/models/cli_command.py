@@ -1,9 +1,31 @@
 from datetime import datetime
+import hashlib
+import json
+from sqlalchemy import event, select
 from app import db
 
 class CLICommand(db.Model):
     """CLI 명령어 모델"""
     __tablename__ = 'cli_commands'
+    __table_args__ = (
+        # get_by_vendor, 재학습 diff (vendor), 중복 확인 (vendor, device_type, task_type, subtask)
+        db.Index('ix_cli_commands_vendor_identity', 'vendor', 'device_type', 'task_type', 'subtask'),
+        # get_by_task (task_type[, subtask])
+        db.Index('ix_cli_commands_task', 'task_type', 'subtask'),
+        # get_by_device_type
+        db.Index('ix_cli_commands_device_type', 'device_type'),
+        # 학습 결과 병합 (vendor, command)
+        db.Index('ix_cli_commands_vendor_command', 'vendor', 'command'),
+        # 재학습 diff (vendor, source)
+        db.Index('ix_cli_commands_vendor_source', 'vendor', 'source'),
+    )
+
+    # 명령어 출처 (재학습/병합은 같은 출처의 행에만 적용, NULL 은 출처 기록 이전의 행)
+    SOURCE_WEB = 'web'
+    SOURCE_BULK = 'bulk'
+    SOURCE_RUNNING_CONFIG = 'running-config'
+    SOURCE_DOCS = 'docs'
+    SOURCE_MANUAL = 'manual'
     
     id = db.Column(db.Integer, primary_key=True)
     vendor = db.Column(db.String(50), nullable=False)  # 벤더 (cisco, juniper, arista, hp)
@@ -13,9 +35,31 @@ class CLICommand(db.Model):
     command = db.Column(db.Text, nullable=False)  # CLI 명령어
     parameters = db.Column(db.JSON)  # 파라미터 정보
     description = db.Column(db.Text)  # 설명
+    source = db.Column(db.String(20), default=SOURCE_MANUAL)  # 출처 (web, bulk, running-config, docs, manual)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # 재학습 시 동일 명령어로 판단하는 식별 필드와 변경 여부를 판단하는 내용 필드
+    IDENTITY_FIELDS = ('device_type', 'task_type', 'subtask', 'command')
+    CONTENT_FIELDS = ('parameters', 'description')
+
+    @classmethod
+    def identity_key(cls, data):
+        """명령어(객체 또는 딕셔너리)의 식별 키를 반환합니다."""
+        if isinstance(data, dict):
+            return tuple(data.get(field) for field in cls.IDENTITY_FIELDS)
+        return tuple(getattr(data, field) for field in cls.IDENTITY_FIELDS)
+
+    @classmethod
+    def content_hash(cls, data):
+        """명령어(객체 또는 딕셔너리) 내용의 SHA-256 해시를 계산합니다."""
+        if isinstance(data, dict):
+            content = {field: data.get(field) for field in cls.CONTENT_FIELDS}
+        else:
+            content = {field: getattr(data, field) for field in cls.CONTENT_FIELDS}
+        payload = json.dumps(content, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
     def to_dict(self):
         """객체를 딕셔너리로 변환"""
         return {
@@ -27,6 +71,7 @@ class CLICommand(db.Model):
             'command': self.command,
             'parameters': self.parameters,
             'description': self.description,
+            'source': self.source,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
         }
@@ -51,4 +96,138 @@ class CLICommand(db.Model):
 
     @classmethod
     def get_all(cls):
-        return cls.query.all() 
\ No newline at end of file
+        return cls.query.all() 
+
+class CLICommandAlias(db.Model):
+    """유사 명령어 병합 시 대표 명령어에 연결되는 별칭"""
+    __tablename__ = 'cli_command_aliases'
+
+    id = db.Column(db.Integer, primary_key=True)
+    command_id = db.Column(db.Integer, db.ForeignKey('cli_commands.id', ondelete='CASCADE'),
+                           nullable=False, index=True)
+    vendor = db.Column(db.String(50), nullable=False)
+    alias = db.Column(db.Text, nullable=False)  # 병합 전 명령어 원문
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    command = db.relationship('CLICommand', backref=db.backref(
+        'aliases', cascade='all, delete-orphan'))
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'command_id': self.command_id,
+            'vendor': self.vendor,
+            'alias': self.alias,
+            'created_at': self.created_at
+        }
+
+
+class CommandParameter(db.Model):
+    """명령어-파라미터 연결 테이블
+
+    CLICommand.parameters (JSON) 를 파라미터 단위 행으로 정규화하여, 파라미터 이름이나
+    (vendor, task_type, subtask) 로 명령어를 찾을 때 색인을 사용할 수 있게 합니다.
+    """
+    __tablename__ = 'cli_command_parameters'
+    __table_args__ = (
+        db.UniqueConstraint('command_id', 'name', name='uq_cli_command_parameters_command_name'),
+        db.Index('ix_cli_command_parameters_vendor_task', 'vendor', 'task_type', 'subtask'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    command_id = db.Column(db.Integer, db.ForeignKey('cli_commands.id', ondelete='CASCADE'), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
+    position = db.Column(db.Integer, nullable=False, default=0)  # 명령어 내 파라미터 순서
+    # 조회 조건으로 쓰이는 명령어 필드 (색인 사용을 위해 복사 보관)
+    vendor = db.Column(db.String(50), nullable=False)
+    task_type = db.Column(db.String(50), nullable=False)
+    subtask = db.Column(db.String(50), nullable=False)
+
+    command = db.relationship('CLICommand', backref=db.backref(
+        'parameter_rows', cascade='all, delete-orphan'))
+
+    SYNC_CHUNK_SIZE = 500
+
+    @staticmethod
+    def parameter_names(parameters):
+        """JSON 파라미터 값(이름 배열, 이름->설정 딕셔너리, {'name': ...} 배열)에서 이름 목록을 추출합니다."""
+        if not parameters:
+            return []
+        if isinstance(parameters, dict):
+            names = list(parameters.keys())
+        else:
+            names = [p.get('name') if isinstance(p, dict) else p for p in parameters]
+        return list(dict.fromkeys(str(name) for name in names if name))
+
+    @classmethod
+    def rows_for(cls, command):
+        """명령어(행 매핑 또는 객체)의 파라미터 행 목록을 생성합니다."""
+        get = command.get if isinstance(command, dict) else lambda field: getattr(command, field)
+        return [{
+            'command_id': get('id'),
+            'name': name,
+            'position': position,
+            'vendor': get('vendor'),
+            'task_type': get('task_type'),
+            'subtask': get('subtask')
+        } for position, name in enumerate(cls.parameter_names(get('parameters')))]
+
+    @classmethod
+    def sync(cls, connection, command_ids=None, after_id=None):
+        """cli_commands 의 지정된 행(ID 목록 또는 after_id 초과)에 대해 파라미터 행을 다시 만듭니다.
+
+        bulk insert/update 처럼 ORM 이벤트가 발생하지 않는 경로에서 같은 트랜잭션 안에 호출합니다.
+        """
+        commands = CLICommand.__table__
+        params = cls.__table__
+        columns = [commands.c.id, commands.c.vendor, commands.c.task_type,
+                   commands.c.subtask, commands.c.parameters]
+        if command_ids is not None:
+            ids = list(command_ids)
+            batches = [ids[i:i + cls.SYNC_CHUNK_SIZE] for i in range(0, len(ids), cls.SYNC_CHUNK_SIZE)]
+            selects = [select(*columns).where(commands.c.id.in_(batch)) for batch in batches]
+        elif after_id is not None:
+            selects = [select(*columns).where(commands.c.id > after_id)]
+        else:
+            selects = [select(*columns)]
+
+        synced = 0
+        for statement in selects:
+            rows = [dict(row._mapping) for row in connection.execute(statement)]
+            if not rows:
+                continue
+            row_ids = [row['id'] for row in rows]
+            for i in range(0, len(row_ids), cls.SYNC_CHUNK_SIZE):
+                connection.execute(params.delete().where(
+                    params.c.command_id.in_(row_ids[i:i + cls.SYNC_CHUNK_SIZE])))
+            param_rows = [param for row in rows for param in cls.rows_for(row)]
+            if param_rows:
+                connection.execute(params.insert(), param_rows)
+            synced += len(rows)
+        return synced
+
+    @classmethod
+    def backfill(cls, connection):
+        """연결 테이블이 비어 있으면 (테이블 추가 이전 DB) 전체 명령어로 채웁니다."""
+        if connection.execute(select(cls.__table__.c.id).limit(1)).first() is not None:
+            return 0
+        return cls.sync(connection)
+
+    @classmethod
+    def delete_for(cls, connection, command_ids):
+        """삭제되는 명령어의 파라미터 행을 제거합니다."""
+        params = cls.__table__
+        ids = list(command_ids)
+        for i in range(0, len(ids), cls.SYNC_CHUNK_SIZE):
+            connection.execute(params.delete().where(params.c.command_id.in_(ids[i:i + cls.SYNC_CHUNK_SIZE])))
+
+
+@event.listens_for(CLICommand, 'after_insert')
+@event.listens_for(CLICommand, 'after_update')
+def _sync_command_parameters(mapper, connection, target):
+    """ORM 으로 추가/수정된 명령어의 파라미터 행을 동기화합니다."""
+    params = CommandParameter.__table__
+    connection.execute(params.delete().where(params.c.command_id == target.id))
+    rows = CommandParameter.rows_for(target)
+    if rows:
+        connection.execute(params.insert(), rows)
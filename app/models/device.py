@@ -3,6 +3,10 @@ from datetime import datetime
 
 class Device(db.Model):
     __tablename__ = 'devices'
+    __table_args__ = (
+        # 장비 추가/수정 시 IP 중복 확인
+        db.Index('ux_devices_ip_address', 'ip_address', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -29,8 +33,8 @@ class Device(db.Model):
             'device_type': self.device_type,
             'username': self.username,
             'status': self.status,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 VENDOR_TEMPLATES = {
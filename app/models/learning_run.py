@@ -0,0 +1,61 @@
+from app.database import db
+from datetime import datetime
+
+class LearningRun(db.Model):
+    """백그라운드 CLI 학습 실행 모델"""
+    __tablename__ = 'learning_runs'
+
+    # 실행 상태
+    PENDING = 'pending'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+    INTERRUPTED = 'interrupted'  # 서버 재시작 등으로 실행 스레드가 사라진 경우
+    FINISHED_STATUSES = (COMPLETED, FAILED, CANCELLED, INTERRUPTED)
+
+    id = db.Column(db.String(32), primary_key=True)
+    status = db.Column(db.String(20), nullable=False, default=PENDING)
+    vendors = db.Column(db.JSON)  # 학습 대상 벤더 목록
+    current_vendor = db.Column(db.String(50))  # 현재 학습 중인 벤더
+    vendors_done = db.Column(db.Integer, default=0)
+    pages_fetched = db.Column(db.Integer, default=0)
+    commands_extracted = db.Column(db.Integer, default=0)
+    inserted = db.Column(db.Integer, default=0)
+    updated = db.Column(db.Integer, default=0)
+    deleted = db.Column(db.Integer, default=0)
+    results = db.Column(db.JSON)  # 벤더별 결과 요약
+    error = db.Column(db.Text)
+    cancel_requested = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    @property
+    def is_finished(self):
+        return self.status in self.FINISHED_STATUSES
+
+    def to_dict(self):
+        total = len(self.vendors or [])
+        return {
+            'id': self.id,
+            'status': self.status,
+            'vendors': self.vendors or [],
+            'current_vendor': self.current_vendor,
+            'vendors_done': self.vendors_done or 0,
+            'progress': round(100 * (self.vendors_done or 0) / total) if total else 0,
+            'pages_fetched': self.pages_fetched or 0,
+            'commands_extracted': self.commands_extracted or 0,
+            'inserted': self.inserted or 0,
+            'updated': self.updated or 0,
+            'deleted': self.deleted or 0,
+            'results': self.results or {},
+            'error': self.error,
+            'cancel_requested': bool(self.cancel_requested),
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+    def __repr__(self):
+        return f'<LearningRun {self.id} {self.status}>'
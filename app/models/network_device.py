@@ -1,39 +1,65 @@
-﻿import paramiko
+﻿import socket
 import time
 from typing import List, Dict
 import logging
 
+from app.utils.logger import LazyText
+from app.utils.metrics import device_commands_total, device_connections_total
+from app.utils.timing import PhaseTimer
+
 class NetworkDevice:
-    def __init__(self, host: str, username: str, password: str, device_type: str = 'cisco'):
+    def __init__(self, host: str, username: str, password: str, device_type: str = 'cisco',
+                 port: int = 22, timeout: float = None):
         self.host = host
         self.username = username
         self.password = password
         self.device_type = device_type
-        self.ssh = None
+        self.port = port
+        self.timeout = timeout
+        self.ssh = None  # paramiko.Transport
         self.channel = None
+        self.timings = PhaseTimer()  # 단계별 소요 시간 (execute_script 마다 새로 시작)
         self.logger = logging.getLogger(__name__)
 
     def connect(self) -> bool:
+        # SSH 라이브러리는 실제 접속할 때만 import (앱 시작 시간 단축)
+        import paramiko
+
+        sock = None
         try:
-            self.ssh = paramiko.SSHClient()
-            self.ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            self.ssh.connect(
-                self.host,
-                username=self.username,
-                password=self.password,
-                look_for_keys=False,
-                allow_agent=False
-            )
-            self.channel = self.ssh.invoke_shell()
+            # TCP 연결, SSH 핸드셰이크, 인증, 셸 준비를 단계별로 측정하기 위해 Transport 를 직접 사용
+            # (SSHClient + AutoAddPolicy 와 마찬가지로 호스트 키는 검증하지 않음)
+            with self.timings.phase('tcp_connect'):
+                sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            with self.timings.phase('ssh_handshake'):
+                self.ssh = paramiko.Transport(sock)
+                self.ssh.start_client(timeout=self.timeout)
+            with self.timings.phase('auth'):
+                self.ssh.auth_password(self.username, self.password)
+            with self.timings.phase('shell_setup'):
+                self.channel = self.ssh.open_session()
+                self.channel.get_pty(term='vt100', width=80, height=24)
+                self.channel.invoke_shell()
             self.logger.info(f'SSH ?곌껐 ?깃났: {self.host}')
+            device_connections_total.inc(device_type=self.device_type, result='success')
             return True
         except Exception as e:
             self.logger.error(f'SSH ?곌껐 ?ㅽ뙣: {str(e)}')
+            device_connections_total.inc(device_type=self.device_type, result='failure')
+            # 핸드셰이크/인증 중 실패하면 열린 Transport(또는 소켓)를 정리
+            if self.ssh is not None:
+                self.ssh.close()
+                self.ssh = None
+            elif sock is not None:
+                sock.close()
             return False
 
     def disconnect(self):
         if self.ssh:
-            self.ssh.close()
+            with self.timings.phase('disconnect'):
+                self.ssh.close()
+            self.ssh = None
+            self.channel = None
             self.logger.info(f'SSH ?곌껐 醫낅즺: {self.host}')
 
     def send_command(self, command: str, wait_time: float = 1) -> str:
@@ -41,18 +67,27 @@ class NetworkDevice:
             if not self.channel:
                 raise Exception('SSH 梨꾨꼸???곌껐?섏? ?딆븯?듬땲??')
 
-            self.channel.send(command + '\n')
-            time.sleep(wait_time)
-            output = self.channel.recv(65535).decode('utf-8')
-            self.logger.debug(f'紐낅졊???ㅽ뻾: {command}')
-            self.logger.debug(f'?ㅽ뻾 寃곌낵: {output}')
+            # 왕복 시간에는 출력 대기(wait_time)가 포함되므로 함께 기록
+            with self.timings.command(command) as entry:
+                entry['wait_ms'] = wait_time * 1000
+                self.channel.send(command + '\n')
+                time.sleep(wait_time)
+                output = self.channel.recv(65535).decode('utf-8')
+                entry['output_bytes'] = len(output)
+            self.logger.debug('紐낅졊???ㅽ뻾: %s', command)
+            self.logger.debug('?ㅽ뻾 寃곌낵: %s', LazyText(output))
+            device_commands_total.inc(device_type=self.device_type, result='success')
             return output
         except Exception as e:
             self.logger.error(f'紐낅졊???ㅽ뻾 ?ㅽ뙣: {str(e)}')
+            device_commands_total.inc(device_type=self.device_type, result='failure')
             raise
 
     def execute_script(self, commands: List[str]) -> Dict[str, str]:
+        """명령어를 차례로 실행하고 결과와 단계별 소요 시간(timings)을 반환합니다."""
         results = {}
+        error = None
+        self.timings = PhaseTimer()
         try:
             if not self.connect():
                 raise Exception('?λ퉬 ?곌껐 ?ㅽ뙣')
@@ -60,17 +95,21 @@ class NetworkDevice:
             for command in commands:
                 output = self.send_command(command)
                 results[command] = output
-
-            return {
-                'status': 'success',
-                'results': results
-            }
         except Exception as e:
             self.logger.error(f'?ㅽ겕由쏀듃 ?ㅽ뻾 ?ㅽ뙣: {str(e)}')
+            error = str(e)
+        finally:
+            self.disconnect()
+
+        if error is not None:
             return {
                 'status': 'error',
-                'message': str(e),
-                'results': results
+                'message': error,
+                'results': results,
+                'timings': self.timings.to_dict()
             }
-        finally:
-            self.disconnect() 
+        return {
+            'status': 'success',
+            'results': results,
+            'timings': self.timings.to_dict()
+        }
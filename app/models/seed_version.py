@@ -0,0 +1,22 @@
+from app.database import db
+from datetime import datetime
+
+class SeedVersion(db.Model):
+    """적용된 기본 데이터(seed) 버전 모델"""
+    __tablename__ = 'seed_versions'
+
+    name = db.Column(db.String(50), primary_key=True)  # seed 이름 (task_types 등)
+    content_hash = db.Column(db.String(64), nullable=False)  # 적용한 seed 내용의 SHA-256
+    keys = db.Column(db.JSON)  # seed 가 관리하는 행의 식별 키 목록
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'content_hash': self.content_hash,
+            'keys': self.keys or [],
+            'applied_at': self.applied_at.isoformat() if self.applied_at else None
+        }
+
+    def __repr__(self):
+        return f'<SeedVersion {self.name} {self.content_hash[:8]}>'
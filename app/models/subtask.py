@@ -5,7 +5,7 @@ class Subtask(db.Model):
     __tablename__ = 'subtasks'
     
     id = db.Column(db.Integer, primary_key=True)
-    task_type = db.Column(db.String(50), nullable=False)
+    task_type = db.Column(db.String(50), nullable=False, index=True)
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
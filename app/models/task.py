@@ -5,7 +5,7 @@ class Task(db.Model):
     __tablename__ = 'tasks'
     
     id = db.Column(db.Integer, primary_key=True)
-    device_id = db.Column(db.Integer, db.ForeignKey('devices.id'), nullable=False)
+    device_id = db.Column(db.Integer, db.ForeignKey('devices.id'), nullable=False, index=True)
     task_type = db.Column(db.String(50), nullable=False)
     feature = db.Column(db.String(100), nullable=False)
     subtask = db.Column(db.String(100))
@@ -4,6 +4,10 @@ from datetime import datetime
 class TaskType(db.Model):
     """작업 유형 모델"""
     __tablename__ = 'task_types'
+    __table_args__ = (
+        # 작업 유형 추가 시 (name, vendor) 중복 확인
+        db.Index('ux_task_types_name_vendor', 'name', 'vendor', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -26,8 +30,8 @@ class TaskType(db.Model):
             'description': self.description,
             'vendor': self.vendor,
             'template_key': self.template_key,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
     
     def __repr__(self):
@@ -1,6 +1,14 @@
 from flask import Blueprint, jsonify, request, current_app, render_template
 from ..services.config_service import ConfigService
-from app.utils.logger import setup_logger
+from ..services.seed_service import SeedService
+from .learning_routes import learning_service
+from .device_routes import device_service, normalize_device_records, DEVICE_LIST_FIELDS
+from ..exceptions import ValidationError
+from app.utils.logger import setup_logger, LazyJSON, log_event
+from app.utils.lazy import LazyService
+from app.utils.catalog_cache import catalog_cache
+from app.utils.pagination import (parse_page_request, paginate_items, project_items, page_payload,
+                                  fetch_page, serialize_value)
 from app.models.task_type import TaskType
 from app.database import db
 from app.models.subtask import Subtask
@@ -10,11 +18,11 @@ import logging
 from datetime import datetime
 import os
 import subprocess
-import json
 from typing import List, Dict, Any, Tuple
 
 bp = Blueprint('config', __name__, url_prefix='/config')
-config_service = ConfigService()
+config_service = LazyService(ConfigService)
+seed_service = SeedService()
 logger = setup_logger(__name__)
 
 # 로거 설정
@@ -563,63 +571,80 @@ def index():
     logger.info("설정 페이지 요청")
     return render_template('config/index.html')
 
+# 작업 유형 목록 API 에서 fields= 로 선택할 수 있는 컬럼 (기본 응답은 TaskType.to_dict() 와 같은 필드)
+TASK_TYPE_LIST_COLUMNS = {
+    'id': TaskType.id,
+    'name': TaskType.name,
+    'description': TaskType.description,
+    'vendor': TaskType.vendor,
+    'template_key': TaskType.template_key,
+    'created_at': TaskType.created_at,
+    'updated_at': TaskType.updated_at
+}
+TASK_TYPE_LIST_FIELDS = tuple(TASK_TYPE_LIST_COLUMNS)
+TASK_TYPE_FILTERS = ('name', 'vendor')
+TASK_TYPE_FORMATS = ('full', 'names_only')
+
+def _invalidate_task_type_catalog():
+    """작업 유형이 바뀌면 작업 유형 목록과 부트스트랩 캐시를 버립니다."""
+    catalog_cache.invalidate('task_types')
+    catalog_cache.invalidate('bootstrap')
+
+def _list_task_types(query, page, format_type):
+    """작업 유형 목록 응답 데이터 (task_type dict 목록 또는 이름 목록)와 다음 페이지 cursor"""
+    if format_type == 'names_only':
+        page.fields = ['name']
+    response_data, next_cursor = fetch_page(query, TaskType.id, TASK_TYPE_LIST_COLUMNS, page)
+    if format_type == 'names_only':
+        response_data = [task_type['name'] for task_type in response_data]
+    return response_data, next_cursor
+
 @bp.route('/api/task-types', methods=['GET'])
 def get_task_types():
     """작업 유형 목록을 조회합니다."""
     try:
         logger.info("작업 유형 목록 조회 요청")
         
-        # 강제 초기화 쿼리 파라미터 확인
-        force_reset = request.args.get('reset', 'false').lower() == 'true'
+        # format 은 캐시 키가 되므로 알려진 값만 허용
+        format_type = request.args.get('format', 'full')
+        if format_type not in TASK_TYPE_FORMATS:
+            raise ValidationError(f"format 은 {', '.join(TASK_TYPE_FORMATS)} 중 하나여야 합니다.")
         
-        # 기존 작업 유형 테이블 초기화 옵션
-        if force_reset:
-            logger.warning("작업 유형 테이블 강제 초기화 요청")
-            TaskType.query.delete()
-            db.session.commit()
-            logger.info("작업 유형 테이블 초기화 완료")
+        # 초기화 요청은 기본 작업 유형 seed 적용으로 처리 (seed 가 바뀌지 않았으면 쓰기 없음)
+        if request.args.get('reset', 'false').lower() == 'true':
+            if seed_service.apply_task_types()['applied']:
+                _invalidate_task_type_catalog()
         
-        task_types = TaskType.query.all()
+        page = parse_page_request(request.args, TASK_TYPE_LIST_COLUMNS, TASK_TYPE_LIST_FIELDS)
+        cache_key = None
+        if not page.paginated and request.args.get('fields') is None and \
+                not any(request.args.get(name) for name in TASK_TYPE_FILTERS):
+            # 필터 없는 전체 목록은 직렬화된 응답을 캐시하고 ETag 로 재검증
+            cache_key = ('task_types', format_type)
         
-        # 작업 유형이 없으면 기본 작업 유형 생성
-        if not task_types:
+        # 작업 유형이 없으면 기본 작업 유형 생성 (캐시된 목록이 있으면 확인 생략)
+        if cache_key not in catalog_cache and TaskType.query.first() is None:
             logger.info("작업 유형 테이블 빈 상태, 기본 작업 유형 생성")
-            default_task_types = [
-                {"name": "VLAN 관리", "description": "VLAN 생성/삭제, 인터페이스 VLAN 할당, 트렁크 설정", "vendor": "all"},
-                {"name": "포트 설정", "description": "액세스/트렁크 모드 설정, 포트 속도/듀플렉스 조정, 인터페이스 활성화", "vendor": "all"},
-                {"name": "라우팅 설정", "description": "정적 라우팅, OSPF, EIGRP, BGP 설정 및 관리", "vendor": "all"},
-                {"name": "보안 설정", "description": "Port Security, SSH/Telnet 제한, AAA 인증, ACL 설정", "vendor": "all"},
-                {"name": "STP 및 LACP", "description": "STP(RSTP/PVST) 설정, LACP/포트 채널 구성", "vendor": "all"},
-                {"name": "QoS 및 트래픽 제어", "description": "QoS 정책 적용, 트래픽 제한, 서비스 정책 설정", "vendor": "all"},
-                {"name": "라우팅 상태 모니터링", "description": "라우팅 테이블, OSPF 이웃, BGP 요약 정보 확인", "vendor": "all"},
-                {"name": "네트워크 상태 점검", "description": "인터페이스 상태 확인, 트래픽 모니터링", "vendor": "all"},
-                {"name": "로그 수집", "description": "로깅 명령 실행 후 파일 저장", "vendor": "all"},
-                {"name": "구성 백업 및 복원", "description": "Running-config/Startup-config 백업 및 복원, TFTP 설정", "vendor": "all"},
-                {"name": "SNMP 및 모니터링", "description": "SNMP 설정, CDP/LLDP 정보 수집", "vendor": "all"},
-                {"name": "자동화 스크립트 확장", "description": "여러 장비에 설정 배포, 특정 조건 검증 후 자동 변경 적용", "vendor": "all"}
-            ]
-            
-            for task_type_data in default_task_types:
-                task_type = TaskType(
-                    name=task_type_data["name"],
-                    description=task_type_data["description"],
-                    vendor=task_type_data["vendor"]
-                )
-                db.session.add(task_type)
-            
-            db.session.commit()
-            logger.info("기본 작업 유형 생성 완료")
-            task_types = TaskType.query.all()
+            seed_service.apply_task_types(force=True)
+            _invalidate_task_type_catalog()
         
-        # 응답 데이터 형식 결정 (task_type 객체를 dict로 변환 또는 이름만 추출)
-        format_type = request.args.get('format', 'full')
-        if format_type == 'names_only':
-            response_data = [task_type.name for task_type in task_types]
-        else:
-            response_data = [task_type.to_dict() for task_type in task_types]
+        if cache_key is not None:
+            return catalog_cache.response(cache_key,
+                                          lambda: _list_task_types(TaskType.query, page, format_type)[0])
+        
+        query = TaskType.query
+        for name in TASK_TYPE_FILTERS:
+            if request.args.get(name):
+                query = query.filter(TASK_TYPE_LIST_COLUMNS[name] == request.args[name])
+        
+        response_data, next_cursor = _list_task_types(query, page, format_type)
             
         logger.info(f"작업 유형 목록 조회 완료: {len(response_data)}개 작업 유형 반환")
+        if page.paginated:
+            return jsonify(page_payload(response_data, next_cursor, page))
         return jsonify(response_data)
+    except ValidationError as e:
+        return error_response(str(e))
     except Exception as e:
         logger.error(f"작업 유형 목록 조회 실패: {str(e)}")
         return jsonify({
@@ -654,6 +679,7 @@ def add_task_type():
         
         db.session.add(task_type)
         db.session.commit()
+        _invalidate_task_type_catalog()
         
         logger.info(f"작업 유형 추가 성공: {task_type.name}")
         return jsonify({
@@ -675,6 +701,7 @@ def delete_task_type(task_type_id):
         
         db.session.delete(task_type)
         db.session.commit()
+        _invalidate_task_type_catalog()
         
         logger.info(f"작업 유형 삭제 성공: {task_type.name}")
         return jsonify({
@@ -686,9 +713,196 @@ def delete_task_type(task_type_id):
         db.session.rollback()
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+# 상세 작업 조회 시 이전 작업 유형 이름을 새 이름으로 매핑
+SUBTASK_TYPE_MAPPING = {
+    'VLAN 관리': 'VLAN 생성/삭제',
+    '포트 설정': '인터페이스 설정',
+    '인터페이스 구성': '인터페이스 설정',
+    '보안 설정': 'ACL 설정',
+    'STP 및 LACP': 'VLAN 인터페이스 설정',
+    'QoS 및 트래픽 제어': '라우팅 설정',
+    '라우팅 상태 모니터링': '라우팅 설정',
+    '네트워크 상태 점검': 'IP 주소 설정',
+    '로그 수집': 'SNMP 설정',
+    '구성 백업 및 복원': 'NTP 설정',
+    'SNMP 및 모니터링': 'SNMP 설정',
+    '자동화 스크립트 확장': 'NTP 설정'
+}
+
+def _build_subtasks(mapped_task_type):
+    """작업 유형(매핑 후 이름)의 상세 작업 목록을 만듭니다. 지원하지 않는 유형은 빈 목록입니다."""
+    subtasks = []
+    
+    if mapped_task_type == 'VLAN 생성/삭제' or mapped_task_type == 'VLAN 관리':
+        logger.info("VLAN 생성/삭제 작업에 대한 상세 작업 반환")
+        subtasks = [
+            {
+                'name': 'VLAN 생성',
+                'description': 'VLAN을 생성합니다',
+                'task_type': mapped_task_type,
+                'vendor': 'all',
+                'parameters': [
+                    {'name': 'vlan_id', 'type': 'text', 'label': 'VLAN ID', 'required': True, 'placeholder': '예: 10'},
+                    {'name': 'vlan_name', 'type': 'text', 'label': 'VLAN 이름', 'required': True, 'placeholder': '예: VLAN_10'}
+                ]
+            },
+            {
+                'name': 'VLAN 삭제',
+                'description': 'VLAN을 삭제합니다',
+                'task_type': mapped_task_type,
+                'vendor': 'all',
+                'parameters': [
+                    {'name': 'vlan_id', 'type': 'text', 'label': 'VLAN ID', 'required': True, 'placeholder': '예: 10'}
+                ]
+            },
+            {
+                'name': 'VLAN 이름 설정',
+                'description': 'VLAN 이름을 설정합니다',
+                'task_type': mapped_task_type,
+                'vendor': 'all',
+                'parameters': [
+                    {'name': 'vlan_id', 'type': 'text', 'label': 'VLAN ID', 'required': True, 'placeholder': '예: 10'},
+                    {'name': 'vlan_name', 'type': 'text', 'label': 'VLAN 이름', 'required': True, 'placeholder': '예: VLAN_10'}
+                ]
+            }
+        ]
+    elif mapped_task_type == '인터페이스 설정' or mapped_task_type == '포트 설정':
+        logger.info("인터페이스 설정 작업의 상세 작업 반환")
+        subtasks = [
+            {
+                'name': '포트 IP추가',
+                'description': '포트에 IP를 추가합니다',
+                'task_type': mapped_task_type,
+                'vendor': 'all',
+                'parameters': [
+                    {'name': 'interface_name', 'type': 'text', 'label': '인터페이스 이름', 'required': True, 'placeholder': '예: GigabitEthernet1/0/1'},
+                    {'name': 'ip_address', 'type': 'text', 'label': 'IP 주소', 'required': True, 'placeholder': '예: 192.168.1.1'},
+                    {'name': 'subnet_mask', 'type': 'text', 'label': '서브넷 마스크', 'required': True, 'placeholder': '예: 255.255.255.0'}
+                ]
+            },
+            {
+                'name': '포트 활성화',
+                'description': '포트를 활성화합니다',
+                'task_type': mapped_task_type,
+                'vendor': 'all',
+                'parameters': [
+                    {'name': 'interface_name', 'type': 'text', 'label': '인터페이스 이름', 'required': True, 'placeholder': '예: GigabitEthernet1/0/1'}
+                ]
+            },
+            {
+                'name': '포트 비활성화',
+                'description': '포트를 비활성화합니다',
+                'task_type': mapped_task_type,
+                'vendor': 'all',
+                'parameters': [
+                    {'name': 'interface_name', 'type': 'text', 'label': '인터페이스 이름', 'required': True, 'placeholder': '예: GigabitEthernet1/0/1'}
+                ]
+            },
+            {
+                'name': '포트 속도 설정',
+                'description': '포트 속도와 듀플렉스 모드를 설정합니다',
+                'task_type': mapped_task_type,
+                'vendor': 'all',
+                'parameters': [
+                    {'name': 'interface_name', 'type': 'text', 'label': '인터페이스 이름', 'required': True, 'placeholder': '예: GigabitEthernet1/0/1'},
+                    {'name': 'speed', 'type': 'select', 'label': '속도', 'required': True, 'options': ['auto', '10', '100', '1000']},
+                    {'name': 'duplex', 'type': 'select', 'label': '듀플렉스', 'required': True, 'options': ['auto', 'full', 'half']}
+                ]
+            }
+        ]
+    elif mapped_task_type == 'VLAN 인터페이스 설정':
+        logger.info("VLAN 인터페이스 설정 작업에 대한 상세 작업 반환")
+        subtasks = [
+            {'name': '액세스 모드 설정', 'description': '인터페이스를 액세스 모드로 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
+            {'name': '트렁크 모드 설정', 'description': '인터페이스를 트렁크 모드로 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
+            {'name': '액세스 VLAN 할당', 'description': '인터페이스에 액세스 VLAN을 할당합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
+            {'name': '허용 VLAN 설정', 'description': '트렁크 포트에 허용할 VLAN을 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'}
+        ]
+    elif mapped_task_type == 'IP 주소 설정':
+        logger.info("IP 주소 설정 작업에 대한 상세 작업 반환")
+        subtasks = [
+            {'name': 'IPv4 주소 설정', 'description': '인터페이스에 IPv4 주소를 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
+            {'name': '보조 IP 주소 설정', 'description': '인터페이스에 보조 IPv4 주소를 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
+            {'name': '인터페이스 IPv6 주소 설정', 'description': '인터페이스에 IPv6 주소를 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'}
+        ]
+    elif mapped_task_type == '라우팅 설정':
+        logger.info("라우팅 설정 작업에 대한 상세 작업 반환")
+        subtasks = [
+            {
+                'name': 'OSPF 설정',
+                'description': 'OSPF 라우팅 프로토콜을 설정합니다',
+                'task_type': mapped_task_type,
+                'vendor': 'all',
+                'parameters': [
+                    {'name': 'process_id', 'type': 'text', 'label': '프로세스 ID', 'required': True, 'placeholder': '1-65535'},
+                    {'name': 'network_address', 'type': 'text', 'label': '네트워크 주소', 'required': True, 'placeholder': '예: 192.168.1.0'},
+                    {'name': 'wildcard_mask', 'type': 'text', 'label': '와일드카드 마스크', 'required': True, 'placeholder': '예: 0.0.0.255'},
+                    {'name': 'area_id', 'type': 'text', 'label': '영역 ID', 'required': True, 'placeholder': '예: 0'}
+                ]
+            },
+            {
+                'name': '정적 라우팅 설정',
+                'description': '정적 라우팅을 설정합니다',
+                'task_type': mapped_task_type,
+                'vendor': 'all',
+                'parameters': [
+                    {'name': 'network_address', 'type': 'text', 'label': '대상 네트워크', 'required': True, 'placeholder': '예: 192.168.1.0'},
+                    {'name': 'subnet_mask', 'type': 'text', 'label': '서브넷 마스크', 'required': True, 'placeholder': '예: 255.255.255.0'},
+                    {'name': 'next_hop', 'type': 'text', 'label': '다음 홉 주소', 'required': True, 'placeholder': '예: 10.0.0.1'}
+                ]
+            }
+        ]
+    elif mapped_task_type == 'ACL 설정':
+        logger.info("ACL 설정 작업에 대한 상세 작업 반환")
+        subtasks = [
+            {'name': '표준 ACL 설정', 'description': '표준 ACL을 구성합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
+            {'name': '확장 ACL 설정', 'description': '확장 ACL을 구성합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
+            {'name': '인터페이스 ACL 적용', 'description': '인터페이스에 ACL을 적용합니다', 'task_type': mapped_task_type, 'vendor': 'all'}
+        ]
+    elif mapped_task_type == 'SNMP 설정':
+        logger.info("SNMP 설정 작업에 대한 상세 작업 반환")
+        subtasks = [
+            {'name': 'SNMP 커뮤니티 설정', 'description': 'SNMP 커뮤니티 문자열을 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
+            {'name': 'SNMP 서버 설정', 'description': 'SNMP 서버 정보를 구성합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
+            {'name': 'SNMP 버전 설정', 'description': 'SNMP 버전을 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'}
+        ]
+    elif mapped_task_type == 'NTP 설정':
+        logger.info("NTP 설정 작업에 대한 상세 작업 반환")
+        subtasks = [
+            {'name': 'NTP 서버 설정', 'description': 'NTP 서버를 구성합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
+            {'name': '시간대 설정', 'description': '장비의 시간대를 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'}
+        ]
+    elif mapped_task_type == 'VLAN':
+        logger.info("VLAN 작업에 대한 상세 작업 반환")
+        subtasks = [
+            {
+                'name': 'vlan_id',
+                'type': 'text',
+                'label': 'VLAN ID',
+                'required': True,
+                'placeholder': '예: 10-15,20'
+            },
+            {
+                'name': 'interface',
+                'type': 'text',
+                'label': '인터페이스',
+                'required': True,
+                'placeholder': '예: gi 0/1'
+            },
+            {
+                'name': 'mode',
+                'type': 'select',
+                'label': '모드',
+                'required': True,
+                'options': [{'value': 'access', 'label': 'Access'}, {'value': 'trunk', 'label': 'Trunk'}]
+            }
+        ]
+    
+    return subtasks
+
 @bp.route('/api/subtasks/<task_type>', methods=['GET'])
 def get_subtasks(task_type):
-    """특정 작업 유형에 대한 하위 작업 목록을 반환합니다."""
+    """특정 작업 유형에 대한 하위 작업 목록을 반환합니다 (ETag 카탈로그 캐시)."""
     try:
         logger.info(f"subtasks API 호출(원본): {task_type} (타입: {type(task_type)})")
         
@@ -697,324 +911,129 @@ def get_subtasks(task_type):
             logger.error("작업 유형이 비어 있습니다.")
             return jsonify({"error": "작업 유형이 지정되지 않았습니다."}), 400
         
-        # 이전 작업 유형 이름을 새 이름으로 매핑
-        task_type_mapping = {
-            'VLAN 관리': 'VLAN 생성/삭제',
-            '포트 설정': '인터페이스 설정',
-            '인터페이스 구성': '인터페이스 설정',
-            '보안 설정': 'ACL 설정',
-            'STP 및 LACP': 'VLAN 인터페이스 설정',
-            'QoS 및 트래픽 제어': '라우팅 설정',
-            '라우팅 상태 모니터링': '라우팅 설정',
-            '네트워크 상태 점검': 'IP 주소 설정',
-            '로그 수집': 'SNMP 설정',
-            '구성 백업 및 복원': 'NTP 설정',
-            'SNMP 및 모니터링': 'SNMP 설정',
-            '자동화 스크립트 확장': 'NTP 설정'
-        }
-
         # 작업 유형 이름 매핑 적용
-        mapped_task_type = task_type_mapping.get(task_type, task_type)
+        mapped_task_type = SUBTASK_TYPE_MAPPING.get(task_type, task_type)
         logger.info(f"매핑된 작업 유형: {mapped_task_type}")
         
-        # 기본 빈 배열로 초기화
-        subtasks = []
-        
-        logger.info(f"작업 유형 매칭 시작: {mapped_task_type}")
-        
-        if mapped_task_type == 'VLAN 생성/삭제' or mapped_task_type == 'VLAN 관리':
-            logger.info("VLAN 생성/삭제 작업에 대한 상세 작업 반환")
-            subtasks = [
-                {
-                    'name': 'VLAN 생성',
-                    'description': 'VLAN을 생성합니다',
-                    'task_type': mapped_task_type,
-                    'vendor': 'all',
-                    'parameters': [
-                        {'name': 'vlan_id', 'type': 'text', 'label': 'VLAN ID', 'required': True, 'placeholder': '예: 10'},
-                        {'name': 'vlan_name', 'type': 'text', 'label': 'VLAN 이름', 'required': True, 'placeholder': '예: VLAN_10'}
-                    ]
-                },
-                {
-                    'name': 'VLAN 삭제',
-                    'description': 'VLAN을 삭제합니다',
-                    'task_type': mapped_task_type,
-                    'vendor': 'all',
-                    'parameters': [
-                        {'name': 'vlan_id', 'type': 'text', 'label': 'VLAN ID', 'required': True, 'placeholder': '예: 10'}
-                    ]
-                },
-                {
-                    'name': 'VLAN 이름 설정',
-                    'description': 'VLAN 이름을 설정합니다',
-                    'task_type': mapped_task_type,
-                    'vendor': 'all',
-                    'parameters': [
-                        {'name': 'vlan_id', 'type': 'text', 'label': 'VLAN ID', 'required': True, 'placeholder': '예: 10'},
-                        {'name': 'vlan_name', 'type': 'text', 'label': 'VLAN 이름', 'required': True, 'placeholder': '예: VLAN_10'}
-                    ]
-                }
-            ]
-        elif mapped_task_type == '인터페이스 설정' or mapped_task_type == '포트 설정':
-            logger.info("인터페이스 설정 작업의 상세 작업 반환")
-            subtasks = [
-                {
-                    'name': '포트 IP추가',
-                    'description': '포트에 IP를 추가합니다',
-                    'task_type': mapped_task_type,
-                    'vendor': 'all',
-                    'parameters': [
-                        {'name': 'interface_name', 'type': 'text', 'label': '인터페이스 이름', 'required': True, 'placeholder': '예: GigabitEthernet1/0/1'},
-                        {'name': 'ip_address', 'type': 'text', 'label': 'IP 주소', 'required': True, 'placeholder': '예: 192.168.1.1'},
-                        {'name': 'subnet_mask', 'type': 'text', 'label': '서브넷 마스크', 'required': True, 'placeholder': '예: 255.255.255.0'}
-                    ]
-                },
-                {
-                    'name': '포트 활성화',
-                    'description': '포트를 활성화합니다',
-                    'task_type': mapped_task_type,
-                    'vendor': 'all',
-                    'parameters': [
-                        {'name': 'interface_name', 'type': 'text', 'label': '인터페이스 이름', 'required': True, 'placeholder': '예: GigabitEthernet1/0/1'}
-                    ]
-                },
-                {
-                    'name': '포트 비활성화',
-                    'description': '포트를 비활성화합니다',
-                    'task_type': mapped_task_type,
-                    'vendor': 'all',
-                    'parameters': [
-                        {'name': 'interface_name', 'type': 'text', 'label': '인터페이스 이름', 'required': True, 'placeholder': '예: GigabitEthernet1/0/1'}
-                    ]
-                },
-                {
-                    'name': '포트 속도 설정',
-                    'description': '포트 속도와 듀플렉스 모드를 설정합니다',
-                    'task_type': mapped_task_type,
-                    'vendor': 'all',
-                    'parameters': [
-                        {'name': 'interface_name', 'type': 'text', 'label': '인터페이스 이름', 'required': True, 'placeholder': '예: GigabitEthernet1/0/1'},
-                        {'name': 'speed', 'type': 'select', 'label': '속도', 'required': True, 'options': ['auto', '10', '100', '1000']},
-                        {'name': 'duplex', 'type': 'select', 'label': '듀플렉스', 'required': True, 'options': ['auto', 'full', 'half']}
-                    ]
-                }
-            ]
-        elif mapped_task_type == 'VLAN 인터페이스 설정':
-            logger.info("VLAN 인터페이스 설정 작업에 대한 상세 작업 반환")
-            subtasks = [
-                {'name': '액세스 모드 설정', 'description': '인터페이스를 액세스 모드로 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
-                {'name': '트렁크 모드 설정', 'description': '인터페이스를 트렁크 모드로 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
-                {'name': '액세스 VLAN 할당', 'description': '인터페이스에 액세스 VLAN을 할당합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
-                {'name': '허용 VLAN 설정', 'description': '트렁크 포트에 허용할 VLAN을 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'}
-            ]
-        elif mapped_task_type == 'IP 주소 설정':
-            logger.info("IP 주소 설정 작업에 대한 상세 작업 반환")
-            subtasks = [
-                {'name': 'IPv4 주소 설정', 'description': '인터페이스에 IPv4 주소를 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
-                {'name': '보조 IP 주소 설정', 'description': '인터페이스에 보조 IPv4 주소를 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
-                {'name': '인터페이스 IPv6 주소 설정', 'description': '인터페이스에 IPv6 주소를 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'}
+        return catalog_cache.response(('subtasks', mapped_task_type),
+                                      lambda: _build_subtasks(mapped_task_type))
+    except Exception as e:
+        logger.error(f"상세 작업 목록 조회 중 오류: {str(e)}")
+        import traceback
+        logger.error(f"상세 오류: {traceback.format_exc()}")
+        return jsonify({"error": str(e)}), 500
+
+# 작업 유형 > 기능 > 서브태스크 > 설정모드별 파라미터 정의
+PARAMETER_SCHEMAS = {
+    '시스템관리': {
+        'Hostname': {
+            'config': [
+                {'name': 'hostname', 'label': '호스트명', 'type': 'text', 'required': True}
             ]
-        elif mapped_task_type == '라우팅 설정':
-            logger.info("라우팅 설정 작업에 대한 상세 작업 반환")
-            subtasks = [
-                {
-                    'name': 'OSPF 설정',
-                    'description': 'OSPF 라우팅 프로토콜을 설정합니다',
-                    'task_type': mapped_task_type,
-                    'vendor': 'all',
-                    'parameters': [
-                        {'name': 'process_id', 'type': 'text', 'label': '프로세스 ID', 'required': True, 'placeholder': '1-65535'},
-                        {'name': 'network_address', 'type': 'text', 'label': '네트워크 주소', 'required': True, 'placeholder': '예: 192.168.1.0'},
-                        {'name': 'wildcard_mask', 'type': 'text', 'label': '와일드카드 마스크', 'required': True, 'placeholder': '예: 0.0.0.255'},
-                        {'name': 'area_id', 'type': 'text', 'label': '영역 ID', 'required': True, 'placeholder': '예: 0'}
-                    ]
-                },
-                {
-                    'name': '정적 라우팅 설정',
-                    'description': '정적 라우팅을 설정합니다',
-                    'task_type': mapped_task_type,
-                    'vendor': 'all',
-                    'parameters': [
-                        {'name': 'network_address', 'type': 'text', 'label': '대상 네트워크', 'required': True, 'placeholder': '예: 192.168.1.0'},
-                        {'name': 'subnet_mask', 'type': 'text', 'label': '서브넷 마스크', 'required': True, 'placeholder': '예: 255.255.255.0'},
-                        {'name': 'next_hop', 'type': 'text', 'label': '다음 홉 주소', 'required': True, 'placeholder': '예: 10.0.0.1'}
-                    ]
-                }
+        },
+        'User': {
+            'config': [
+                {'name': 'username', 'label': '사용자명', 'type': 'text', 'required': True},
+                {'name': 'privilege', 'label': '권한 레벨', 'type': 'number', 'required': True, 'min': 0, 'max': 15},
+                {'name': 'password', 'label': '비밀번호', 'type': 'password', 'required': True}
             ]
-        elif mapped_task_type == 'ACL 설정':
-            logger.info("ACL 설정 작업에 대한 상세 작업 반환")
-            subtasks = [
-                {'name': '표준 ACL 설정', 'description': '표준 ACL을 구성합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
-                {'name': '확장 ACL 설정', 'description': '확장 ACL을 구성합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
-                {'name': '인터페이스 ACL 적용', 'description': '인터페이스에 ACL을 적용합니다', 'task_type': mapped_task_type, 'vendor': 'all'}
+        },
+        'Enable Password': {
+            'config': [
+                {'name': 'password', 'label': 'Enable 비밀번호', 'type': 'password', 'required': True}
             ]
-        elif mapped_task_type == 'SNMP 설정':
-            logger.info("SNMP 설정 작업에 대한 상세 작업 반환")
-            subtasks = [
-                {'name': 'SNMP 커뮤니티 설정', 'description': 'SNMP 커뮤니티 문자열을 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
-                {'name': 'SNMP 서버 설정', 'description': 'SNMP 서버 정보를 구성합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
-                {'name': 'SNMP 버전 설정', 'description': 'SNMP 버전을 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'}
+        },
+        'IP Address': {
+            'config': [
+                {'name': 'interface', 'label': '인터페이스', 'type': 'text', 'required': True},
+                {'name': 'ip_address', 'label': 'IP 주소', 'type': 'text', 'required': True},
+                {'name': 'subnet_mask', 'label': '서브넷 마스크', 'type': 'text', 'required': True}
             ]
-        elif mapped_task_type == 'NTP 설정':
-            logger.info("NTP 설정 작업에 대한 상세 작업 반환")
-            subtasks = [
-                {'name': 'NTP 서버 설정', 'description': 'NTP 서버를 구성합니다', 'task_type': mapped_task_type, 'vendor': 'all'},
-                {'name': '시간대 설정', 'description': '장비의 시간대를 설정합니다', 'task_type': mapped_task_type, 'vendor': 'all'}
+        }
+    },
+    '네트워크관리': {
+        'SNMP': {
+            'config': [
+                {'name': 'community', 'label': '커뮤니티 문자열', 'type': 'text', 'required': True},
+                {'name': 'access', 'label': '접근 권한', 'type': 'select', 'required': True, 
+                 'options': [
+                     {'value': 'read', 'label': '읽기 전용'},
+                     {'value': 'write', 'label': '읽기/쓰기'}
+                 ]}
             ]
-        elif mapped_task_type == 'VLAN':
-            logger.info("VLAN 작업에 대한 상세 작업 반환")
-            subtasks = [
-                {
-                    'name': 'vlan_id',
-                    'type': 'text',
-                    'label': 'VLAN ID',
-                    'required': True,
-                    'placeholder': '예: 10-15,20'
-                },
-                {
-                    'name': 'interface',
-                    'type': 'text',
-                    'label': '인터페이스',
-                    'required': True,
-                    'placeholder': '예: gi 0/1'
-                },
-                {
-                    'name': 'mode',
-                    'type': 'select',
-                    'label': '모드',
-                    'required': True,
-                    'options': [{'value': 'access', 'label': 'Access'}, {'value': 'trunk', 'label': 'Trunk'}]
-                }
+        }
+    },
+    'LAYER2': {
+        'VLAN': {
+            'config': [
+                {'name': 'vlan_id', 'label': 'VLAN ID', 'type': 'number', 'required': True, 'min': 1, 'max': 4094},
+                {'name': 'vlan_name', 'label': 'VLAN 이름', 'type': 'text', 'required': True}
             ]
-        elif mapped_task_type == 'Spanning-tree':
-            if subtask == 'config':
-                # 필수 파라미터 검증
-                if not isinstance(parameters, dict):
-                    logger.error(f"파라미터가 올바른 형식이 아닙니다. 받은 형식: {type(parameters)}")
-                    return jsonify({'error': '파라미터가 올바른 형식이 아닙니다.'}), 400
+        }
+    }
+}
 
-                if config_mode == 'config(RSTP)':
-                    if 'instance_id' not in parameters or 'priority' not in parameters:
-                        missing_params = []
-                        if 'instance_id' not in parameters: missing_params.append('instance_id')
-                        if 'priority' not in parameters: missing_params.append('priority')
-                        logger.error(f"필수 파라미터 누락: {', '.join(missing_params)}")
-                        return jsonify({'error': f"다음 필수 파라미터가 누락되었습니다: {', '.join(missing_params)}"}), 400
-                    
-                    commands = [
-                        'configure terminal',
-                        'spanning-tree mode rstp',
-                        'spanning-tree enable',
-                        f'spanning-tree mst instance {parameters["instance_id"]} priority {parameters["priority"]}',
-                        'spanning-tree mode rapid-vst',
-                        'end'
-                    ]
-                elif config_mode == 'config(PVST+)':
-                    if 'vlan_id' not in parameters or 'priority' not in parameters:
-                        missing_params = []
-                        if 'vlan_id' not in parameters: missing_params.append('vlan_id')
-                        if 'priority' not in parameters: missing_params.append('priority')
-                        logger.error(f"필수 파라미터 누락: {', '.join(missing_params)}")
-                        return jsonify({'error': f"다음 필수 파라미터가 누락되었습니다: {', '.join(missing_params)}"}), 400
-                    
-                    commands = [
-                        'configure terminal',
-                        'spanning-tree mode rapid-vst',
-                        'spanning-tree enable',
-                        f'spanning-tree vlan {parameters["vlan_id"]} priority {parameters["priority"]}',
-                        'end'
-                    ]
-                logger.info(f"생성된 명령어: {commands}")
-            elif subtask == 'check':
-                commands = [
-                    'show spanning-tree',
-                    'show spanning-tree detail',
-                    'show spanning-tree bpdu statistics'
-                ]
-                logger.info(f"생성된 명령어: {commands}")
-        
-        if commands:
-            result = {'output': '\n'.join(commands)}
-            logger.info(f"반환할 결과: {result}")
-            return jsonify(result)
-        else:
-            logger.warning("생성된 명령어가 없습니다.")
-            return jsonify({'error': '지원되지 않는 작업입니다.'}), 400
-    except Exception as e:
-        logger.error(f"상세 작업 목록 조회 중 오류: {str(e)}")
-        import traceback
-        logger.error(f"상세 오류: {traceback.format_exc()}")
-        return jsonify({"error": str(e)}), 500
+def _find_parameters(task_type, feature, subtask, config_mode):
+    task_params = PARAMETER_SCHEMAS.get(task_type, {}).get(feature)
+    if task_params and subtask in task_params and config_mode in task_params[subtask]:
+        return task_params[subtask][config_mode]
+    logger.warning(f"파라미터를 찾을 수 없음: task_type={task_type}, feature={feature}, subtask={subtask}, config_mode={config_mode}")
+    return []
 
 @bp.route('/api/parameters/<task_type>/<feature>/<subtask>/<config_mode>', methods=['GET'])
 def get_parameters(task_type, feature, subtask, config_mode):
-    """작업 유형, 기능, 서브태스크, 설정모드에 따른 파라미터 목록을 반환합니다."""
+    """작업 유형, 기능, 서브태스크, 설정모드에 따른 파라미터 목록을 반환합니다 (ETag 카탈로그 캐시)."""
     try:
         logger.info(f"파라미터 요청: task_type={task_type}, feature={feature}, subtask={subtask}, config_mode={config_mode}")
-        
-        # 파라미터 정의
-        parameters = {
-            '시스템관리': {
-                'Hostname': {
-                    'config': [
-                        {'name': 'hostname', 'label': '호스트명', 'type': 'text', 'required': True}
-                    ]
-                },
-                'User': {
-                    'config': [
-                        {'name': 'username', 'label': '사용자명', 'type': 'text', 'required': True},
-                        {'name': 'privilege', 'label': '권한 레벨', 'type': 'number', 'required': True, 'min': 0, 'max': 15},
-                        {'name': 'password', 'label': '비밀번호', 'type': 'password', 'required': True}
-                    ]
-                },
-                'Enable Password': {
-                    'config': [
-                        {'name': 'password', 'label': 'Enable 비밀번호', 'type': 'password', 'required': True}
-                    ]
-                },
-                'IP Address': {
-                    'config': [
-                        {'name': 'interface', 'label': '인터페이스', 'type': 'text', 'required': True},
-                        {'name': 'ip_address', 'label': 'IP 주소', 'type': 'text', 'required': True},
-                        {'name': 'subnet_mask', 'label': '서브넷 마스크', 'type': 'text', 'required': True}
-                    ]
-                }
-            },
-            '네트워크관리': {
-                'SNMP': {
-                    'config': [
-                        {'name': 'community', 'label': '커뮤니티 문자열', 'type': 'text', 'required': True},
-                        {'name': 'access', 'label': '접근 권한', 'type': 'select', 'required': True, 
-                         'options': [
-                             {'value': 'read', 'label': '읽기 전용'},
-                             {'value': 'write', 'label': '읽기/쓰기'}
-                         ]}
-                    ]
-                }
-            },
-            'LAYER2': {
-                'VLAN': {
-                    'config': [
-                        {'name': 'vlan_id', 'label': 'VLAN ID', 'type': 'number', 'required': True, 'min': 1, 'max': 4094},
-                        {'name': 'vlan_name', 'label': 'VLAN 이름', 'type': 'text', 'required': True}
-                    ]
-                }
-            }
-        }
-        
-        # 파라미터 가져오기
-        if task_type in parameters and feature in parameters[task_type]:
-            task_params = parameters[task_type][feature]
-            if subtask in task_params and config_mode in task_params[subtask]:
-                return jsonify(task_params[subtask][config_mode])
-        
-        logger.warning(f"파라미터를 찾을 수 없음: task_type={task_type}, feature={feature}, subtask={subtask}, config_mode={config_mode}")
-        return jsonify([])
+        return catalog_cache.response(('parameters', task_type, feature, subtask, config_mode),
+                                      lambda: _find_parameters(task_type, feature, subtask, config_mode))
         
     except Exception as e:
         logger.error(f"파라미터 조회 중 오류 발생: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def _devices_signature():
+    """장비 파일이 바뀌었는지 판단하는 (수정 시각, 크기)"""
+    try:
+        stat = os.stat(device_service.file_handler.devices_file)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+def _build_bootstrap():
+    devices = normalize_device_records(device_service.get_all_devices())
+    task_types = [task_type.to_dict() for task_type in TaskType.query.order_by(TaskType.id)]
+    return {
+        # 비밀번호 필드는 제외
+        'devices': [{name: device[name] for name in DEVICE_LIST_FIELDS if name in device}
+                    for device in devices],
+        'task_types': task_types,
+        'subtasks': {
+            task_type['name']: _build_subtasks(SUBTASK_TYPE_MAPPING.get(task_type['name'], task_type['name']))
+            for task_type in task_types
+        },
+        'parameter_schemas': PARAMETER_SCHEMAS
+    }
+
+@bp.route('/api/bootstrap', methods=['GET'])
+def get_bootstrap():
+    """설정 화면 초기 데이터(장비, 작업 유형, 상세 작업 트리, 파라미터 정의)를 한 번에 반환합니다.
+
+    직렬화된 응답은 장비 파일이 바뀌거나 작업 유형이 수정될 때까지 재사용되며 ETag 로 재검증합니다.
+    """
+    try:
+        cache_key = ('bootstrap', _devices_signature())
+        if cache_key not in catalog_cache:
+            catalog_cache.invalidate('bootstrap')
+            if TaskType.query.first() is None:
+                logger.info("작업 유형 테이블 빈 상태, 기본 작업 유형 생성")
+                seed_service.apply_task_types(force=True)
+                catalog_cache.invalidate('task_types')
+        return catalog_cache.response(cache_key, _build_bootstrap)
+    except Exception as e:
+        logger.error(f"설정 화면 초기 데이터 조회 실패: {str(e)}")
+        return error_response(str(e), 500)
+
 @bp.route('/api/execute-task', methods=['POST'])
 def execute_task():
     logger.info("작업 실행 요청")
@@ -1024,7 +1043,7 @@ def execute_task():
             logger.error("요청 데이터가 없습니다.")
             return error_response("요청 데이터가 없습니다.")
 
-        logger.info(f"수신된 데이터: {json.dumps(data, indent=2, ensure_ascii=False)}")
+        logger.info("수신된 데이터: %s", LazyJSON(data))
         
         task_type = data.get('taskType')
         feature = data.get('feature')
@@ -1043,8 +1062,9 @@ def execute_task():
             logger.error(f"필수 필드 누락: {missing}")
             return error_response(f"필수 필드가 누락되었습니다: {', '.join(missing)}")
 
-        logger.info(f"작업 실행 상세: [유형: {task_type}] [기능: {feature}] [서브태스크: {subtask}] [모드: {config_mode}]")
-        logger.debug(f"파라미터: {json.dumps(parameters, indent=2, ensure_ascii=False)}")
+        log_event(logger, logging.INFO, 'task.execute', task_type=task_type, feature=feature,
+                  subtask=subtask, config_mode=config_mode)
+        logger.debug("파라미터: %s", LazyJSON(parameters))
 
         command_generator = CommandGenerator()
         commands = []
@@ -1098,7 +1118,7 @@ def execute_task():
                 logger.error(f"명령어를 생성할 수 없습니다: {task_type}/{feature}")
                 return error_response(f"해당 작업 유형({task_type}/{feature})에 대한 명령어를 생성할 수 없습니다.")
 
-            logger.info(f"생성된 명령어: {json.dumps(commands, indent=2, ensure_ascii=False)}")
+            logger.info("생성된 명령어: %s", LazyJSON(commands))
             return success_response({'commands': commands})
 
         except KeyError as e:
@@ -1112,22 +1132,57 @@ def execute_task():
         logger.error(f"작업 실행 실패: {str(e)}", exc_info=True)
         return error_response(str(e), 500)
 
+# 작업 목록 API 에서 fields= 로 선택할 수 있는 필드
+TASK_LIST_FIELDS = ('device_id', 'task_type', 'subtask', 'parameters', 'status', 'result', 'error',
+                    'created_at', 'updated_at')
+TASK_FILTERS = ('task_type', 'subtask', 'status')
+
 @bp.route('/api/tasks', methods=['GET'])
 def get_tasks():
-    """작업 목록 조회"""
+    """작업 목록 조회
+
+    task_type, subtask, status 로 필터링할 수 있으며, limit/cursor 를 지정하면
+    (device_id, created_at) 키셋 페이지 단위의 평탄한 목록을 반환합니다.
+    """
     device_id = request.args.get('device_id')
+    try:
+        page = parse_page_request(request.args, TASK_LIST_FIELDS, TASK_LIST_FIELDS)
+    except ValidationError as e:
+        return error_response(str(e))
+
     tasks = config_service.get_tasks(device_id)
+    filters = {name: request.args[name] for name in TASK_FILTERS if request.args.get(name)}
+
+    def select(device_tasks):
+        return [task for task in device_tasks
+                if all(getattr(task, name) == value for name, value in filters.items())]
+
+    def value(task, name):
+        return serialize_value(getattr(task, name))
+
+    if page.paginated:
+        groups = {str(device_id): tasks} if device_id else tasks
+        # 같은 장비에서 생성 시각이 같아도 순서가 정해지도록 목록 위치를 키에 포함
+        entries = [(str(group_id), task.created_at.isoformat(), position, task)
+                   for group_id, device_tasks in groups.items()
+                   for position, task in enumerate(device_tasks) if select([task])]
+        items, next_cursor = paginate_items(entries, lambda entry: entry[:3], page,
+                                            lambda entry, name: value(entry[3], name))
+        return jsonify({
+            'status': 'success',
+            'data': page_payload(items, next_cursor, page)
+        })
     
     if device_id:
         return jsonify({
             'status': 'success',
-            'data': [task.to_dict() for task in tasks]
+            'data': project_items(select(tasks), page.fields, value)
         })
     
     return jsonify({
         'status': 'success',
         'data': {
-            device_id: [task.to_dict() for task in device_tasks]
+            device_id: project_items(select(device_tasks), page.fields, value)
             for device_id, device_tasks in tasks.items()
         }
     })
@@ -1263,6 +1318,13 @@ def generate_script():
             'message': f"스크립트 생성 실패: {str(e)}"
         }), 500
 
+def _find_device(device_id):
+    """장비 ID 또는 이름으로 등록된 장비 정보를 찾습니다."""
+    for device in device_service.get_all_devices():
+        if str(device.get('id')) == str(device_id) or device.get('name') == device_id:
+            return device
+    return None
+
 @bp.route('/api/execute-script', methods=['POST'])
 def execute_script():
     """스크립트 실행"""
@@ -1277,11 +1339,34 @@ def execute_script():
                     'status': 'error',
                     'message': f'필수 필드가 누락되었습니다: {field}'
                 }), 400
+
+        # 벤더가 지정되면 장비 접속 전에 CLI 문법을 사전 검증
+        if data.get('vendor') and data.get('validate', True):
+            try:
+                validation = learning_service.validate_script(data['vendor'], data['script'])
+            except ValidationError as e:
+                logger.warning(f"스크립트 문법 검증 생략: {str(e)}")
+            else:
+                if not validation['valid']:
+                    return jsonify({
+                        'status': 'error',
+                        'message': '스크립트 문법 검증에 실패했습니다.',
+                        'validation': validation
+                    }), 400
+
+        # 실제 장비 실행이 켜져 있으면 등록된 장비 정보로 접속 (꺼져 있으면 시뮬레이션)
+        device = None
+        if current_app.config.get('DEVICE_EXECUTION_ENABLED'):
+            device = _find_device(data['device_id'])
+            if device is None:
+                return error_response(f"등록되지 않은 장비입니다: {data['device_id']}", 404)
         
         # 스크립트 실행
         result = config_service.execute_script(
             device_id=data['device_id'],
-            script=data['script']
+            script=data['script'],
+            device=device,
+            timeout=current_app.config.get('DEVICE_CONNECT_TIMEOUT')
         )
         
         return jsonify({
@@ -1301,44 +1386,51 @@ def execute_script():
             'message': f"스크립트 실행 실패: {str(e)}"
         }), 500
 
+@bp.route('/api/timings', methods=['GET'])
+def get_execution_timings():
+    """장비 실행 단계별 소요 시간 백분위수 요약 (벤더/장비별, 느린 명령어/실행)"""
+    try:
+        limit = request.args.get('limit', 10)
+        try:
+            limit = int(limit)
+        except ValueError:
+            return error_response('limit 은 정수여야 합니다.')
+        if limit < 0:
+            return error_response('limit 은 0 이상이어야 합니다.')
+        summary = config_service.timing_service.summary(
+            group_by=request.args.get('group_by', 'vendor'),
+            device_id=request.args.get('device_id'),
+            vendor=request.args.get('vendor'),
+            slowest=limit
+        )
+        return success_response(summary)
+    except ValueError as e:
+        return error_response(str(e))
+    except Exception as e:
+        logger.error(f"실행 소요 시간 요약 중 오류: {str(e)}")
+        return error_response(str(e), 500)
+
 @bp.route('/api/reset-task-types', methods=['GET'])
 def reset_task_types():
-    """작업 유형 테이블을 초기화합니다."""
+    """작업 유형 테이블을 기본 seed 로 되돌립니다.
+
+    전체 삭제 후 재생성하지 않고 seed 를 강제로 upsert 하므로 기존 작업 유형의 ID 와
+    seed 버전 기록이 유지됩니다.
+    """
     try:
         logger.warning("작업 유형 테이블 강제 초기화 요청")
         
-        # 기존 작업 유형 삭제
-        TaskType.query.delete()
-        db.session.commit()
-        
-        # 기본 작업 유형 생성
-        default_task_types = [
-            {"name": "VLAN 생성/삭제", "description": "VLAN 생성/삭제, 인터페이스 VLAN 할당, 트렁크 설정", "vendor": "all", "template_key": "vlan_config"},
-            {"name": "인터페이스 설정", "description": "액세스/트렁크 모드 설정, 포트 속도/듀플렉스 조정, 인터페이스 활성화", "vendor": "all", "template_key": "interface_config"},
-            {"name": "VLAN 인터페이스 설정", "description": "VLAN 인터페이스 구성, STP 설정, LACP/포트 채널 구성", "vendor": "all", "template_key": "vlan_interface"},
-            {"name": "IP 주소 설정", "description": "인터페이스 IP 주소 설정, 서브넷 마스크 구성", "vendor": "all", "template_key": "ip_config"},
-            {"name": "라우팅 설정", "description": "정적 라우팅, OSPF, EIGRP, BGP 설정 및 관리", "vendor": "all", "template_key": "routing_config"},
-            {"name": "ACL 설정", "description": "ACL 구성, 포트 보안, SSH/Telnet 제한", "vendor": "all", "template_key": "acl_config"},
-            {"name": "SNMP 설정", "description": "SNMP 커뮤니티 설정, 트랩 설정", "vendor": "all", "template_key": "snmp_config"},
-            {"name": "NTP 설정", "description": "NTP 서버 설정, 타임존 구성", "vendor": "all", "template_key": "ntp_config"}
-        ]
-        
-        for task_type_data in default_task_types:
-            task_type = TaskType(
-                name=task_type_data["name"],
-                description=task_type_data["description"],
-                vendor=task_type_data["vendor"],
-                template_key=task_type_data.get("template_key")
-            )
-            db.session.add(task_type)
-        
-        db.session.commit()
+        result = seed_service.apply_task_types(force=True)
+        _invalidate_task_type_catalog()
         logger.info("작업 유형 테이블 초기화 완료")
         
         return jsonify({
             'status': 'success',
             'message': '작업 유형 테이블이 초기화되었습니다.',
-            'count': len(default_task_types)
+            'count': TaskType.query.count(),
+            'inserted': result['inserted'],
+            'updated': result['updated'],
+            'deleted': result['deleted']
         })
     except Exception as e:
         logger.error(f"작업 유형 테이블 초기화 실패: {str(e)}")
@@ -2,11 +2,63 @@
 from app.models.device import Device
 from app.database import db
 from app.utils.logger import setup_logger
+from app.utils.lazy import LazyService
 from app.services.device_service import DeviceService
+from app.utils.pagination import parse_page_request, paginate_items, page_payload
+from app.utils.streaming import wants_ndjson, ndjson_response
+from app.exceptions import ValidationError
 
 logger = setup_logger(__name__)
 device_bp = Blueprint('device', __name__, url_prefix='/device')  # url_prefix 복원
-device_service = DeviceService()
+device_service = LazyService(DeviceService)
+
+# 장비 목록 API 에서 fields= 로 선택할 수 있는 필드 (비밀번호 필드는 제외)
+DEVICE_LIST_FIELDS = ('id', 'name', 'ip', 'ip_address', 'vendor', 'device_type', 'model', 'username',
+                      'status', 'created_at', 'updated_at')
+DEVICE_FILTERS = ('vendor', 'device_type', 'status')
+
+def normalize_device_records(devices):
+    """파일에 저장된 장비 정보의 필드명을 API 형식에 맞춥니다."""
+    for device in devices:
+        # 필드명 변환: ip -> ip_address
+        if 'ip' in device:
+            device['ip_address'] = device['ip']
+            # del device['ip']  # 원래 필드를 제거할지 여부 결정
+        
+        # vendor, device_type 등 다른 누락된 필드도 확인하여 기본값 설정
+        if 'vendor' not in device:
+            device['vendor'] = device.get('vendor_type', '')
+        
+        if 'device_type' not in device:
+            device['device_type'] = device.get('model', '')
+    return devices
+
+def _device_key(device):
+    return (int(device.get('id') or 0), device.get('name') or '')
+
+def _filtered_devices():
+    """파일 저장소의 장비 목록을 API 형식으로 맞추고 요청된 필터를 적용합니다."""
+    devices = normalize_device_records(device_service.get_all_devices())
+    for name in DEVICE_FILTERS:
+        value = request.args.get(name)
+        if value:
+            devices = [device for device in devices if device.get(name) == value]
+    return devices
+
+def _stream_devices(filename=None):
+    """JSON 목록과 같은 파일 저장소의 장비를 (id, name) 순서로 한 줄에 한 장비씩 스트리밍합니다.
+
+    필드는 DEVICE_LIST_FIELDS 안에서만 선택되므로 비밀번호는 내보내지 않습니다.
+    """
+    page = parse_page_request(request.args, DEVICE_LIST_FIELDS, DEVICE_LIST_FIELDS)
+    devices = sorted(_filtered_devices(), key=_device_key)
+    if page.cursor is not None:
+        try:
+            devices = [device for device in devices if _device_key(device) > page.cursor]
+        except TypeError:
+            raise ValidationError('잘못된 cursor 값입니다.')
+    rows = ({name: device.get(name) for name in page.fields} for device in devices)
+    return ndjson_response(rows, filename=filename)
 
 @device_bp.route('/')
 def index():
@@ -17,26 +69,29 @@ def index():
 # 프론트엔드 호환성을 위한 경로 설정
 @device_bp.route('/api/devices', methods=['GET'])
 def get_devices():
-    """장비 목록을 조회합니다."""
+    """장비 목록을 조회합니다.
+
+    vendor, device_type, status 로 필터링할 수 있으며, limit/cursor 를 지정하면
+    (id, name) 키셋 페이지 단위로, fields 를 지정하면 해당 필드만 반환합니다.
+    Accept: application/x-ndjson 이면 같은 장비 목록을 한 줄에 한 장비씩 스트리밍합니다.
+    """
     try:
         logger.info("장비 목록 조회 요청")
-        devices = device_service.get_all_devices()
+        if wants_ndjson():
+            return _stream_devices()
+        page = parse_page_request(request.args, DEVICE_LIST_FIELDS)
+        devices = _filtered_devices()
         
-        # 필드명 변환: ip -> ip_address
-        for device in devices:
-            if 'ip' in device:
-                device['ip_address'] = device['ip']
-                # del device['ip']  # 원래 필드를 제거할지 여부 결정
-            
-            # vendor, device_type 등 다른 누락된 필드도 확인하여 기본값 설정
-            if 'vendor' not in device:
-                device['vendor'] = device.get('vendor_type', '')
-            
-            if 'device_type' not in device:
-                device['device_type'] = device.get('model', '')
+        if not page.paginated and page.fields is None:
+            # 이미 dictionary 형태의 객체 리스트이므로 to_dict() 호출 없이 직접 반환
+            return jsonify(devices)
         
-        # 이미 dictionary 형태의 객체 리스트이므로 to_dict() 호출 없이 직접 반환
-        return jsonify(devices)
+        devices, next_cursor = paginate_items(devices, _device_key, page)
+        if not page.paginated:
+            return jsonify(devices)
+        return jsonify(page_payload(devices, next_cursor, page))
+    except ValidationError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
     except Exception as e:
         logger.error(f"장비 목록 조회 실패: {str(e)}")
         return jsonify({
@@ -44,6 +99,15 @@ def get_devices():
             'message': str(e)
         }), 500
 
+@device_bp.route('/api/devices/export', methods=['GET'])
+def export_devices():
+    """전체 장비 인벤토리를 NDJSON 파일로 스트리밍합니다 (필터, fields, cursor 지원)."""
+    try:
+        logger.info("장비 목록 내보내기 요청")
+        return _stream_devices(filename='devices.ndjson')
+    except ValidationError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
 # 프론트엔드 호환성을 위한 경로 설정
 @device_bp.route('/api/devices', methods=['POST'])
 def add_device():
@@ -1,26 +1,76 @@
-from flask import Blueprint, jsonify, request, current_app
+from flask import Blueprint, jsonify, request, current_app, Response, stream_with_context
 from ..services.learning_service import LearningService
-from app.models.cli_command import CLICommand
-from app.data.command_templates import get_template, get_all_templates
+from ..services.command_index import field_value
+from ..services.learning_runner import LearningRunner
+from ..services.running_config_parser import is_result_path
+from .device_routes import device_service
+from app.models.cli_command import CLICommand, CLICommandAlias, CommandParameter
 from app import db
+import json
+import os
+import click
+import time
 import logging
-from app.utils.logger import setup_logger
+from app.utils.logger import setup_logger, LazyJSON
+from app.utils.lazy import LazyService
+from app.utils.pagination import parse_page_request, page_payload
+from app.utils.streaming import wants_ndjson, ndjson_response
 from ..models.device import Device
 from ..models.task_type import TaskType
 from ..exceptions import CLILearningError, ValidationError
 
 learning_bp = Blueprint('learning', __name__)
-learning_service = LearningService()
+learning_service = LazyService(LearningService)  # 첫 요청 시 저장된 명령어 로드
+learning_runner = LearningRunner(learning_service)
 logger = setup_logger(__name__)
 
+SUPPORTED_LEARNING_VENDORS = ['cisco', 'juniper', 'arista']
+RUN_EVENTS_INTERVAL = 1.0  # SSE 진행 상황 확인 주기 (초)
+
+# 명령어 템플릿 카탈로그(app.data)는 사용할 때 import 합니다 (서비스/모델 모듈은 카탈로그 없이 import 가능)
+def get_template(vendor, task_type):
+    from app.data.command_templates import get_template as lookup
+    return lookup(vendor, task_type)
+
+def get_all_templates(vendor=None):
+    from app.data.command_templates import get_all_templates as lookup
+    return lookup(vendor)
+
+def _command_filters():
+    return {
+        'vendor': request.args.get('vendor'),
+        'parameter': request.args.get('parameter'),
+        'task_type': request.args.get('task_type'),
+        'subtask': request.args.get('subtask'),
+        'device_type': request.args.get('device_type')
+    }
+
+def _stream_commands(page, filename=None):
+    after = page.cursor[0] if page.cursor else None
+    rows = learning_service.iter_learned_commands(page.fields, after=after, **_command_filters())
+    return ndjson_response(rows, filename=filename)
+
 @learning_bp.route('/api/learning/commands', methods=['GET'])
 def get_commands():
-    """학습된 CLI 명령어 목록을 반환합니다."""
+    """학습된 CLI 명령어 목록을 반환합니다.
+
+    limit/cursor 를 지정하면 id 키셋 페이지 단위로, fields 를 지정하면 해당 필드만 반환합니다.
+    둘 다 없으면 기존과 같이 전체 배열을 반환합니다.
+    Accept: application/x-ndjson 이면 전체 결과를 한 줄에 한 명령어씩 스트리밍합니다.
+    """
     try:
-        vendor = request.args.get('vendor')
-        commands = learning_service.get_learned_commands(vendor)
-        return jsonify(commands)
-        
+        filters = _command_filters()
+        page = parse_page_request(request.args, learning_service.COMMAND_LIST_COLUMNS,
+                                  learning_service.LEARNED_COMMAND_FIELDS)
+        if wants_ndjson():
+            return _stream_commands(page)
+        commands, next_cursor = learning_service.get_learned_commands_page(page, **filters)
+        if not page.paginated:
+            return jsonify(commands)
+        return jsonify(page_payload(commands, next_cursor, page))
+
+    except ValidationError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
     except Exception as e:
         logger.error(f"명령어 조회 중 오류 발생: {str(e)}", exc_info=True)
         return jsonify({
@@ -28,6 +78,96 @@ def get_commands():
             'message': '명령어 목록을 불러오는데 실패했습니다.'
         }), 500
 
+@learning_bp.route('/api/learning/commands/export', methods=['GET'])
+def export_commands():
+    """학습된 CLI 명령어 전체를 NDJSON 파일로 스트리밍합니다 (필터, fields, cursor 지원)."""
+    try:
+        page = parse_page_request(request.args, learning_service.COMMAND_LIST_COLUMNS,
+                                  learning_service.COMMAND_LIST_COLUMNS)
+        return _stream_commands(page, filename='cli_commands.ndjson')
+    except ValidationError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+@learning_bp.route('/api/learning/parameters', methods=['GET'])
+def get_command_parameters():
+    """학습된 명령어의 파라미터 이름과 사용 명령어 수를 조회합니다."""
+    try:
+        return jsonify(learning_service.get_parameter_usage(
+            vendor=request.args.get('vendor'),
+            task_type=request.args.get('task_type'),
+            subtask=request.args.get('subtask')
+        ))
+    except Exception as e:
+        logger.error(f"파라미터 목록 조회 중 오류 발생: {str(e)}", exc_info=True)
+        return jsonify({
+            'status': 'error',
+            'message': '파라미터 목록을 불러오는데 실패했습니다.'
+        }), 500
+
+@learning_bp.route('/api/learning/search', methods=['GET'])
+def search_commands():
+    """학습된 CLI 명령어를 순위화하여 검색합니다."""
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({'error': '검색어(q)가 필요합니다.'}), 400
+
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 200)
+        result = learning_service.search_commands_ranked(
+            query,
+            vendor=request.args.get('vendor'),
+            device_type=request.args.get('device_type'),
+            page=page,
+            per_page=per_page
+        )
+
+        return jsonify({
+            'query': query,
+            'total': result['total'],
+            'page': page,
+            'per_page': per_page,
+            'results': [{
+                'vendor': field_value(cmd, 'vendor'),
+                'device_type': field_value(cmd, 'device_type'),
+                'task_type': field_value(cmd, 'task_type'),
+                'subtask': field_value(cmd, 'subtask'),
+                'command': field_value(cmd, 'command'),
+                'description': field_value(cmd, 'description'),
+                'score': round(score, 4)
+            } for cmd, score in result['items']]
+        })
+
+    except Exception as e:
+        logger.error(f"명령어 검색 중 오류 발생: {str(e)}", exc_info=True)
+        return jsonify({
+            'status': 'error',
+            'message': '명령어 검색에 실패했습니다.'
+        }), 500
+
+@learning_bp.route('/api/learning/complete', methods=['GET'])
+def complete_command():
+    """입력 중인 CLI 명령어의 자동완성 후보를 반환합니다."""
+    try:
+        vendor = request.args.get('vendor')
+        if not vendor:
+            return jsonify({'error': '벤더(vendor)가 필요합니다.'}), 400
+
+        text = request.args.get('q', '')
+        limit = max(min(request.args.get('limit', 10, type=int), 50), 1)
+        return jsonify({
+            'vendor': vendor,
+            'query': text,
+            'completions': learning_service.complete_command(vendor, text, limit)
+        })
+
+    except Exception as e:
+        logger.error(f"자동완성 조회 중 오류 발생: {str(e)}", exc_info=True)
+        return jsonify({
+            'status': 'error',
+            'message': '자동완성 후보를 불러오는데 실패했습니다.'
+        }), 500
+
 @learning_bp.route('/api/learning/commands', methods=['POST'])
 def add_command():
     """새로운 CLI 명령어를 저장합니다."""
@@ -47,12 +187,12 @@ def add_command():
             return jsonify({'error': '지원되지 않는 벤더 또는 작업 유형입니다.'}), 400
             
         # 기존 명령어 확인
-        existing = CLICommand.get_by_task(
-            data['vendor'],
-            data['device_type'],
-            data['task_type'],
-            data['subtask']
-        )
+        existing = CLICommand.query.filter_by(
+            vendor=data['vendor'],
+            device_type=data['device_type'],
+            task_type=data['task_type'],
+            subtask=data['subtask']
+        ).first()
         
         if existing:
             return jsonify({
@@ -60,6 +200,15 @@ def add_command():
                 'message': '이미 존재하는 명령어입니다'
             }), 409
 
+        # 약어/인터페이스 축약 표기만 다른 동일 명령어 확인
+        equivalent = learning_service.find_equivalent_command(data['vendor'], data['command'])
+        if equivalent is not None:
+            return jsonify({
+                'status': 'error',
+                'message': '이미 존재하는 명령어입니다',
+                'existing_command': equivalent
+            }), 409
+
         # 새 명령어 생성
         command = CLICommand(
             vendor=data['vendor'],
@@ -73,6 +222,7 @@ def add_command():
         
         db.session.add(command)
         db.session.commit()
+        learning_service.register_command(command)
         
         return jsonify({
             'status': 'success',
@@ -83,6 +233,76 @@ def add_command():
         logger.error(f"명령어 추가 실패: {str(e)}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+def _iter_ndjson(stream):
+    """NDJSON 요청 본문을 한 줄씩 읽어 레코드를 반환합니다. 파싱 실패 줄은 None 으로 반환합니다."""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+@learning_bp.route('/api/learning/commands/bulk', methods=['POST'])
+def bulk_import_commands():
+    """CLI 명령어를 대량으로 등록합니다 (JSON 배열 또는 NDJSON)."""
+    try:
+        chunk_size = max(min(request.args.get('chunk_size', 1000, type=int), 10000), 1)
+        if request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+            records = _iter_ndjson(request.stream)
+        else:
+            records = request.get_json(silent=True)
+            if not isinstance(records, list):
+                return jsonify({'error': 'JSON 배열 또는 NDJSON 형식의 본문이 필요합니다.'}), 400
+
+        result = learning_service.bulk_import_commands(records, chunk_size=chunk_size)
+        return jsonify({
+            'status': 'success',
+            'data': result
+        })
+
+    except Exception as e:
+        logger.error(f"명령어 대량 등록 실패: {str(e)}", exc_info=True)
+        return jsonify({
+            'status': 'error',
+            'message': f'명령어 대량 등록에 실패했습니다: {str(e)}'
+        }), 500
+
+@learning_bp.route('/api/learning/commands/dedup', methods=['POST'])
+def deduplicate_commands():
+    """유사 명령어를 대표 명령어와 별칭으로 병합합니다 (기본은 dry_run 으로 군집만 반환, dry_run=false 일 때 병합)."""
+    try:
+        data = request.get_json(silent=True) or {}
+        threshold = float(data.get('threshold', 0.8))
+        if not 0 < threshold <= 1:
+            return jsonify({'error': 'threshold 는 0 초과 1 이하이어야 합니다.'}), 400
+
+        result = learning_service.deduplicate_commands(
+            vendor=data.get('vendor'),
+            threshold=threshold,
+            dry_run=data.get('dry_run', True) is not False
+        )
+        return jsonify({
+            'status': 'success',
+            'data': result
+        })
+
+    except Exception as e:
+        logger.error(f"유사 명령어 병합 실패: {str(e)}", exc_info=True)
+        return jsonify({
+            'status': 'error',
+            'message': f'유사 명령어 병합에 실패했습니다: {str(e)}'
+        }), 500
+
+@learning_bp.route('/api/learning/commands/<int:command_id>/aliases', methods=['GET'])
+def get_command_aliases(command_id):
+    """병합된 명령어의 별칭 목록을 조회합니다."""
+    command = db.session.get(CLICommand, command_id)
+    if command is None:
+        return jsonify({'status': 'error', 'message': '명령어를 찾을 수 없습니다.'}), 404
+    return jsonify([alias.to_dict() for alias in command.aliases])
+
 @learning_bp.route('/api/learning/commands/<int:command_id>', methods=['PUT'])
 def update_command(command_id):
     """기존 CLI 명령어를 수정합니다."""
@@ -102,6 +322,7 @@ def update_command(command_id):
             return jsonify({'error': '지원되지 않는 벤더 또는 작업 유형입니다.'}), 400
             
         # 명령어 업데이트
+        learning_service.unregister_command(command)
         command.vendor = data['vendor']
         command.device_type = data['device_type']
         command.task_type = data['task_type']
@@ -111,6 +332,7 @@ def update_command(command_id):
         command.description = data.get('description')
         
         db.session.commit()
+        learning_service.register_command(command)
         
         return jsonify({
             'status': 'success',
@@ -131,6 +353,7 @@ def delete_command(command_id):
         command = CLICommand.query.get_or_404(command_id)
         db.session.delete(command)
         db.session.commit()
+        learning_service.unregister_command(command)
         
         return jsonify({
             'status': 'success',
@@ -181,15 +404,85 @@ def generate_script():
                 script.append(cmd.format(**data['parameters']))
             except KeyError as e:
                 return jsonify({'error': f'필수 파라미터 누락: {str(e)}'}), 400
-                
-        return jsonify({
+
+        response = {
             'script': script,
             'template': template
-        })
+        }
+        try:
+            response['validation'] = learning_service.validate_script(data['vendor'], script)
+        except ValidationError as e:
+            logger.warning(f"스크립트 문법 검증 생략: {str(e)}")
+        return jsonify(response)
     except Exception as e:
         logger.error(f"스크립트 생성 중 오류 발생: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@learning_bp.route('/api/learning/canonicalize', methods=['POST'])
+def canonicalize_commands():
+    """약어와 인터페이스 축약 표기를 전체 형태로 정규화합니다.
+
+    'command' (문자열) 또는 'commands' (문자열 배열) 를 받습니다.
+    """
+    data = request.get_json(silent=True) or {}
+    vendor = data.get('vendor')
+    if not vendor:
+        return jsonify({'error': '필수 필드 누락: vendor'}), 400
+
+    if isinstance(data.get('commands'), list):
+        return jsonify({
+            'status': 'success',
+            'data': [learning_service.canonicalize_command(vendor, cmd) for cmd in data['commands']]
+        })
+    if not isinstance(data.get('command'), str):
+        return jsonify({'error': '필수 필드 누락: command'}), 400
+    return jsonify({
+        'status': 'success',
+        'data': learning_service.canonicalize_command(vendor, data['command'])
+    })
+
+@learning_bp.route('/api/learning/validate-script', methods=['POST'])
+def validate_script():
+    """스크립트를 벤더 CLI 문법으로 사전 검증합니다.
+
+    단일 스크립트는 'script' (문자열 또는 줄 배열), 여러 장비의 스크립트는
+    'scripts' ({장비 식별자: 스크립트}) 로 전달합니다.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        vendor = data.get('vendor')
+        if not vendor:
+            return jsonify({'error': '필수 필드 누락: vendor'}), 400
+
+        if 'scripts' in data:
+            scripts = data['scripts']
+            if not isinstance(scripts, dict):
+                return jsonify({'error': 'scripts 는 {장비: 스크립트} 형식이어야 합니다.'}), 400
+            results = learning_service.validate_scripts(vendor, scripts)
+            return jsonify({
+                'status': 'success',
+                'valid': all(result['valid'] for result in results.values()),
+                'data': results
+            })
+
+        if 'script' not in data:
+            return jsonify({'error': '필수 필드 누락: script'}), 400
+        result = learning_service.validate_script(vendor, data['script'])
+        return jsonify({
+            'status': 'success',
+            'valid': result['valid'],
+            'data': result
+        })
+
+    except ValidationError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except Exception as e:
+        logger.error(f"스크립트 검증 실패: {str(e)}", exc_info=True)
+        return jsonify({
+            'status': 'error',
+            'message': f'스크립트 검증에 실패했습니다: {str(e)}'
+        }), 500
+
 @learning_bp.route('/api/learning/status', methods=['GET'])
 def get_learning_status():
     """학습 상태를 반환합니다."""
@@ -206,30 +499,40 @@ def get_learning_status():
 
 @learning_bp.route('/api/learning/start', methods=['POST'])
 def start_learning():
-    """CLI 명령어 학습을 시작합니다."""
+    """CLI 명령어 학습을 백그라운드로 시작합니다.
+
+    즉시 202 와 실행 ID를 반환하며, 진행 상황은 /api/learning/runs/<run_id> (폴링)
+    또는 /api/learning/runs/<run_id>/events (SSE) 로 조회합니다.
+    """
     try:
-        data = request.get_json()
-        logger.info(f"학습 요청 받음: data={data}")
-        
-        # 모든 벤더에 대한 자동 학습 진행
-        supported_vendors = ['cisco', 'juniper', 'arista']
-        results = {}
-        
-        for vendor in supported_vendors:
-            try:
-                logger.info(f"{vendor} 벤더에 대한 자동 학습 시작")
-                result = learning_service.start_learning(vendor)
-                results[vendor] = result
-            except Exception as e:
-                logger.error(f"{vendor} 벤더 학습 실패: {str(e)}")
-                results[vendor] = {'status': 'error', 'message': str(e)}
-        
-        return jsonify({
-            'status': 'success',
-            'message': '모든 벤더의 명령어 학습이 완료되었습니다.',
-            'data': results
+        data = request.get_json(silent=True) or {}
+        logger.info("학습 요청 받음: data=%s", LazyJSON(data))
+
+        # 벤더를 지정하지 않으면 모든 벤더에 대한 자동 학습 진행
+        vendors = data.get('vendors') or SUPPORTED_LEARNING_VENDORS
+        unsupported = [v for v in vendors if v not in SUPPORTED_LEARNING_VENDORS]
+        if unsupported:
+            return jsonify({'status': 'error', 'message': f'지원하지 않는 벤더입니다: {", ".join(unsupported)}'}), 400
+
+        run, started = learning_runner.start(current_app._get_current_object(), vendors)
+        if not started:
+            return jsonify({
+                'status': 'error',
+                'message': '이미 진행 중인 학습이 있습니다.',
+                'run_id': run.id,
+                'data': run.to_dict()
+            }), 409
+
+        response = jsonify({
+            'status': 'accepted',
+            'message': '명령어 학습을 시작했습니다.',
+            'run_id': run.id,
+            'data': run.to_dict()
         })
-        
+        response.status_code = 202
+        response.headers['Location'] = f'/api/learning/runs/{run.id}'
+        return response
+
     except Exception as e:
         logger.error(f"예상치 못한 오류: {str(e)}", exc_info=True)
         return jsonify({
@@ -237,6 +540,180 @@ def start_learning():
             'message': f'서버 오류가 발생했습니다: {str(e)}'
         }), 500
 
+@learning_bp.route('/api/learning/runs', methods=['GET'])
+def list_learning_runs():
+    """최근 학습 실행 목록을 조회합니다."""
+    limit = max(min(request.args.get('limit', 20, type=int), 100), 1)
+    return jsonify([run.to_dict() for run in learning_runner.list_runs(limit)])
+
+@learning_bp.route('/api/learning/runs/<run_id>', methods=['GET'])
+def get_learning_run(run_id):
+    """학습 실행의 진행 상황을 조회합니다."""
+    run = learning_runner.get_run(run_id)
+    if run is None:
+        return jsonify({'status': 'error', 'message': '학습 실행을 찾을 수 없습니다.'}), 404
+    return jsonify(run.to_dict())
+
+@learning_bp.route('/api/learning/runs/<run_id>/events', methods=['GET'])
+def stream_learning_run(run_id):
+    """학습 실행의 진행 상황을 Server-Sent Events 로 전송합니다."""
+    if learning_runner.get_run(run_id) is None:
+        return jsonify({'status': 'error', 'message': '학습 실행을 찾을 수 없습니다.'}), 404
+
+    def generate():
+        last_payload = None
+        idle = 0
+        while True:
+            db.session.expire_all()
+            run = learning_runner.get_run(run_id)
+            payload = json.dumps(run.to_dict(), ensure_ascii=False)
+            if payload != last_payload:
+                last_payload = payload
+                idle = 0
+                yield f'event: progress\ndata: {payload}\n\n'
+            else:
+                idle += 1
+                if idle % 15 == 0:
+                    yield ': keep-alive\n\n'
+            if run.is_finished:
+                yield f'event: done\ndata: {payload}\n\n'
+                return
+            time.sleep(RUN_EVENTS_INTERVAL)
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@learning_bp.route('/api/learning/runs/<run_id>/cancel', methods=['POST'])
+def cancel_learning_run(run_id):
+    """진행 중인 학습 실행의 취소를 요청합니다."""
+    run = learning_runner.cancel(run_id)
+    if run is None:
+        return jsonify({'status': 'error', 'message': '학습 실행을 찾을 수 없습니다.'}), 404
+    if run.is_finished and not run.cancel_requested:
+        return jsonify({'status': 'error', 'message': '이미 종료된 학습 실행입니다.', 'data': run.to_dict()}), 409
+    return jsonify({'status': 'success', 'message': '학습 취소를 요청했습니다.', 'data': run.to_dict()})
+
+def _positive_int(data, field, default=None, maximum=None):
+    """요청 값을 1 이상의 정수로 변환합니다 (maximum 이 있으면 그 값으로 제한)."""
+    value = data.get(field)
+    if value is None:
+        return default
+    try:
+        if isinstance(value, bool):
+            raise TypeError(field)
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f'{field} 는 1 이상의 정수여야 합니다.')
+    if value < 1:
+        raise ValidationError(f'{field} 는 1 이상의 정수여야 합니다.')
+    return min(value, maximum) if maximum else value
+
+def _worker_count(data):
+    """요청의 프로세스 풀 크기 (1 ~ CPU 수, 없으면 None)"""
+    return _positive_int(data, 'workers', maximum=os.cpu_count() or 1)
+
+def _vendor_device_ids(vendor):
+    """벤더 장비의 실행 결과 디렉토리 이름 후보 (장비 ID 와 이름)"""
+    device_ids = set()
+    for device in device_service.get_all_devices():
+        if (device.get('vendor') or '').lower() == vendor.lower():
+            device_ids.update(str(value) for value in (device.get('id'), device.get('name')) if value is not None)
+    return device_ids
+
+@learning_bp.route('/api/learning/running-configs', methods=['POST'])
+def learn_running_configs():
+    """저장된 running-config 출력에서 명령어를 학습합니다."""
+    try:
+        data = request.get_json(silent=True) or {}
+        vendor = data.get('vendor')
+        if not vendor:
+            return jsonify({'error': '필수 필드 누락: vendor'}), 400
+
+        paths = data.get('paths')
+        if paths is not None and not isinstance(paths, list):
+            return jsonify({'error': 'paths 는 파일 경로 배열이어야 합니다.'}), 400
+        # 요청으로 받은 경로는 장비 실행 결과 디렉토리 안의 파일만 허용
+        invalid = [path for path in paths or [] if not isinstance(path, str) or not is_result_path(path)]
+        if invalid:
+            return jsonify({'error': '실행 결과 디렉토리(config/tasks/<장비 ID>/results) 안의 파일만 '
+                                     f'학습할 수 있습니다: {invalid[0]}'}), 400
+
+        result = learning_service.learn_from_running_configs(
+            vendor,
+            paths=paths,
+            device_type=data.get('device_type', '스위치'),
+            min_frequency=_positive_int(data, 'min_frequency', default=1),
+            workers=_worker_count(data),
+            # 경로를 지정하지 않으면 요청한 벤더 장비의 실행 결과만 수집
+            device_ids=None if paths else _vendor_device_ids(vendor)
+        )
+        return jsonify({
+            'status': 'success',
+            'data': result
+        })
+
+    except ValidationError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except Exception as e:
+        logger.error(f"running-config 학습 실패: {str(e)}", exc_info=True)
+        return jsonify({
+            'status': 'error',
+            'message': f'running-config 학습에 실패했습니다: {str(e)}'
+        }), 500
+
+def _resolve_docs_root(root):
+    """요청의 문서 디렉토리를 OFFLINE_DOCS_DIR 기준으로 해석합니다 (기준 디렉토리 밖이면 None)."""
+    base = os.path.realpath(current_app.config.get('OFFLINE_DOCS_DIR', 'config/docs'))
+    path = os.path.realpath(os.path.join(base, root))
+    try:
+        inside = os.path.commonpath([base, path]) == base
+    except ValueError:  # 다른 드라이브의 경로 (Windows)
+        inside = False
+    return path if inside else None
+
+@learning_bp.route('/api/learning/ingest-docs', methods=['POST'])
+def ingest_offline_docs():
+    """로컬에 미러링된 벤더 문서 디렉토리에서 명령어를 학습합니다."""
+    try:
+        data = request.get_json(silent=True) or {}
+        for field in ('vendor', 'root'):
+            if not data.get(field):
+                return jsonify({'error': f'필수 필드 누락: {field}'}), 400
+        root = _resolve_docs_root(data['root']) if isinstance(data['root'], str) else None
+        if root is None:
+            return jsonify({'error': '문서 디렉토리는 OFFLINE_DOCS_DIR 안에 있어야 합니다: '
+                                     f"{data['root']}"}), 400
+
+        result = learning_service.ingest_offline_docs(
+            data['vendor'],
+            root,
+            device_type=data.get('device_type', '스위치'),
+            workers=_worker_count(data)
+        )
+        return jsonify({
+            'status': 'success',
+            'data': result
+        })
+
+    except ValidationError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except Exception as e:
+        logger.error(f"오프라인 문서 학습 실패: {str(e)}", exc_info=True)
+        return jsonify({
+            'status': 'error',
+            'message': f'오프라인 문서 학습에 실패했습니다: {str(e)}'
+        }), 500
+
+@learning_bp.cli.command('ingest-docs')
+@click.argument('vendor')
+@click.argument('root')
+@click.option('--device-type', default='스위치', help='학습된 명령어에 기록할 장비 유형')
+@click.option('--workers', type=int, default=None, help='프로세스 풀 크기')
+def ingest_docs_command(vendor, root, device_type, workers):
+    """오프라인 문서 디렉토리에서 명령어를 학습합니다 (flask learning ingest-docs)."""
+    result = learning_service.ingest_offline_docs(vendor, root, device_type=device_type, workers=workers)
+    click.echo(json.dumps(result, ensure_ascii=False, indent=2))
+
 @learning_bp.route('/api/learning/task-types', methods=['GET'])
 def get_task_types():
     """작업 유형 목록을 반환합니다."""
@@ -276,37 +753,39 @@ def debug_commands():
     """디버깅용: 직접 명령어를 DB에 추가하고 조회합니다."""
     try:
         # 모든 기존 명령어 삭제
+        CommandParameter.query.delete()
+        CLICommandAlias.query.delete()
         CLICommand.query.delete()
         db.session.commit()
         
         # 새 명령어 추가
         vendors = ['cisco', 'juniper', 'arista']
+        records = []
         for vendor in vendors:
             # 샘플 명령어 생성
-            command = CLICommand(
-                vendor=vendor,
-                device_type='스위치',
-                task_type='VLAN 관리',
-                subtask='VLAN 생성',
-                command=f'vlan {{vlan_id}}\nname {{vlan_name}}' if vendor in ['cisco', 'arista'] else 'set vlans {vlan_name} vlan-id {vlan_id}',
-                parameters=['vlan_id', 'vlan_name'],
-                description='VLAN을 생성하는 명령어'
-            )
-            db.session.add(command)
+            records.append({
+                'vendor': vendor,
+                'device_type': '스위치',
+                'task_type': 'VLAN 관리',
+                'subtask': 'VLAN 생성',
+                'command': f'vlan {{vlan_id}}\nname {{vlan_name}}' if vendor in ['cisco', 'arista'] else 'set vlans {vlan_name} vlan-id {vlan_id}',
+                'parameters': ['vlan_id', 'vlan_name'],
+                'description': 'VLAN을 생성하는 명령어'
+            })
             
             # 두 번째 명령어
-            command2 = CLICommand(
-                vendor=vendor,
-                device_type='스위치',
-                task_type='포트 설정',
-                subtask='인터페이스 활성화',
-                command=f'interface {{interface_name}}\nno shutdown' if vendor in ['cisco', 'arista'] else 'set interfaces {interface_name} enable',
-                parameters=['interface_name'],
-                description='인터페이스를 활성화하는 명령어'
-            )
-            db.session.add(command2)
+            records.append({
+                'vendor': vendor,
+                'device_type': '스위치',
+                'task_type': '포트 설정',
+                'subtask': '인터페이스 활성화',
+                'command': f'interface {{interface_name}}\nno shutdown' if vendor in ['cisco', 'arista'] else 'set interfaces {interface_name} enable',
+                'parameters': ['interface_name'],
+                'description': '인터페이스를 활성화하는 명령어'
+            })
         
-        db.session.commit()
+        learning_service.reset_indexes()
+        learning_service.bulk_import_commands(records)
         
         # 저장된 명령어 조회
         commands = CLICommand.query.all()
@@ -317,7 +796,7 @@ def debug_commands():
             'subtask': cmd.subtask,
             'command': cmd.command,
             'parameters': cmd.parameters,
-            'updated_at': cmd.updated_at.isoformat()
+            'updated_at': cmd.updated_at
         } for cmd in commands])
         
     except Exception as e:
@@ -0,0 +1,265 @@
+import bisect
+import re
+import threading
+from collections import OrderedDict
+
+from .cli_grammar import SUB_MODES
+from .command_trie import PLACEHOLDER_PATTERN, normalize_token
+
+# 줄 단위 정규화 결과 캐시 크기
+CANONICAL_CACHE_SIZE = 16384
+
+# 벤더별 인터페이스 유형 전체 이름 (약어는 고유 접두사로 확장)
+INTERFACE_TYPES = {
+    'cisco': ['GigabitEthernet', 'FastEthernet', 'TenGigabitEthernet', 'TwentyFiveGigE',
+              'FortyGigabitEthernet', 'HundredGigE', 'Ethernet', 'Port-channel', 'Vlan',
+              'Loopback', 'Tunnel', 'Serial', 'Management'],
+    'arista': ['Ethernet', 'Port-Channel', 'Vlan', 'Loopback', 'Management', 'Tunnel']
+}
+
+# 접두사가 아닌 관용 인터페이스 약어
+INTERFACE_ALIASES = {
+    'mgmt': 'Management'
+}
+
+# 인터페이스 이름이 뒤따르는 키워드 (분리 표기 'gi 0/1' 도 결합)
+INTERFACE_KEYWORDS = {'interface', 'range', 'source', 'source-interface', 'update-source'}
+
+# 문법에 없는 경우 사용하는 관용 약어 ((이전 키워드, 약어) 또는 약어 -> 전체 키워드)
+FALLBACK_ABBREVIATIONS = {
+    ('configure', 't'): 'terminal',
+    ('configure', 'term'): 'terminal',
+    'sh': 'show',
+    'conf': 'configure',
+    'int': 'interface',
+    'run': 'running-config',
+    'shut': 'shutdown',
+    'desc': 'description',
+    'sw': 'switchport',
+    'wr': 'write',
+    'br': 'brief'
+}
+
+_INTERFACE_TOKEN_PATTERN = re.compile(r'^([A-Za-z][A-Za-z\-]*?)-?(\d[\d/.:]*)$')
+_NUMBER_PATTERN = re.compile(r'^\d[\d/.:]*$')
+
+
+class CommandCanonicalizer:
+    """벤더 CLI 문법 그래프를 키워드 트라이로 사용하는 약어 정규화기
+
+    각 문법 노드의 하위 키워드 중 입력 접두사와 고유하게 일치하는 키워드로 확장하고
+    (IOS 의 약어 해석 방식), 인터페이스 이름은 전체 유형 이름으로 바꿉니다.
+    자주 쓰이는 줄은 LRU 캐시로 재계산을 피하며, 문법에 명령어가 추가되면
+    apply_changes() 로 영향받는 캐시 항목만 제거합니다.
+    """
+
+    def __init__(self, grammar):
+        self.grammar = grammar
+        self.vendor = grammar.vendor
+        self._interface_types = sorted(INTERFACE_TYPES.get(self.vendor, []), key=str.lower)
+        self._interface_keys = [name.lower() for name in self._interface_types]
+        self._node_keys = {}  # id(노드) -> 정렬된 하위 키워드 목록
+        self._cache = OrderedDict()  # (줄, 모드) -> (정규화된 줄, 해석한 모드)
+        self._cache_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _resolve_keyword(self, node, token):
+        """노드의 하위 키워드 중 token 과 정확히 또는 고유 접두사로 일치하는 키워드를 찾습니다."""
+        if token in node.children:
+            return token
+        keys = self._node_keys.get(id(node))
+        if keys is None:
+            keys = self._node_keys[id(node)] = sorted(node.children)
+        start = bisect.bisect_left(keys, token)
+        if start < len(keys) and keys[start].startswith(token):
+            if start + 1 >= len(keys) or not keys[start + 1].startswith(token):
+                return keys[start]
+        return None
+
+    def _resolve_interface_type(self, prefix):
+        lowered = prefix.lower()
+        if lowered in INTERFACE_ALIASES:
+            return INTERFACE_ALIASES[lowered]
+        start = bisect.bisect_left(self._interface_keys, lowered)
+        matches = []
+        for i in range(start, len(self._interface_keys)):
+            if not self._interface_keys[i].startswith(lowered):
+                break
+            matches.append(i)
+            if self._interface_keys[i] == lowered:
+                return self._interface_types[i]
+        return self._interface_types[matches[0]] if len(matches) == 1 else None
+
+    def normalize_interface(self, tokens, index, previous=None):
+        """tokens[index] 가 인터페이스 약어이면 전체 이름을 반환합니다.
+
+        Returns:
+            tuple: (정규화된 값, 소비한 토큰 수)
+        """
+        token = tokens[index]
+        if not self._interface_types:
+            return token, 1
+        after_keyword = previous in INTERFACE_KEYWORDS
+        match = _INTERFACE_TOKEN_PATTERN.match(token)
+        if match and (after_keyword or '/' in match.group(2)):
+            full = self._resolve_interface_type(match.group(1))
+            if full:
+                return full + match.group(2), 1
+        if after_keyword and index + 1 < len(tokens) and _NUMBER_PATTERN.match(tokens[index + 1]):
+            full = self._resolve_interface_type(token)
+            if full:
+                return full + tokens[index + 1], 2
+        return token, 1
+
+    def _walk(self, node, tokens):
+        """문법 그래프를 따라가며 토큰을 정규화합니다. (결과 토큰, 문법으로 해석한 키워드 수)"""
+        out = []
+        matched = 0
+        previous = None
+        i = 0
+        while i < len(tokens):
+            raw = tokens[i]
+            lowered = raw.lower()
+
+            if PLACEHOLDER_PATTERN.match(raw):
+                key = normalize_token(raw)
+                out.append(key)
+                if node is not None:
+                    name = key[1:-1]
+                    entry = next((e for e in node.placeholders if e[0] == name),
+                                 node.placeholders[0] if node.placeholders else None)
+                    node = entry[3] if entry else None
+                previous = key
+                i += 1
+                continue
+
+            if node is not None:
+                keyword = self._resolve_keyword(node, lowered)
+                if keyword is not None:
+                    out.append(keyword)
+                    node = node.children[keyword]
+                    matched += 1
+                    previous = keyword
+                    i += 1
+                    continue
+
+            value, consumed = self.normalize_interface(tokens, i, previous)
+            if node is not None:
+                entry = next((e for e in node.placeholders if e[1](value)), None)
+                if entry is not None:
+                    if entry[2]:
+                        # 줄 끝까지 받는 값 (설명 등)은 원문 유지
+                        out.extend(tokens[i:])
+                        break
+                    out.append(value)
+                    node = entry[3]
+                    previous = value
+                    i += consumed
+                    continue
+                node = None
+
+            if consumed == 1 and value == raw:
+                value = FALLBACK_ABBREVIATIONS.get((previous, lowered)) or FALLBACK_ABBREVIATIONS.get(lowered) or raw
+            out.append(value)
+            previous = value.lower()
+            i += consumed
+        return out, matched
+
+    def _candidate_modes(self, mode):
+        if mode is None:
+            ordered = ['exec', 'config'] + list(SUB_MODES)
+            return [m for m in ordered if self.grammar.root(m) is not None] + \
+                [m for m in self.grammar.modes() if m not in ordered]
+        modes = [mode]
+        if mode in SUB_MODES:
+            modes.append('config')
+        return modes
+
+    def _canonicalize_line_uncached(self, line, mode):
+        tokens = line.split()
+        if not tokens:
+            return '', mode
+        best, best_matched, best_mode = None, -1, mode
+        for candidate in self._candidate_modes(mode) or [mode]:
+            root = self.grammar.root(candidate) if candidate else None
+            out, matched = self._walk(root, tokens)
+            if matched > best_matched:
+                best, best_matched, best_mode = out, matched, candidate
+        return ' '.join(best), best_mode
+
+    def _canonicalize_line(self, line, mode):
+        key = (line, mode)
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return result
+            self._misses += 1
+        result = self._canonicalize_line_uncached(line, mode)
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > CANONICAL_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def apply_changes(self, changes):
+        """문법에 추가된 요소(CommandGrammar.extend 결과)를 반영합니다.
+
+        새 키워드는 노드별 정렬 목록에 bisect 로 끼워 넣고, 그 키워드의 접두사인 토큰이
+        들어 있는 캐시 항목만 제거합니다 (해석 결과가 바뀔 수 있는 줄). 기존 노드에
+        자리표시자가 생기거나 모드가 새로 생기면 값 해석 순서가 바뀔 수 있으므로 캐시를
+        모두 비웁니다.
+        """
+        keywords = set()
+        new_nodes = set()  # 이번에 생긴 노드 (캐시된 줄이 지나간 적 없음)
+        for change in changes:
+            kind = change[0]
+            if kind == 'keyword':
+                _, node, keyword = change
+                keys = self._node_keys.get(id(node))
+                if keys is not None:
+                    index = bisect.bisect_left(keys, keyword)
+                    if index == len(keys) or keys[index] != keyword:
+                        keys.insert(index, keyword)
+                keywords.add(keyword)
+                new_nodes.add(id(node.children[keyword]))
+            elif kind == 'placeholder':
+                _, node, name = change
+                new_nodes.add(id(next(entry[3] for entry in node.placeholders if entry[0] == name)))
+                if id(node) not in new_nodes:
+                    with self._cache_lock:
+                        self._cache.clear()
+                    return
+            elif kind == 'mode':
+                with self._cache_lock:
+                    self._cache.clear()
+                return
+        if not keywords:
+            return
+        with self._cache_lock:
+            stale = [key for key in self._cache
+                     if any(keyword.startswith(token) for token in key[0].lower().split() for keyword in keywords)]
+            for key in stale:
+                del self._cache[key]
+
+    def canonicalize_line(self, line, mode=None):
+        """명령어 한 줄을 정규화합니다. mode 가 없으면 가장 잘 맞는 모드를 찾습니다."""
+        return self._canonicalize_line(line.strip(), mode)[0]
+
+    def canonicalize(self, command):
+        """여러 줄 명령어를 모드를 추적하며 정규화합니다."""
+        lines = []
+        mode = None
+        for raw in (command or '').splitlines():
+            if not raw.strip():
+                continue
+            line, line_mode = self._canonicalize_line(raw.strip(), mode)
+            lines.append(line)
+            mode = self.grammar.transition(line_mode or 'config', line)
+        return '\n'.join(lines)
+
+    def cache_info(self):
+        return {'hits': self._hits, 'misses': self._misses,
+                'maxsize': CANONICAL_CACHE_SIZE, 'currsize': len(self._cache)}
@@ -0,0 +1,245 @@
+import re
+from functools import lru_cache
+
+from .command_trie import normalize_token, is_placeholder
+
+# 라인 검증 결과 캐시 크기
+VALIDATION_CACHE_SIZE = 8192
+
+# 설정 모드 진입 규칙: (현재 모드, 첫 키워드) -> 진입 모드
+MODE_ENTRY_RULES = {
+    ('exec', 'configure'): 'config',
+    ('exec', 'edit'): 'config',
+    ('config', 'interface'): 'interface',
+    ('config', 'router'): 'router',
+    ('config', 'vlan'): 'vlan',
+    ('config', 'line'): 'line',
+    ('config', 'ip access-list'): 'acl',
+}
+
+# 하위 모드에서 같은 수준의 모드 진입 명령어가 오면 config 모드 기준으로 해석
+SUB_MODES = ('interface', 'router', 'vlan', 'line', 'acl')
+
+# 줄 끝까지를 하나의 값으로 받는 자리표시자
+REST_OF_LINE_PARAMS = {'description', 'interface_desc', 'banner', 'password', 'acl_rule', 'text'}
+
+IPV4_PATTERN = re.compile(r'^\d{1,3}(\.\d{1,3}){3}(/\d{1,2})?$')
+INTERFACE_PATTERN = re.compile(r'^[A-Za-z][A-Za-z\-]*-?\d[\d/.:]*$')
+NUMBER_LIST_PATTERN = re.compile(r'^\d+([,-]\d+)*$')
+
+
+def _is_ipv4(value):
+    if not IPV4_PATTERN.match(value):
+        return False
+    return all(0 <= int(part) <= 255 for part in value.split('/')[0].split('.'))
+
+
+def placeholder_validator(name):
+    """자리표시자 이름에 맞는 값 검증 함수를 반환합니다."""
+    if 'vlan' in name and ('id' in name or 'list' in name):
+        return lambda v: bool(NUMBER_LIST_PATTERN.match(v)) and all(
+            1 <= int(p) <= 4094 for p in re.split(r'[,-]', v))
+    if 'interface' in name and 'desc' not in name and 'status' not in name:
+        return lambda v: bool(INTERFACE_PATTERN.match(v))
+    if any(key in name for key in ('ip', 'address', 'network', 'next_hop', 'neighbor', 'mask')):
+        return _is_ipv4
+    if any(key in name for key in ('number', 'process', 'area', 'priority', 'as_', 'prefix')) \
+            or name.endswith('_id') or name == 'id':
+        return lambda v: bool(NUMBER_LIST_PATTERN.match(v)) or _is_ipv4(v)
+    return lambda v: True
+
+
+class _GrammarNode:
+    __slots__ = ('children', 'placeholders', 'terminal')
+
+    def __init__(self):
+        self.children = {}  # 키워드 -> _GrammarNode
+        self.placeholders = []  # [(이름, 검증 함수, 줄 끝까지 여부, _GrammarNode)]
+        self.terminal = False
+
+
+class CommandGrammar:
+    """벤더별 CLI 문법 그래프
+
+    모드(exec, config, interface, router ...)마다 키워드/자리표시자 그래프를 두고,
+    학습된 명령어와 카탈로그 템플릿을 모드 전이를 따라가며 등록합니다.
+    """
+
+    def __init__(self, vendor):
+        self.vendor = vendor.lower()
+        self._modes = {}  # 모드 -> 루트 노드
+        self._validate_cached = lru_cache(maxsize=VALIDATION_CACHE_SIZE)(self._validate_line)
+
+    def modes(self):
+        return list(self._modes.keys())
+
+    def root(self, mode):
+        """모드의 루트 노드를 반환합니다. 학습되지 않은 모드는 None."""
+        return self._modes.get(mode)
+
+    def _root(self, mode):
+        return self._modes.setdefault(mode, _GrammarNode())
+
+    def add_line(self, mode, line, changes=None):
+        """한 줄의 명령어 템플릿을 모드 그래프에 등록합니다.
+
+        changes 목록을 넘기면 새로 생긴 요소를 기록합니다:
+        ('mode', 모드), ('keyword', 노드, 키워드), ('placeholder', 노드, 이름), ('terminal', 노드)
+        """
+        if changes is not None and mode not in self._modes:
+            changes.append(('mode', mode))
+        node = self._root(mode)
+        for raw in line.split():
+            key = normalize_token(raw)
+            if is_placeholder(key):
+                name = key[1:-1]
+                child = next((entry[3] for entry in node.placeholders if entry[0] == name), None)
+                if child is None:
+                    child = _GrammarNode()
+                    node.placeholders.append(
+                        (name, placeholder_validator(name), name in REST_OF_LINE_PARAMS, child))
+                    if changes is not None:
+                        changes.append(('placeholder', node, name))
+            else:
+                child = node.children.get(key)
+                if child is None:
+                    child = node.children[key] = _GrammarNode()
+                    if changes is not None:
+                        changes.append(('keyword', node, key))
+            node = child
+        if not node.terminal:
+            node.terminal = True
+            if changes is not None:
+                changes.append(('terminal', node))
+
+    def add_script(self, script, start_mode=None, changes=None):
+        """여러 줄 명령어를 모드 전이를 따라가며 등록합니다."""
+        lines = [line.strip() for line in script.splitlines() if line.strip()]
+        if not lines:
+            return
+        mode = start_mode or self.initial_mode(lines[0])
+        for line in lines:
+            mode = self.transition(mode, line, learning=True, changes=changes)
+
+    def extend(self, script):
+        """이미 생성된 문법에 명령어를 추가합니다.
+
+        문법이 바뀐 경우에만 줄 검증 캐시를 비웁니다.
+
+        Returns:
+            list: 새로 생긴 요소 목록 (add_line 의 changes 형식, 변경이 없으면 빈 목록)
+        """
+        changes = []
+        self.add_script(script, changes=changes)
+        if changes:
+            self._validate_cached.cache_clear()
+        return changes
+
+    @staticmethod
+    def initial_mode(first_line):
+        """스크립트 첫 줄로 시작 모드를 추정합니다."""
+        keyword = first_line.split()[0].lower()
+        if keyword in ('configure', 'show', 'copy', 'write', 'ping', 'edit'):
+            return 'exec'
+        return 'config'
+
+    def transition(self, mode, line, learning=False, changes=None):
+        """명령어 실행 후의 모드를 반환합니다. learning=True 이면 문법에 등록합니다."""
+        tokens = line.split()
+        keyword = tokens[0].lower()
+        if keyword == 'end':
+            return 'exec'
+        if keyword == 'exit':
+            return 'config' if mode in SUB_MODES else 'exec'
+
+        base_mode = mode
+        if mode in SUB_MODES and self._enters_mode('config', tokens):
+            # 하위 모드에서 다른 하위 모드 진입 명령은 config 모드 명령으로 처리
+            base_mode = 'config'
+
+        if learning:
+            self.add_line(base_mode, line, changes)
+        return self._enters_mode(base_mode, tokens) or base_mode
+
+    @staticmethod
+    def _enters_mode(mode, tokens):
+        keyword = tokens[0].lower()
+        two_words = ' '.join(t.lower() for t in tokens[:2])
+        return MODE_ENTRY_RULES.get((mode, two_words)) or MODE_ENTRY_RULES.get((mode, keyword))
+
+    def _match(self, node, tokens, index):
+        """토큰 목록이 그래프 경로와 일치하는지 확인합니다 (자리표시자 후보는 되추적)."""
+        if index == len(tokens):
+            return node.terminal
+        child = node.children.get(tokens[index].lower())
+        if child is not None and self._match(child, tokens, index + 1):
+            return True
+        for _, validator, rest_of_line, placeholder_node in node.placeholders:
+            if rest_of_line:
+                if placeholder_node.terminal:
+                    return True
+                continue
+            if validator(tokens[index]) and self._match(placeholder_node, tokens, index + 1):
+                return True
+        return False
+
+    def _validate_line(self, mode, line):
+        tokens = line.split()
+        keyword = tokens[0].lower()
+        if keyword in ('end', 'exit'):
+            return None
+
+        candidate_modes = [mode]
+        if mode in SUB_MODES:
+            candidate_modes.append('config')
+        if keyword == 'do' and mode != 'exec':
+            tokens = tokens[1:]
+            candidate_modes = ['exec']
+        elif keyword == 'no' and len(tokens) > 1:
+            # 'no <명령어>' 는 같은 모드의 명령어가 유효하면 허용
+            if any(self._match(self._modes[m], tokens[1:], 0) for m in candidate_modes if m in self._modes):
+                return None
+
+        for candidate in candidate_modes:
+            root = self._modes.get(candidate)
+            if root is not None and tokens and self._match(root, tokens, 0):
+                return None
+
+        known = [m for m in candidate_modes if m in self._modes]
+        if not known:
+            return f"'{mode}' 모드의 명령어 문법이 학습되지 않았습니다."
+        return f"'{mode}' 모드에서 알 수 없는 명령어입니다."
+
+    def validate_script(self, script):
+        """스크립트의 각 줄을 모드를 추적하며 검증합니다.
+
+        Returns:
+            dict: {'valid': bool, 'lines': 검증한 줄 수, 'errors': [{'line_no', 'line', 'mode', 'error'}]}
+        """
+        lines = script.splitlines() if isinstance(script, str) else list(script)
+        errors = []
+        mode = None
+        checked = 0
+        for line_no, raw in enumerate(lines, start=1):
+            line = raw.strip()
+            if not line or line.startswith('!'):
+                continue
+            if mode is None:
+                mode = self.initial_mode(line)
+            checked += 1
+            error = self._validate_cached(mode, line)
+            if error:
+                errors.append({'line_no': line_no, 'line': line, 'mode': mode, 'error': error})
+            mode = self.transition(mode, line)
+        return {'valid': not errors, 'lines': checked, 'errors': errors}
+
+    def validate_batch(self, scripts):
+        """여러 장비의 스크립트를 한 번에 검증합니다.
+
+        Args:
+            scripts (dict): 장비 식별자 -> 스크립트
+
+        Returns:
+            dict: 장비 식별자 -> 검증 결과
+        """
+        return {name: self.validate_script(script) for name, script in scripts.items()}
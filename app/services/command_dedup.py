@@ -0,0 +1,177 @@
+import random
+import re
+import zlib
+from collections import defaultdict
+
+from .command_trie import normalize_token, is_placeholder
+
+# MinHash 서명 길이 = LSH 밴드 수 x 밴드당 행 수
+LSH_BANDS = 8
+LSH_ROWS = 4
+MINHASH_SIZE = LSH_BANDS * LSH_ROWS
+
+# 같은 명령어로 병합하는 최소 자카드 유사도 (후보 쌍은 실제 shingle 집합으로 재확인)
+DEFAULT_SIMILARITY = 0.8
+
+# 후보 검사를 생략하는 과대 버킷 크기 (같은 밴드 값을 공유하는 명령어가 너무 많은 경우)
+MAX_BUCKET_SIZE = 500
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = random.Random(20240601)  # 실행마다 같은 서명이 나오도록 고정 시드 사용
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+                 for _ in range(MINHASH_SIZE)]
+
+# 자리표시자 이름 차이를 무시하기 위한 공통 토큰
+GENERIC_PLACEHOLDER = '{}'
+
+_SPACE_PATTERN = re.compile(r'\s+')
+_BRACKET_PLACEHOLDER_PATTERN = re.compile(r'\[([^\]\s]+)\]')
+
+
+def canonicalize(command):
+    """명령어를 정규화합니다.
+
+    줄마다 공백을 정리하고 키워드를 소문자로 바꾸며, <vlan-id>/[vlan-id]/{vlan_id} 형식의
+    자리표시자를 {vlan_id} 로 통일합니다. 빈 줄과 주석(!) 줄은 제거합니다.
+    """
+    lines = []
+    for line in (command or '').splitlines():
+        line = _SPACE_PATTERN.sub(' ', line).strip()
+        if not line or line.startswith('!'):
+            continue
+        line = _BRACKET_PLACEHOLDER_PATTERN.sub(r'{\1}', line)
+        lines.append(' '.join(normalize_token(token) for token in line.split(' ')))
+    return '\n'.join(lines)
+
+
+def shingles(canonical):
+    """정규화된 명령어의 토큰 2-gram 집합 (자리표시자 이름은 무시)."""
+    result = set()
+    for line in canonical.split('\n'):
+        tokens = ['^'] + [GENERIC_PLACEHOLDER if is_placeholder(t) else t for t in line.split(' ')] + ['$']
+        for i in range(len(tokens) - 1):
+            result.add(tokens[i] + ' ' + tokens[i + 1])
+    return result
+
+
+def _shingle_hashes(shingle):
+    """shingle 하나의 순열별 해시 값 목록을 계산합니다."""
+    h = zlib.crc32(shingle.encode('utf-8'))
+    return tuple(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for a, b in _PERMUTATIONS)
+
+
+def minhash(shingle_set, cache=None):
+    """shingle 집합의 MinHash 서명을 계산합니다.
+
+    말뭉치 전체에서 shingle 종류는 명령어 수보다 훨씬 적으므로, cache 를 넘기면
+    shingle 별 해시 값을 재사용하고 순열별 최소값만 계산합니다.
+    """
+    if cache is None:
+        cache = {}
+    vectors = []
+    for shingle in shingle_set:
+        vector = cache.get(shingle)
+        if vector is None:
+            vector = cache[shingle] = _shingle_hashes(shingle)
+        vectors.append(vector)
+    return tuple(map(min, zip(*vectors)))
+
+
+def polarity(canonical):
+    """줄마다 부정형(no ...) 여부 (부정형과 긍정형 명령어는 서로 다른 명령어로 취급)."""
+    return tuple(line == 'no' or line.startswith('no ') for line in canonical.split('\n'))
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class _UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, x):
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, x, y):
+        rx, ry = self.find(x), self.find(y)
+        if rx != ry:
+            self.parent[max(rx, ry)] = min(rx, ry)
+
+
+def cluster_commands(commands, threshold=DEFAULT_SIMILARITY):
+    """명령어 목록을 정규화 + MinHash/LSH 로 유사 명령어 군집으로 묶습니다.
+
+    정규화 결과가 같은 명령어는 먼저 하나로 합치고, 서로 다른 정규화 형태에 대해서만
+    MinHash 서명을 계산하여 LSH 밴드 버킷에서 후보 쌍을 찾습니다 (입력 크기에 대해 선형).
+    부정형(no ...) 여부가 다른 명령어는 같은 버킷에 넣지 않으므로 병합되지 않습니다.
+
+    Args:
+        commands (list): 명령어 문자열 목록
+        threshold (float): 병합할 최소 자카드 유사도
+
+    Returns:
+        list: 2개 이상 명령어로 이루어진 군집 목록
+            [{'canonical': str, 'representative': 입력 인덱스, 'members': [입력 인덱스, ...]}]
+            representative 는 대표 정규화 형태를 가진 첫 번째 입력 (원문을 유지할 명령어)
+    """
+    forms = {}  # 정규화 형태 -> 형태 번호
+    form_members = []  # 형태 번호 -> [입력 인덱스]
+    form_texts = []
+    for i, command in enumerate(commands):
+        canonical = canonicalize(command)
+        form = forms.get(canonical)
+        if form is None:
+            form = forms[canonical] = len(form_texts)
+            form_texts.append(canonical)
+            form_members.append([])
+        form_members[form].append(i)
+
+    form_shingles = [shingles(text) for text in form_texts]
+    union_find = _UnionFind(len(form_texts))
+    buckets = defaultdict(list)
+    hash_cache = {}
+    for form, shingle_set in enumerate(form_shingles):
+        if not shingle_set:
+            continue
+        signature = minhash(shingle_set, hash_cache)
+        sign = polarity(form_texts[form])
+        for band in range(LSH_BANDS):
+            key = (sign, band, signature[band * LSH_ROWS:(band + 1) * LSH_ROWS])
+            buckets[key].append(form)
+
+    checked = set()
+    for bucket in buckets.values():
+        if len(bucket) < 2 or len(bucket) > MAX_BUCKET_SIZE:
+            continue
+        for i in range(len(bucket)):
+            first = bucket[i]
+            first_shingles = form_shingles[first]
+            for second in bucket[i + 1:]:
+                # 이미 같은 군집이거나 다른 밴드에서 확인한 쌍은 건너뜀
+                if union_find.find(first) == union_find.find(second) or (first, second) in checked:
+                    continue
+                checked.add((first, second))
+                if jaccard(first_shingles, form_shingles[second]) >= threshold:
+                    union_find.union(first, second)
+
+    groups = defaultdict(list)
+    for form in range(len(form_texts)):
+        groups[union_find.find(form)].append(form)
+
+    clusters = []
+    for forms_in_group in groups.values():
+        members = [i for form in forms_in_group for i in form_members[form]]
+        if len(members) < 2:
+            continue
+        # 가장 많이 관찰된 정규화 형태를 대표로 사용 (동률이면 짧은 것)
+        best = max(forms_in_group, key=lambda f: (len(form_members[f]), -len(form_texts[f]), form_texts[f]))
+        clusters.append({'canonical': form_texts[best], 'representative': form_members[best][0],
+                         'members': sorted(members)})
+    return clusters
@@ -0,0 +1,341 @@
+import heapq
+import itertools
+import math
+import re
+import threading
+from collections import defaultdict, namedtuple
+
+# 토큰 분리 패턴 (영문/숫자/한글 및 '_' 포함)
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# 필드별 가중치
+FIELD_WEIGHTS = {
+    'command': 3.0,
+    'task_type': 2.0,
+    'subtask': 2.0,
+    'description': 1.0
+}
+
+# 트라이그램 기반 부분 일치 점수 비율
+TRIGRAM_MATCH_RATIO = 0.5
+
+# 색인에 보관하는 명령어 필드 (ORM 객체 대신 값만 보관하여 세션과 무관하게 사용)
+IndexedCommand = namedtuple('IndexedCommand', ('id', 'vendor', 'device_type', 'task_type',
+                                               'subtask', 'command', 'description'))
+
+
+def tokenize(text):
+    """텍스트를 소문자 토큰 목록으로 분리합니다."""
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def field_value(obj, name):
+    """ORM 객체 또는 딕셔너리에서 필드 값을 읽습니다."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def trigrams(token):
+    """토큰의 문자 트라이그램 집합을 반환합니다."""
+    if len(token) < 3:
+        return set()
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+class CommandIndex:
+    """학습된 CLI 명령어에 대한 역색인 (토큰 + 문자 트라이그램)
+
+    문서 키는 DB 행 ID (ID 가 없는 파일 저장소 명령어는 (vendor, command)) 이며,
+    명령어 추가/삭제 시 증분 갱신됩니다. 토큰 역색인은 벤더별로 분할되어 벤더 필터
+    검색 시 해당 벤더만 조회하고, 트라이그램 색인은 어휘(토큰) 단위로 유지되어 부분 일치
+    질의를 토큰 확장으로 처리합니다.
+
+    백그라운드 학습 스레드와 요청 스레드가 함께 사용하므로 모든 조회/갱신은 잠금 안에서
+    수행합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs = {}  # 문서 키 -> IndexedCommand
+        self._doc_terms = {}  # 문서 키 -> {토큰: 가중치}
+        self._commands = defaultdict(set)  # (vendor, command) -> {문서 키}
+        self._postings = defaultdict(lambda: defaultdict(dict))  # 벤더 -> 토큰 -> {문서 키: 가중치}
+        self._ranked = {}  # (벤더, 토큰) -> 가중치 내림차순 [(가중치, 문서 키)] (검색 시 생성)
+        self._doc_freq = defaultdict(int)  # 토큰 -> 전체 문서 빈도
+        self._trigram_vocab = defaultdict(set)  # 트라이그램 -> {토큰}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, key):
+        vendor, command = key
+        return ((vendor or '').lower(), command) in self._commands
+
+    def keys(self):
+        """색인된 (vendor, command) 키 목록을 반환합니다."""
+        with self._lock:
+            return list(self._commands.keys())
+
+    def command_counts(self):
+        """(vendor, command) 별 색인된 행 수 목록을 반환합니다."""
+        with self._lock:
+            return [(key, len(doc_keys)) for key, doc_keys in self._commands.items()]
+
+    def get(self, key):
+        """문서 키의 IndexedCommand 를 반환합니다. 없으면 None."""
+        with self._lock:
+            return self._docs.get(key)
+
+    @staticmethod
+    def _payload(obj):
+        vendor = (field_value(obj, 'vendor') or '').lower()
+        return IndexedCommand(
+            field_value(obj, 'id'), vendor, field_value(obj, 'device_type') or '',
+            field_value(obj, 'task_type'), field_value(obj, 'subtask'),
+            field_value(obj, 'command') or '', field_value(obj, 'description'))
+
+    @staticmethod
+    def doc_key(obj):
+        """명령어의 문서 키 (DB 행 ID, 없으면 (vendor, command))"""
+        row_id = field_value(obj, 'id')
+        if row_id is not None:
+            return row_id
+        return ((field_value(obj, 'vendor') or '').lower(), field_value(obj, 'command') or '')
+
+    def add(self, obj):
+        """명령어(ORM 객체, 조회 행 또는 딕셔너리)를 색인에 추가합니다. 같은 키가 있으면 교체합니다."""
+        payload = self._payload(obj)
+        key = self.doc_key(payload._asdict())
+
+        weights = defaultdict(float)
+        for field, field_weight in FIELD_WEIGHTS.items():
+            for token in tokenize(getattr(payload, field)):
+                weights[token] += field_weight
+
+        with self._lock:
+            if key in self._docs:
+                self._remove_key(key)
+            vendor_postings = self._postings[payload.vendor]
+            for token, weight in weights.items():
+                vendor_postings[token][key] = weight
+                self._ranked.pop((payload.vendor, token), None)
+                if self._doc_freq[token] == 0:
+                    for gram in trigrams(token):
+                        self._trigram_vocab[gram].add(token)
+                self._doc_freq[token] += 1
+
+            self._docs[key] = payload
+            self._doc_terms[key] = dict(weights)
+            self._commands[(payload.vendor, payload.command)].add(key)
+        return key
+
+    def _remove_key(self, key):
+        payload = self._docs.pop(key)
+        vendor_postings = self._postings[payload.vendor]
+        for token in self._doc_terms.pop(key):
+            self._ranked.pop((payload.vendor, token), None)
+            postings = vendor_postings.get(token)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del vendor_postings[token]
+            self._doc_freq[token] -= 1
+            if self._doc_freq[token] <= 0:
+                del self._doc_freq[token]
+                for gram in trigrams(token):
+                    vocab = self._trigram_vocab.get(gram)
+                    if vocab is not None:
+                        vocab.discard(token)
+                        if not vocab:
+                            del self._trigram_vocab[gram]
+
+        command_key = (payload.vendor, payload.command)
+        doc_keys = self._commands[command_key]
+        doc_keys.discard(key)
+        if not doc_keys:
+            del self._commands[command_key]
+
+    def remove_key(self, key):
+        """문서 키(행 ID) 하나만 색인에서 제거합니다. 같은 명령어의 다른 행은 유지됩니다."""
+        with self._lock:
+            if key not in self._docs:
+                return False
+            self._remove_key(key)
+        return True
+
+    def remove(self, vendor, command):
+        """명령어를 색인에서 제거합니다 (같은 명령어의 행이 여러 개면 모두 제거)."""
+        vendor = (vendor or '').lower()
+        with self._lock:
+            doc_keys = self._commands.get((vendor, command))
+            if not doc_keys:
+                return False
+            for key in list(doc_keys):
+                self._remove_key(key)
+        return True
+
+    def remove_vendor(self, vendor):
+        """벤더의 모든 명령어를 색인에서 제거합니다."""
+        vendor = (vendor or '').lower()
+        with self._lock:
+            keys = [key for key, payload in self._docs.items() if payload.vendor == vendor]
+            for key in keys:
+                self._remove_key(key)
+        return len(keys)
+
+    def replace_vendor(self, vendor, objs):
+        """벤더의 명령어를 objs 로 교체합니다.
+
+        새 명령어 값을 먼저 준비한 뒤 잠금 안에서 한 번에 교체하므로, 검색 요청이
+        일부만 채워진 색인을 보지 않습니다.
+        """
+        payloads = [self._payload(obj) for obj in objs]
+        with self._lock:
+            self.remove_vendor(vendor)
+            for payload in payloads:
+                self.add(payload._asdict())
+        return len(payloads)
+
+    def clear(self):
+        """색인을 초기화합니다."""
+        with self._lock:
+            self._docs.clear()
+            self._doc_terms.clear()
+            self._commands.clear()
+            self._postings.clear()
+            self._ranked.clear()
+            self._doc_freq.clear()
+            self._trigram_vocab.clear()
+
+    def _expand_token(self, token):
+        """질의 토큰을 (어휘 토큰, 점수 비율) 목록으로 확장합니다."""
+        if token in self._doc_freq:
+            return [(token, 1.0)]
+
+        # 정확히 일치하는 토큰이 없으면 트라이그램 교집합으로 부분 일치 어휘를 찾음
+        grams = trigrams(token)
+        if not grams:
+            return []
+        vocab_sets = sorted((self._trigram_vocab.get(gram, set()) for gram in grams), key=len)
+        candidates = set(vocab_sets[0])
+        for vocab in vocab_sets[1:]:
+            candidates &= vocab
+            if not candidates:
+                return []
+        return [(vocab_token, TRIGRAM_MATCH_RATIO)
+                for vocab_token in candidates if token in vocab_token]
+
+    def _ranked_postings(self, vendor, token):
+        """토큰 게시 목록을 가중치 내림차순으로 반환합니다 (변경될 때까지 캐시)."""
+        ranked = self._ranked.get((vendor, token))
+        if ranked is None:
+            postings = self._postings[vendor][token]
+            ranked = self._ranked[(vendor, token)] = sorted(
+                ((weight, key) for key, weight in postings.items()), key=lambda item: item[0], reverse=True)
+        return ranked
+
+    def _search_partition(self, vendor, expansions, device_type, total, heap, limit, order):
+        """한 벤더 분할에서 모든 질의 토큰이 일치하는 문서를 찾아 heap 에 점수를 넣습니다.
+
+        heap 항목은 (점수, 순번, 문서 키) 이며 limit 이 있으면 상위 limit 개만 유지하는 최소 힙입니다. 후보를 첫 질의
+        토큰의 점수 내림차순으로 보면서 (첫 토큰 점수 + 나머지 토큰 최대 점수) 가 현재
+        limit 번째 점수 이하가 되면 이후 후보는 점수 계산 없이 일치 여부만 셉니다
+        (max-score 조기 종료).
+
+        Returns:
+            int: 일치 문서 수
+        """
+        vendor_postings = self._postings.get(vendor, {})
+        token_postings = []
+        for options in expansions:
+            postings = [(token, vendor_postings[token], math.log(1 + total / self._doc_freq[token]) * ratio)
+                        for token, ratio in options if token in vendor_postings]
+            if not postings:
+                return 0
+            token_postings.append(postings)
+
+        # 게시 목록이 가장 작은 질의 토큰부터 후보를 생성
+        token_postings.sort(key=lambda postings: sum(len(p) for _, p, _ in postings))
+        first, rest = token_postings[0], token_postings[1:]
+        if len(first) == 1:
+            token, _, idf = first[0]
+            candidates = ((weight * idf, key) for weight, key in self._ranked_postings(vendor, token))
+        else:
+            best = {}
+            for _, postings, idf in first:
+                for key, weight in postings.items():
+                    if weight * idf > best.get(key, 0.0):
+                        best[key] = weight * idf
+            candidates = sorted(((score, key) for key, score in best.items()), key=lambda item: item[0], reverse=True)
+        # 나머지 질의 토큰이 더할 수 있는 최대 점수
+        rest_bound = sum(max(self._ranked_postings(vendor, token)[0][0] * idf for token, _, idf in options)
+                         for options in rest)
+
+        matched = 0
+        for first_score, key in candidates:
+            if device_type and self._docs[key].device_type != device_type:
+                continue
+            if limit and len(heap) >= limit and first_score + rest_bound <= heap[0][0]:
+                # 상위 결과에 들 수 없는 후보는 일치 여부만 확인
+                if all(any(key in postings for _, postings, _ in options) for options in rest):
+                    matched += 1
+                continue
+            score = first_score
+            for options in rest:
+                best = 0.0
+                for _, postings, idf in options:
+                    weight = postings.get(key)
+                    if weight and weight * idf > best:
+                        best = weight * idf
+                if not best:
+                    break
+                score += best
+            else:
+                matched += 1
+                if not limit:
+                    heap.append((score, next(order), key))
+                elif len(heap) < limit:
+                    heapq.heappush(heap, (score, next(order), key))
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, (score, next(order), key))
+        return matched
+
+    def search(self, query, vendor=None, device_type=None, page=1, per_page=None):
+        """질의를 순위화하여 검색합니다.
+
+        모든 질의 토큰이 일치하는 명령어만 반환하며, 결과는 점수 내림차순입니다.
+        per_page 가 있으면 page * per_page 개까지만 점수를 유지합니다.
+
+        Returns:
+            dict: {'total': 전체 일치 수, 'items': [(IndexedCommand, score), ...]}
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return {'total': 0, 'items': []}
+
+        page = max(int(page or 1), 1)
+        per_page = max(int(per_page), 1) if per_page else None
+        limit = page * per_page if per_page else None
+
+        with self._lock:
+            expansions = [self._expand_token(token) for token in tokens]
+            if not all(expansions):
+                return {'total': 0, 'items': []}
+
+            total_docs = len(self._docs) or 1
+            vendors = [vendor.lower()] if vendor else list(self._postings.keys())
+            heap = []
+            order = itertools.count()
+            total = 0
+            for partition in vendors:
+                total += self._search_partition(partition, expansions, device_type, total_docs, heap, limit, order)
+
+            ranked = sorted(heap, key=lambda item: item[0], reverse=True)
+            if per_page:
+                ranked = ranked[(page - 1) * per_page:]
+            items = [(self._docs[key], score) for score, _, key in ranked]
+
+        return {'total': total, 'items': items}
@@ -0,0 +1,171 @@
+import heapq
+import re
+import threading
+
+# 파라미터 자리표시자 패턴 ({vlan_id}, <vlan-id> 형식)
+PLACEHOLDER_PATTERN = re.compile(r'^(?:\{([^}]+)\}|<([^>]+)>)$')
+
+# 노드별로 미리 계산해 두는 최대 연속 후보 수
+NODE_TOP_K = 20
+
+
+def normalize_token(token):
+    """토큰을 트라이 키로 정규화합니다. 자리표시자는 {name} 형식으로 통일합니다."""
+    match = PLACEHOLDER_PATTERN.match(token)
+    if match:
+        name = (match.group(1) or match.group(2)).strip().lower().replace('-', '_').replace(' ', '_')
+        return '{' + name + '}'
+    return token.lower()
+
+
+def is_placeholder(key):
+    """정규화된 토큰이 파라미터 자리표시자인지 확인합니다."""
+    return key.startswith('{') and key.endswith('}')
+
+
+class _TrieNode:
+    __slots__ = ('children', 'terminal', 'top')
+
+    def __init__(self):
+        self.children = {}  # 정규화 토큰 -> _TrieNode
+        self.terminal = 0  # 이 노드에서 끝나는 명령어 빈도
+        self.top = None  # 캐시된 상위 연속 후보 [(빈도, (토큰, ...)), ...]
+
+
+class CommandTrie:
+    """벤더별 CLI 명령어 토큰 접두사 트라이
+
+    명령어 한 줄을 공백 단위 토큰으로 나누어 저장하며, 각 노드는 하위 연속 후보 중
+    빈도 상위 NODE_TOP_K 개를 처음 조회할 때 계산해 캐시합니다 (삽입/삭제 시 경로 무효화).
+    빈도는 같은 명령어를 가진 행 수만큼 insert/remove 의 count 로 누적됩니다.
+
+    명령어 등록/삭제와 자동완성 요청이 서로 다른 스레드에서 실행되므로 갱신과 조회(지연
+    계산되는 top 포함)는 잠금 안에서 수행합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._roots = {}  # 벤더 -> 루트 노드
+
+    def vendors(self):
+        with self._lock:
+            return list(self._roots.keys())
+
+    def insert(self, vendor, command, count=1):
+        """명령어(여러 줄 가능)의 각 줄을 트라이에 추가합니다."""
+        with self._lock:
+            root = self._roots.setdefault(vendor.lower(), _TrieNode())
+            for line in (command or '').splitlines():
+                tokens = [normalize_token(t) for t in line.split()]
+                if not tokens:
+                    continue
+                node = root
+                node.top = None
+                for token in tokens:
+                    node = node.children.setdefault(token, _TrieNode())
+                    node.top = None
+                node.terminal += count
+
+    def remove(self, vendor, command, count=1):
+        """명령어의 빈도를 줄이고, 더 이상 쓰이지 않는 노드를 제거합니다."""
+        with self._lock:
+            return self._remove(vendor, command, count)
+
+    def _remove(self, vendor, command, count):
+        root = self._roots.get(vendor.lower())
+        if root is None:
+            return False
+        removed = False
+        for line in (command or '').splitlines():
+            tokens = [normalize_token(t) for t in line.split()]
+            path = [root]
+            for token in tokens:
+                child = path[-1].children.get(token)
+                if child is None:
+                    break
+                path.append(child)
+            else:
+                if not tokens or path[-1].terminal <= 0:
+                    continue
+                path[-1].terminal = max(path[-1].terminal - count, 0)
+                for node in path:
+                    node.top = None
+                # 빈 가지 정리
+                for i in range(len(tokens), 0, -1):
+                    node = path[i]
+                    if node.terminal or node.children:
+                        break
+                    del path[i - 1].children[tokens[i - 1]]
+                removed = True
+        return removed
+
+    def _top(self, node):
+        """노드 아래의 빈도 상위 연속 후보를 반환합니다."""
+        if node.top is None:
+            candidates = []
+            if node.terminal:
+                candidates.append((node.terminal, ()))
+            for token, child in node.children.items():
+                for count, tail in self._top(child):
+                    candidates.append((count, (token,) + tail))
+            node.top = heapq.nlargest(NODE_TOP_K, candidates, key=lambda item: item[0])
+        return node.top
+
+    def complete(self, vendor, text, limit=10):
+        """입력 중인 명령어의 상위 연속 후보를 반환합니다.
+
+        마지막 토큰이 공백으로 끝나지 않으면 접두사로 취급합니다.
+        이미 입력된 값이 자리표시자 위치에 오면 해당 파라미터 값으로 간주합니다.
+        """
+        with self._lock:
+            return self._complete(vendor, text, limit)
+
+    def _complete(self, vendor, text, limit):
+        root = self._roots.get((vendor or '').lower())
+        if root is None:
+            return []
+
+        tokens = text.split()
+        partial_raw = ''
+        if tokens and not text[-1:].isspace():
+            partial_raw = tokens.pop()
+        partial = partial_raw.lower()
+        filling_value = False
+
+        node = root
+        for token in tokens:
+            key = normalize_token(token)
+            child = node.children.get(key)
+            if child is None:
+                placeholders = [n for k, n in node.children.items() if is_placeholder(k)]
+                if not placeholders:
+                    return []
+                child = max(placeholders, key=lambda n: self._top(n)[0][0] if self._top(n) else 0)
+            node = child
+
+        branches = [(k, n) for k, n in node.children.items() if k.startswith(partial)]
+        if partial and not branches:
+            # 접두사와 일치하는 키워드가 없으면 파라미터 값 입력 중으로 간주
+            branches = [(k, n) for k, n in node.children.items() if is_placeholder(k)]
+            filling_value = True
+
+        candidates = []
+        for key, child in branches:
+            for count, tail in self._top(child):
+                candidates.append((count, (key,) + tail))
+
+        typed = ' '.join(tokens)
+        results = []
+        for count, continuation in heapq.nlargest(limit, candidates, key=lambda item: item[0]):
+            parameters = [t[1:-1] for t in continuation if is_placeholder(t)]
+            if filling_value:
+                # 입력 중인 값은 자리표시자 대신 그대로 유지
+                parameters = parameters[1:]
+                continuation = (partial_raw,) + continuation[1:]
+            results.append({
+                'completion': ' '.join(filter(None, [typed, ' '.join(continuation)])),
+                'next': continuation[0],
+                'parameters': parameters,
+                'count': count
+            })
+        return results
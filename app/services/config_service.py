@@ -3,7 +3,10 @@ import os
 from datetime import datetime
 import logging
 from ..models.config_task import ConfigTask
+from ..models.network_device import NetworkDevice
 from ..utils.file_handler import ensure_directory_exists
+from ..utils.metrics import script_renders_total
+from .timing_service import TimingService
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +15,7 @@ class ConfigService:
         self.base_dir = base_dir
         ensure_directory_exists(base_dir)
         self.tasks = {}  # device_id별 작업 목록
+        self.timing_service = TimingService(base_dir)  # 실행별 단계 소요 시간 기록
         self.load_tasks()
 
     def load_tasks(self):
@@ -536,19 +540,26 @@ class ConfigService:
             
             script_content = "\n".join(script_lines)
             logger.info("스크립트 생성 완료")
+            script_renders_total.inc(vendor=vendor, result='success')
             
             return script_content
             
         except Exception as e:
             logger.error(f"스크립트 생성 실패: {str(e)}")
+            script_renders_total.inc(vendor=vendor, result='error')
             raise ValueError(f"스크립트 생성 실패: {str(e)}")
     
-    def execute_script(self, device_id, script):
+    def execute_script(self, device_id, script, device=None, timeout=None):
         """스크립트 실행 메소드
         
+        device(장비 접속 정보)가 주어지면 NetworkDevice 로 장비에 접속하여 실행하고 단계별
+        소요 시간 기록(.timing.json)을 결과 파일 옆에 저장합니다. 없으면 시뮬레이션만 수행합니다.
+        
         Args:
             device_id (str): 장비 ID
             script (str): 실행할 스크립트
+            device (dict): 장비 정보 (ip, username, password, vendor)
+            timeout (float): 장비 연결 제한 시간 (초)
             
         Returns:
             str: 실행 결과
@@ -566,8 +577,12 @@ class ConfigService:
             with open(script_path, 'w', encoding='utf-8') as f:
                 f.write(script)
             
-            # TODO: 실제 장비 연결 및 명령 실행 로직
-            # 여기서는 시뮬레이션만 수행
+            commands = [line for line in script.splitlines() if line.strip() and not line.startswith('!')]
+            execution = None
+            if device is not None:
+                execution = NetworkDevice(device.get('ip') or device.get('ip_address'), device.get('username', ''),
+                                          device.get('password', ''), device_type=device.get('vendor') or 'cisco',
+                                          timeout=timeout).execute_script(commands)
             
             # 실행 결과 생성
             result_lines = []
@@ -575,14 +590,14 @@ class ConfigService:
             result_lines.append(f"장비 ID: {device_id}")
             result_lines.append("")
             
-            # 각 명령어 실행 결과 시뮬레이션
-            for line in script.splitlines():
-                if line.startswith('!') or not line.strip():
-                    continue
-                    
+            # 각 명령어 실행 결과 (장비 접속 정보가 없으면 시뮬레이션)
+            for line in commands:
                 result_lines.append(f"> {line}")
+                if execution is not None:
+                    result_lines.append(execution['results'].get(line, "실행되지 않음"))
+                    result_lines.append("")
                 # 명령어에 따른 결과 시뮬레이션
-                if "show" in line:
+                elif "show" in line:
                     result_lines.append("시뮬레이션된 출력 결과")
                     result_lines.append("")
                 else:
@@ -599,12 +614,36 @@ class ConfigService:
             
             logger.info(f"스크립트 실행 완료, 결과 저장: {result_path}")
             
+            if execution is not None:
+                self.save_execution_timings(device_id, result_filename, execution, vendor=device.get('vendor'))
+                if execution['status'] != 'success':
+                    raise ValueError(execution.get('message'))
+            
             return result_content
             
         except Exception as e:
             logger.error(f"스크립트 실행 중 오류: {str(e)}")
             raise ValueError(f"스크립트 실행 실패: {str(e)}")
 
+    def save_execution_timings(self, device_id, result_filename, execution, vendor=None):
+        """실제 장비 실행(NetworkDevice.execute_script) 결과의 단계별 소요 시간을 저장합니다.
+        
+        Args:
+            device_id (str): 장비 ID
+            result_filename (str): 같은 디렉토리의 실행 결과 파일 이름
+            execution (dict): NetworkDevice.execute_script() 반환값 ('timings', 'status' 포함)
+            vendor (str): 장비 벤더 (소요 시간 요약 그룹)
+            
+        Returns:
+            str: 저장한 기록 파일 경로 (저장 실패 시 None)
+        """
+        try:
+            return self.timing_service.save(device_id, result_filename, execution['timings'],
+                                            vendor=vendor, status=execution.get('status', 'success'))
+        except OSError as e:
+            logger.warning(f"실행 소요 시간 저장 실패: {str(e)}")
+            return None
+
 class ConfigManager:
     def __init__(self):
         self.config_file = "config.json"
@@ -0,0 +1,202 @@
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+
+from .command_dedup import canonicalize
+
+# 오프라인 문서로 취급하는 확장자
+DOC_EXTENSIONS = ('.html', '.htm', '.txt', '.text')
+
+# 파일 단위 병렬 처리를 시작하는 최소 파일 수
+PARALLEL_MIN_FILES = 4
+
+# 분류되지 않은 명령어에 기록하는 작업 유형
+UNCLASSIFIED_TASK_TYPE = 'vendor-docs'
+
+# 벤더별 명령어 추출 패턴
+COMMAND_PATTERNS = {
+    'cisco': [
+        r'(?m)^(config[^\n]*\#[^\n]+)',
+        r'(?m)^(interface[^\n]+)',
+        r'(?m)^(vlan[^\n]+)',
+        r'(?m)^(ip[^\n]+)'
+    ],
+    'juniper': [
+        r'(?m)^(set[^\n]+)',
+        r'(?m)^(delete[^\n]+)',
+        r'(?m)^(show[^\n]+)'
+    ],
+    'arista': [
+        r'(?m)^(configure[^\n]+)',
+        r'(?m)^(interface[^\n]+)',
+        r'(?m)^(vlan[^\n]+)'
+    ]
+}
+
+# 벤더별 명령어 분류 규칙
+CLASSIFICATION_RULES = {
+    'cisco': {
+        'VLAN 관리': {
+            'VLAN 생성': lambda cmd: 'vlan' in cmd and not 'no vlan' in cmd,
+            'VLAN 삭제': lambda cmd: 'no vlan' in cmd,
+            'VLAN 할당': lambda cmd: 'switchport' in cmd and 'vlan' in cmd
+        },
+        '포트 설정': {
+            '포트 활성화': lambda cmd: 'interface' in cmd and 'no shutdown' in cmd,
+            '포트 속도': lambda cmd: 'interface' in cmd and 'speed' in cmd
+        }
+    },
+    'juniper': {
+        'VLAN 관리': {
+            'VLAN 생성': lambda cmd: 'set vlans' in cmd,
+            'VLAN 삭제': lambda cmd: 'delete vlans' in cmd
+        },
+        '포트 설정': {
+            '포트 활성화': lambda cmd: 'set interfaces' in cmd and 'enable' in cmd
+        }
+    },
+    'arista': {
+        'VLAN 관리': {
+            'VLAN 생성': lambda cmd: 'vlan' in cmd and not 'no vlan' in cmd,
+            'VLAN 삭제': lambda cmd: 'no vlan' in cmd
+        },
+        '포트 설정': {
+            '포트 활성화': lambda cmd: 'interface' in cmd and 'no shutdown' in cmd
+        }
+    }
+}
+
+# 매개변수 패턴
+PARAM_PATTERNS = [
+    r'\{([^}]+)\}',  # {parameter} 형식
+    r'<([^>]+)>',    # <parameter> 형식
+    r'\[([^\]]+)\]'  # [parameter] 형식
+]
+
+
+def extract_cli_commands(text, vendor):
+    """텍스트에서 벤더 패턴에 맞는 CLI 명령어를 순서대로 추출합니다.
+
+    공백, 대소문자, 자리표시자 표기만 다른 명령어는 처음 나온 것 하나만 남깁니다.
+    """
+    commands = []
+    seen = set()
+    for pattern in COMMAND_PATTERNS.get(vendor.lower(), []):
+        for match in re.finditer(pattern, text):
+            command = match.group(1).strip()
+            key = canonicalize(command)
+            if key and key not in seen:
+                seen.add(key)
+                commands.append(command)
+    return commands
+
+
+def classify_command(command, vendor):
+    """명령어의 작업 유형을 분류합니다. 일치하는 규칙이 없으면 None 을 반환합니다."""
+    command = command.lower()
+    for category, subtasks in CLASSIFICATION_RULES.get(vendor.lower(), {}).items():
+        for subtask, rule in subtasks.items():
+            if rule(command):
+                return {
+                    'category': category,
+                    'subcategory': subtask
+                }
+    return None
+
+
+def extract_parameters(command):
+    """명령어에서 매개변수 이름을 추출합니다."""
+    parameters = []
+    for pattern in PARAM_PATTERNS:
+        parameters.extend(match.group(1) for match in re.finditer(pattern, command))
+    return list(set(parameters))
+
+
+def file_sha256(path):
+    """파일 내용의 SHA-256 해시를 반환합니다."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_doc_files(root):
+    """문서 디렉토리를 재귀적으로 탐색하여 처리 대상 파일 경로를 반환합니다."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.lower().endswith(DOC_EXTENSIONS):
+                yield os.path.join(dirpath, filename)
+
+
+def read_doc_text(path):
+    """문서 파일을 텍스트로 읽습니다. HTML 은 태그를 제거하고 줄 단위 텍스트로 변환합니다."""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        raw = f.read()
+    if not path.lower().endswith(('.html', '.htm')):
+        return raw
+
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(raw, 'html.parser')
+    for element in soup(['script', 'style']):
+        element.decompose()
+    lines = (line.strip() for line in soup.get_text('\n').splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def process_doc_file(path, vendor):
+    """문서 파일 하나에서 명령어를 추출하고 분류합니다 (프로세스 풀 작업 단위).
+
+    Returns:
+        tuple: (경로, [{'command', 'task_type', 'subtask', 'parameters'}, ...])
+    """
+    rows = []
+    for command in extract_cli_commands(read_doc_text(path), vendor):
+        classification = classify_command(command, vendor)
+        if classification:
+            task_type = classification['category']
+            subtask = classification['subcategory']
+        else:
+            task_type = UNCLASSIFIED_TASK_TYPE
+            subtask = command.split()[0]
+        rows.append({
+            'command': command,
+            'task_type': task_type,
+            'subtask': subtask,
+            'parameters': sorted(extract_parameters(command))
+        })
+    return path, rows
+
+
+class DocManifest:
+    """처리 완료된 문서 목록 (내용 해시 -> 처리 정보)
+
+    재실행 시 내용이 바뀌지 않은 파일을 건너뛰기 위해 사용하며,
+    중단되어도 이어서 처리할 수 있도록 배치마다 원자적으로 저장됩니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def __contains__(self, content_hash):
+        return content_hash in self.entries
+
+    def record(self, content_hash, path, commands):
+        self.entries[content_hash] = {
+            'path': path,
+            'commands': commands,
+            'processed_at': datetime.utcnow().isoformat()
+        }
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,140 @@
+import threading
+import uuid
+from datetime import datetime
+
+from app.database import db
+from ..models.learning_run import LearningRun
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class LearningCancelled(Exception):
+    """학습 실행 취소 요청으로 중단됨"""
+    pass
+
+
+class LearningRunner:
+    """CLI 학습을 백그라운드 스레드로 실행하고 진행 상황을 learning_runs 테이블에 기록합니다.
+
+    한 번에 하나의 실행만 허용하며, 취소 요청은 벤더 사이와 DB 반영 직전에 확인합니다.
+    """
+
+    def __init__(self, learning_service):
+        self.learning_service = learning_service
+        self._lock = threading.Lock()
+        self._threads = {}  # 실행 ID -> 스레드
+        self._cancel_events = {}  # 실행 ID -> threading.Event
+
+    def active_run_id(self):
+        """실행 중인 학습 ID를 반환합니다."""
+        with self._lock:
+            for run_id, thread in self._threads.items():
+                if thread.is_alive():
+                    return run_id
+        return None
+
+    def start(self, app, vendors):
+        """학습 실행을 생성하고 백그라운드 스레드를 시작합니다.
+
+        Returns:
+            tuple: (LearningRun, 새로 시작했는지 여부). 이미 실행 중이면 기존 실행을 반환합니다.
+        """
+        with self._lock:
+            for run_id, thread in self._threads.items():
+                if thread.is_alive():
+                    return db.session.get(LearningRun, run_id), False
+
+            run = LearningRun(id=uuid.uuid4().hex, status=LearningRun.PENDING, vendors=list(vendors))
+            db.session.add(run)
+            db.session.commit()
+
+            cancel_event = threading.Event()
+            thread = threading.Thread(
+                target=self._run, args=(app, run.id, list(vendors), cancel_event),
+                name=f'learning-run-{run.id[:8]}', daemon=True)
+            self._threads = {run.id: thread}
+            self._cancel_events = {run.id: cancel_event}
+            thread.start()
+            return run, True
+
+    def get_run(self, run_id):
+        """실행 상태를 조회합니다. 실행 스레드가 사라진 미완료 실행은 중단으로 기록합니다."""
+        run = db.session.get(LearningRun, run_id)
+        if run is None or run.is_finished:
+            return run
+        thread = self._threads.get(run_id)
+        if thread is None or not thread.is_alive():
+            db.session.refresh(run)
+            if not run.is_finished:
+                run.status = LearningRun.INTERRUPTED
+                run.finished_at = datetime.utcnow()
+                db.session.commit()
+        return run
+
+    def list_runs(self, limit=20):
+        """최근 학습 실행 목록을 반환합니다."""
+        return LearningRun.query.order_by(LearningRun.created_at.desc()).limit(limit).all()
+
+    def cancel(self, run_id):
+        """학습 실행 취소를 요청합니다."""
+        run = self.get_run(run_id)
+        if run is None or run.is_finished:
+            return run
+        run.cancel_requested = True
+        db.session.commit()
+        event = self._cancel_events.get(run_id)
+        if event is not None:
+            event.set()
+        return run
+
+    def _run(self, app, run_id, vendors, cancel_event):
+        with app.app_context():
+            run = db.session.get(LearningRun, run_id)
+            run.status = LearningRun.RUNNING
+            run.started_at = datetime.utcnow()
+            run.results = {}
+            db.session.commit()
+
+            def progress(stage, **counts):
+                for field in ('pages_fetched', 'commands_extracted', 'inserted', 'updated', 'deleted'):
+                    if field in counts:
+                        setattr(run, field, (getattr(run, field) or 0) + counts[field])
+                db.session.commit()
+                if stage == 'extracted' and cancel_event.is_set():
+                    raise LearningCancelled()
+
+            try:
+                for vendor in vendors:
+                    if cancel_event.is_set():
+                        raise LearningCancelled()
+                    run.current_vendor = vendor
+                    db.session.commit()
+                    logger.info(f"[{run_id[:8]}] {vendor} 벤더 학습 시작")
+                    try:
+                        result = self.learning_service.start_learning(vendor, progress=progress)
+                        summary = {'status': 'success', 'count': result['count'], 'changes': result['changes']}
+                    except LearningCancelled:
+                        raise
+                    except Exception as e:
+                        logger.error(f"[{run_id[:8]}] {vendor} 벤더 학습 실패: {str(e)}")
+                        summary = {'status': 'error', 'message': str(e)}
+                    run.results = dict(run.results or {}, **{vendor: summary})
+                    run.vendors_done = (run.vendors_done or 0) + 1
+                    db.session.commit()
+
+                run.status = LearningRun.COMPLETED
+            except LearningCancelled:
+                db.session.rollback()
+                logger.info(f"[{run_id[:8]}] 학습 실행이 취소되었습니다.")
+                run.status = LearningRun.CANCELLED
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"[{run_id[:8]}] 학습 실행 실패: {str(e)}", exc_info=True)
+                run.status = LearningRun.FAILED
+                run.error = str(e)
+            finally:
+                run.current_vendor = None
+                run.finished_at = datetime.utcnow()
+                db.session.commit()
+                db.session.remove()
@@ -2,17 +2,32 @@
 import json
 from ..exceptions import CLILearningError, ValidationError
 from datetime import datetime
-from ..models.cli_command import CLICommand
-from ..models.device import Device
+from ..models.cli_command import CLICommand, CLICommandAlias, CommandParameter
+from ..models.device import Device, VENDOR_TEMPLATES
 from ..utils.file_handler import ensure_directory_exists
+from .command_index import CommandIndex, IndexedCommand, field_value
+from .command_trie import CommandTrie
+from .cli_grammar import CommandGrammar
+from .cli_canonicalizer import CommandCanonicalizer
+from .command_dedup import cluster_commands, DEFAULT_SIMILARITY
+from .running_config_parser import collect_running_configs, learn_config_templates
+from .doc_ingestion import (DocManifest, classify_command, extract_cli_commands, extract_parameters,
+                            file_sha256, iter_doc_files, process_doc_file, PARALLEL_MIN_FILES)
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from app.utils.logger import setup_logger
+from app.utils.pagination import fetch_page
+from app.utils.streaming import iter_query_rows
 from app import db
+from sqlalchemy import insert, update, delete, func, or_
 import logging
-import requests
-from bs4 import BeautifulSoup
-import re
+import time
 
 CLI_LEARNING_FILE = "cli_learning.json"
+DIFF_DELETE_CHUNK_SIZE = 500  # 재학습 시 한 번에 삭제할 최대 행 수
+BULK_CHUNK_SIZE = 1000  # 대량 등록 시 한 번의 executemany 로 저장할 행 수
+BULK_MAX_REPORTED_ERRORS = 100  # 대량 등록 결과에 포함할 최대 오류 수
+BULK_REQUIRED_FIELDS = ('vendor', 'device_type', 'task_type', 'subtask', 'command')
+DOC_INGEST_BATCH_FILES = 50  # 오프라인 문서 학습 시 DB/매니페스트를 저장하는 파일 단위
 
 logger = setup_logger(__name__)
 
@@ -21,6 +36,12 @@ class LearningService:
         self.base_dir = base_dir
         ensure_directory_exists(base_dir)
         self.commands = {}  # 벤더별 명령어 저장
+        self.index = CommandIndex()  # 명령어 검색 색인
+        self._db_indexed = False  # DB 명령어 색인 여부
+        self._trie = None  # 자동완성용 접두사 트라이 (최초 조회 시 생성)
+        self._grammars = {}  # 벤더별 CLI 문법 그래프 (최초 검증 시 생성)
+        self._canonicalizers = {}  # 벤더별 약어 정규화기 (문법 그래프 기반)
+        self._canonical_keys = {}  # 벤더별 정규화 명령어 -> 학습된 명령어
         self.load_commands()  # 저장된 명령어 로드
         # 벤더별 명령어 템플릿
         self.vendor_templates = {
@@ -344,7 +365,9 @@ class LearningService:
                     with open(data_file, 'r', encoding='utf-8') as f:
                         data = json.load(f)
                         for cmd_data in data:
-                            self.commands[vendor].append(CLICommand.from_dict(cmd_data))
+                            cmd = CLICommand.from_dict(cmd_data)
+                            self.commands[vendor].append(cmd)
+                            self.register_command(cmd)
 
     def save_commands(self, vendor):
         """명령어를 파일에 저장"""
@@ -363,20 +386,23 @@ class LearningService:
         if vendor not in self.commands:
             self.commands[vendor] = []
         
-        # 중복 명령어 검사
+        # 중복 명령어 검사 (약어/인터페이스 축약 표기를 정규화하여 비교)
+        canonical = self.canonicalize_command(vendor, command)
         for cmd in self.commands[vendor]:
-            if cmd.command == command:
+            if self.canonicalize_command(vendor, cmd.command) == canonical:
                 cmd.description = description
                 cmd.mode = mode
                 cmd.parameters = parameters or []
                 cmd.examples = examples or []
                 cmd.updated_at = datetime.now()
+                self.register_command(cmd)
                 self.save_commands(vendor)
                 return cmd
 
         # 새 명령어 추가
         new_command = CLICommand(vendor, command, description, mode, parameters, examples)
         self.commands[vendor].append(new_command)
+        self.register_command(new_command)
         self.save_commands(vendor)
         return new_command
 
@@ -387,21 +413,216 @@ class LearningService:
             return self.commands.get(vendor, [])
         return {v: cmds for v, cmds in self.commands.items()}
 
-    def search_commands(self, query, vendor=None):
-        """명령어 검색"""
-        results = []
-        vendors = [vendor.lower()] if vendor else self.commands.keys()
-        
-        for v in vendors:
-            if v not in self.commands:
+    def search_commands(self, query, vendor=None, device_type=None, page=1, per_page=None):
+        """명령어 검색 (역색인 기반 순위 검색)"""
+        return [cmd for cmd, _ in self.search_commands_ranked(
+            query, vendor, device_type, page, per_page)['items']]
+
+    def search_commands_ranked(self, query, vendor=None, device_type=None, page=1, per_page=None):
+        """명령어를 검색하여 전체 일치 수와 점수를 함께 반환합니다."""
+        self._ensure_db_index()
+        if vendor:
+            # 'sh run' 처럼 축약된 질의를 색인된 전체 키워드로 확장
+            query = self.canonicalize_command(vendor, query)
+        return self.index.search(query, vendor=vendor, device_type=device_type,
+                                 page=page, per_page=per_page)
+
+    def _index_rows(self, vendor=None, after_id=None):
+        """색인에 필요한 명령어 컬럼만 조회합니다 (ORM 객체를 만들지 않음)."""
+        query = db.session.query(*(getattr(CLICommand, field) for field in IndexedCommand._fields))
+        if vendor:
+            query = query.filter(CLICommand.vendor == vendor)
+        if after_id is not None:
+            query = query.filter(CLICommand.id > after_id)
+        return query.all()
+
+    def _ensure_db_index(self):
+        """DB에 저장된 학습 명령어를 최초 검색 시 색인에 추가합니다."""
+        if self._db_indexed:
+            return
+        try:
+            for row in self._index_rows():
+                self.index.add(row)
+            self._db_indexed = True
+        except Exception as e:
+            logger.error(f"명령어 색인 생성 중 오류 발생: {str(e)}")
+
+    def reindex_vendor(self, vendor):
+        """벤더의 명령어 색인을 DB 및 파일 저장소 기준으로 다시 생성합니다."""
+        vendor = vendor.lower()
+        self.index.replace_vendor(vendor, list(self.commands.get(vendor, [])) + self._index_rows(vendor))
+        self._trie = None
+        self._invalidate_grammar(vendor)
+
+    def register_command(self, cmd):
+        """추가/수정된 명령어를 검색 색인과 자동완성 트라이에 반영합니다.
+
+        자동완성 트라이의 빈도는 같은 명령어를 가진 행 수이므로 새로 색인되는 행마다 1 씩 늘립니다.
+        """
+        vendor, command = field_value(cmd, 'vendor'), field_value(cmd, 'command')
+        previous = self.index.get(self.index.doc_key(cmd))
+        if previous is not None:
+            if (previous.vendor, previous.command) == ((vendor or '').lower(), command):
+                self.index.add(cmd)
+                return
+            # 같은 행의 명령어가 바뀐 경우 이전 문구를 먼저 제거
+            self.unregister_command(previous._asdict())
+        is_new = (vendor, command) not in self.index
+        self.index.add(cmd)
+        if self._trie is not None:
+            self._trie.insert(vendor, command)
+        if is_new:
+            self._extend_grammar(vendor or '', command)
+
+    def reset_indexes(self):
+        """검색 색인과 자동완성 트라이를 비웁니다. 다음 조회 시 DB 기준으로 다시 생성됩니다."""
+        self.index.clear()
+        self._db_indexed = False
+        self._trie = None
+        self._invalidate_grammar()
+
+    def unregister_command(self, cmd):
+        """삭제(또는 수정 전)된 명령어 행을 검색 색인에서 제거합니다.
+
+        자동완성 트라이에서는 이 행의 빈도만 줄이며, 같은 명령어 문구를 가진 다른 행이
+        남아 있으면 문법 그래프는 그대로 둡니다.
+        """
+        vendor, command = field_value(cmd, 'vendor'), field_value(cmd, 'command')
+        if not self.index.remove_key(self.index.doc_key(cmd)):
+            return
+        if self._trie is not None:
+            self._trie.remove(vendor, command)
+        if (vendor, command) in self.index:
+            return
+        # 문법 그래프는 명령어끼리 간선을 공유하므로 제거하지 않고 다음 조회 때 다시 생성
+        self._invalidate_grammar(vendor or '')
+
+    def get_command_trie(self):
+        """학습된 명령어와 cli_learning.json 으로 자동완성 트라이를 생성합니다."""
+        if self._trie is not None:
+            return self._trie
+
+        self._ensure_db_index()
+        trie = CommandTrie()
+        for (vendor, command), rows in self.index.command_counts():
+            trie.insert(vendor, command, count=rows)
+
+        for path in (CLI_LEARNING_FILE, os.path.join('config', CLI_LEARNING_FILE)):
+            if not os.path.exists(path):
                 continue
-            
-            for cmd in self.commands[v]:
-                if (query.lower() in cmd.command.lower() or 
-                    query.lower() in cmd.description.lower()):
-                    results.append(cmd)
-        
-        return results
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    cli_data = json.load(f)
+                for vendor, entries in cli_data.items():
+                    templates = entries.values() if isinstance(entries, dict) else entries
+                    for template in templates:
+                        if isinstance(template, str):
+                            trie.insert(vendor, template)
+            except Exception as e:
+                logger.error(f"CLI 학습 파일 로드 중 오류 발생: {path} - {str(e)}")
+
+        self._trie = trie
+        return trie
+
+    def complete_command(self, vendor, text, limit=10):
+        """입력 중인 명령어의 자동완성 후보를 반환합니다."""
+        return self.get_command_trie().complete(vendor, text, limit)
+
+    def get_grammar(self, vendor):
+        """학습된 명령어와 카탈로그 템플릿으로 벤더의 CLI 문법 그래프를 생성합니다."""
+        vendor = vendor.lower()
+        grammar = self._grammars.get(vendor)
+        if grammar is not None:
+            return grammar
+
+        self._ensure_db_index()
+        grammar = CommandGrammar(vendor)
+        for cmd_vendor, command in self.index.keys():
+            if cmd_vendor == vendor:
+                grammar.add_script(command)
+
+        for catalog in (self.vendor_templates.get(vendor, {}), VENDOR_TEMPLATES.get(vendor, {})):
+            for template in catalog.values():
+                grammar.add_script('\n'.join(template.get('template', [])))
+                for show_command in template.get('show_commands', []):
+                    grammar.add_line('exec', show_command)
+
+        if not grammar.modes():
+            raise ValidationError(f'문법 정보가 없는 벤더입니다: {vendor}')
+        self._grammars[vendor] = grammar
+        return grammar
+
+    def _extend_grammar(self, vendor, command):
+        """이미 생성된 문법 그래프에 새 명령어를 추가하고 영향받는 정규화 결과만 비웁니다.
+
+        문법이 아직 생성되지 않은 벤더는 다음 조회 때 한 번에 생성됩니다.
+        """
+        vendor = vendor.lower()
+        grammar = self._grammars.get(vendor)
+        if grammar is None or not command:
+            return
+        changes = grammar.extend(command)
+        canonicalizer = self._canonicalizers.get(vendor)
+        if canonicalizer is not None:
+            canonicalizer.apply_changes(changes)
+        canonical_keys = self._canonical_keys.get(vendor)
+        if canonical_keys is None:
+            return
+        if changes:
+            # 기존 명령어의 정규화 결과가 바뀔 수 있으므로 다음 조회 때 다시 계산
+            self._canonical_keys.pop(vendor, None)
+        else:
+            canonical_keys.setdefault(self.canonicalize_command(vendor, command), command)
+
+    def _invalidate_grammar(self, vendor=None):
+        """명령어 변경 시 문법 그래프와 약어 정규화기를 다음 조회 때 다시 생성하도록 비웁니다."""
+        if vendor is None:
+            self._grammars.clear()
+            self._canonicalizers.clear()
+            self._canonical_keys.clear()
+            return
+        vendor = vendor.lower()
+        self._grammars.pop(vendor, None)
+        self._canonicalizers.pop(vendor, None)
+        self._canonical_keys.pop(vendor, None)
+
+    def get_canonicalizer(self, vendor):
+        """벤더 문법 그래프 기반의 약어 정규화기를 반환합니다."""
+        vendor = vendor.lower()
+        canonicalizer = self._canonicalizers.get(vendor)
+        if canonicalizer is None:
+            canonicalizer = self._canonicalizers[vendor] = CommandCanonicalizer(self.get_grammar(vendor))
+        return canonicalizer
+
+    def canonicalize_command(self, vendor, command):
+        """약어와 인터페이스 축약 표기를 전체 형태로 바꾼 명령어를 반환합니다.
+
+        문법 정보가 없는 벤더는 원문을 그대로 반환합니다.
+        """
+        try:
+            return self.get_canonicalizer(vendor).canonicalize(command)
+        except ValidationError:
+            return command
+
+    def find_equivalent_command(self, vendor, command):
+        """정규화 결과가 같은 학습된 명령어를 찾습니다. 없으면 None."""
+        vendor = vendor.lower()
+        canonical_keys = self._canonical_keys.get(vendor)
+        if canonical_keys is None:
+            self._ensure_db_index()
+            canonical_keys = self._canonical_keys[vendor] = {}
+            for cmd_vendor, existing in self.index.keys():
+                if cmd_vendor == vendor:
+                    canonical_keys.setdefault(self.canonicalize_command(vendor, existing), existing)
+        return canonical_keys.get(self.canonicalize_command(vendor, command))
+
+    def validate_script(self, vendor, script):
+        """스크립트를 장비에 보내기 전에 벤더 문법으로 검증합니다."""
+        return self.get_grammar(vendor).validate_script(script)
+
+    def validate_scripts(self, vendor, scripts):
+        """여러 장비의 스크립트를 벤더 문법으로 일괄 검증합니다."""
+        return self.get_grammar(vendor).validate_batch(scripts)
 
     def delete_command(self, vendor, command):
         """명령어 삭제"""
@@ -409,8 +630,11 @@ class LearningService:
         if vendor not in self.commands:
             return False
         
+        removed = [cmd for cmd in self.commands[vendor] if cmd.command == command]
         self.commands[vendor] = [cmd for cmd in self.commands[vendor] 
                                if cmd.command != command]
+        for cmd in removed:
+            self.unregister_command(cmd)
         self.save_commands(vendor)
         return True
 
@@ -418,6 +642,8 @@ class LearningService:
         """벤더의 모든 명령어 삭제"""
         vendor = vendor.lower()
         if vendor in self.commands:
+            for cmd in self.commands[vendor]:
+                self.unregister_command(cmd)
             self.commands[vendor] = []
             self.save_commands(vendor)
             return True
@@ -642,6 +868,10 @@ class LearningService:
 
     def _perform_web_search(self, query):
         """벤더 문서에서 CLI 명령어를 검색합니다."""
+        # 웹 크롤링 라이브러리는 검색할 때만 import (앱 시작 시간 단축)
+        import requests
+        from bs4 import BeautifulSoup
+
         try:
             vendor_docs = {
                 'cisco': 'https://www.cisco.com/c/en/us/td/docs/ios-xml/ios/fundamentals/command/cf_command_ref.html',
@@ -680,113 +910,32 @@ class LearningService:
 
     def _extract_cli_commands(self, text, vendor):
         """텍스트에서 CLI 명령어를 추출합니다."""
-        commands = []
-        
-        # 벤더별 명령어 패턴
-        patterns = {
-            'cisco': [
-                r'(?m)^(config[^\n]*\#[^\n]+)',
-                r'(?m)^(interface[^\n]+)',
-                r'(?m)^(vlan[^\n]+)',
-                r'(?m)^(ip[^\n]+)'
-            ],
-            'juniper': [
-                r'(?m)^(set[^\n]+)',
-                r'(?m)^(delete[^\n]+)',
-                r'(?m)^(show[^\n]+)'
-            ],
-            'arista': [
-                r'(?m)^(configure[^\n]+)',
-                r'(?m)^(interface[^\n]+)',
-                r'(?m)^(vlan[^\n]+)'
-            ]
-        }
-        
         try:
-            vendor_patterns = patterns.get(vendor.lower(), [])
-            for pattern in vendor_patterns:
-                matches = re.finditer(pattern, text)
-                for match in matches:
-                    command = match.group(1).strip()
-                    if command and command not in commands:
-                        commands.append(command)
-            
-            return commands
-            
+            return extract_cli_commands(text, vendor)
         except Exception as e:
             logger.error(f"명령어 추출 중 오류 발생: {str(e)}")
             return []
 
     def _classify_command_type(self, command, vendor):
         """명령어의 유형을 분류합니다."""
-        command = command.lower()
-        
-        # 벤더별 명령어 분류 규칙
-        classification_rules = {
-            'cisco': {
-                'VLAN 관리': {
-                    'VLAN 생성': lambda cmd: 'vlan' in cmd and not 'no vlan' in cmd,
-                    'VLAN 삭제': lambda cmd: 'no vlan' in cmd,
-                    'VLAN 할당': lambda cmd: 'switchport' in cmd and 'vlan' in cmd
-                },
-                '포트 설정': {
-                    '포트 활성화': lambda cmd: 'interface' in cmd and 'no shutdown' in cmd,
-                    '포트 속도': lambda cmd: 'interface' in cmd and 'speed' in cmd
-                }
-            },
-            'juniper': {
-                'VLAN 관리': {
-                    'VLAN 생성': lambda cmd: 'set vlans' in cmd,
-                    'VLAN 삭제': lambda cmd: 'delete vlans' in cmd
-                },
-                '포트 설정': {
-                    '포트 활성화': lambda cmd: 'set interfaces' in cmd and 'enable' in cmd
-                }
-            },
-            'arista': {
-                'VLAN 관리': {
-                    'VLAN 생성': lambda cmd: 'vlan' in cmd and not 'no vlan' in cmd,
-                    'VLAN 삭제': lambda cmd: 'no vlan' in cmd
-                },
-                '포트 설정': {
-                    '포트 활성화': lambda cmd: 'interface' in cmd and 'no shutdown' in cmd
-                }
-            }
-        }
-        
         try:
-            vendor_rules = classification_rules.get(vendor.lower(), {})
-            for category, subtasks in vendor_rules.items():
-                for subtask, rule in subtasks.items():
-                    if rule(command):
-                        return {
-                            'category': category,
-                            'subcategory': subtask
-                        }
-            return None
-            
+            return classify_command(command, vendor)
         except Exception as e:
             logger.error(f"명령어 분류 중 오류 발생: {str(e)}")
             return None
 
     def _extract_parameters(self, command):
         """명령어에서 매개변수를 추출합니다."""
-        # 일반적인 매개변수 패턴
-        param_patterns = [
-            r'\{([^}]+)\}',  # {parameter} 형식
-            r'<([^>]+)>',    # <parameter> 형식
-            r'\[([^\]]+)\]'  # [parameter] 형식
-        ]
-        
-        parameters = []
-        for pattern in param_patterns:
-            matches = re.finditer(pattern, command)
-            parameters.extend(match.group(1) for match in matches)
-        
-        return list(set(parameters))  # 중복 제거
+        return extract_parameters(command)
 
-    def start_learning(self, vendor):
-        """특정 벤더의 CLI 명령어를 학습합니다."""
+    def start_learning(self, vendor, progress=None):
+        """특정 벤더의 CLI 명령어를 학습합니다.
+
+        Args:
+            vendor (str): 벤더
+            progress (callable): 진행 상황 콜백. progress(단계, **건수) 형식으로 호출되며,
+                예외를 발생시키면 DB 반영 전에 학습이 중단됩니다.
+        """
         try:
             if not vendor:
                 # 벤더가 지정되지 않은 경우 기본 벤더 사용
@@ -798,37 +947,40 @@ class LearningService:
             # 웹 검색을 통해 명령어 수집
             collected_commands = self.search_vendor_commands(vendor)
             
-            # 해당 벤더의 기존 명령어 삭제 (새로 학습)
-            CLICommand.query.filter_by(vendor=vendor).delete()
-            db.session.commit()
-            
-            # 수집된 명령어를 데이터베이스에 저장
-            learned_commands = []
+            # 수집된 명령어를 식별 키 기준으로 정리
+            new_rows = {}
             for cmd_info in collected_commands:
                 try:
-                    # 명령어 생성
-                    command = CLICommand(
-                        vendor=cmd_info['vendor'],
-                        device_type=cmd_info.get('device_type', '스위치'),  # 기본값 제공
-                        task_type=cmd_info['task_type'],
-                        subtask=cmd_info['subtask'],
-                        command=cmd_info['command'],
-                        parameters=cmd_info['parameters'],
-                        description=cmd_info.get('description', f"{cmd_info['subtask']} 명령어")
-                    )
-                    db.session.add(command)
-                    learned_commands.append(cmd_info)
-                    logger.info(f"명령어 추가: {cmd_info['vendor']} - {cmd_info['task_type']} - {cmd_info['subtask']}")
-                except Exception as e:
-                    logger.error(f"명령어 저장 중 오류: {str(e)}")
+                    row = {
+                        'vendor': cmd_info['vendor'],
+                        'device_type': cmd_info.get('device_type', '스위치'),  # 기본값 제공
+                        'task_type': cmd_info['task_type'],
+                        'subtask': cmd_info['subtask'],
+                        'command': cmd_info['command'],
+                        'parameters': cmd_info['parameters'],
+                        'description': cmd_info.get('description', f"{cmd_info['subtask']} 명령어"),
+                        'source': CLICommand.SOURCE_WEB
+                    }
+                    new_rows[CLICommand.identity_key(row)] = row
+                except KeyError as e:
+                    logger.error(f"명령어 정보 누락: {str(e)}")
+            if progress:
+                progress('extracted', pages_fetched=1, commands_extracted=len(new_rows))
             
-            # 명시적 커밋 
-            db.session.commit()
-            logger.info(f"{vendor} 벤더의 {len(learned_commands)}개 명령어 저장 완료")
+            # 기존 명령어와 내용 해시를 비교하여 변경분 계산
+            changes = self._apply_command_diff(vendor, new_rows, CLICommand.SOURCE_WEB)
+            self.reindex_vendor(vendor)
+            if progress:
+                progress('applied', **changes)
+            logger.info(
+                f"{vendor} 벤더 학습 완료: 추가 {changes['inserted']}개, 수정 {changes['updated']}개, "
+                f"삭제 {changes['deleted']}개, 변경 없음 {changes['unchanged']}개"
+            )
             
             return {
-                'learned_commands': learned_commands,
-                'count': len(learned_commands)
+                'learned_commands': list(new_rows.values()),
+                'count': len(new_rows),
+                'changes': changes
             }
             
         except Exception as e:
@@ -836,28 +988,547 @@ class LearningService:
             db.session.rollback()
             raise
 
-    def get_learned_commands(self, vendor=None):
-        """학습된 명령어 목록을 반환합니다."""
+    def _source_rows(self, vendor, source):
+        """같은 출처의 행과 출처 기록 이전(NULL) 행을 각각 반환합니다."""
+        owned = []
+        legacy = []
+        for cmd in CLICommand.query.filter(CLICommand.vendor == vendor,
+                                           or_(CLICommand.source == source, CLICommand.source.is_(None))):
+            (legacy if cmd.source is None else owned).append(cmd)
+        return owned, legacy
+
+    def _apply_command_diff(self, vendor, new_rows, source):
+        """새로 수집한 명령어와 저장된 명령어의 차이만 하나의 트랜잭션으로 반영합니다.
+
+        같은 출처(source)로 저장된 행만 비교/삭제 대상이며 대량 등록, 문서 학습 등 다른
+        출처의 행은 건드리지 않습니다. 출처 기록 이전(NULL) 행은 같은 명령어가 다시
+        수집되면 이 출처로 이어받고, 수집되지 않더라도 삭제하지 않습니다.
+
+        Args:
+            vendor (str): 벤더
+            new_rows (dict): 식별 키 -> 명령어 컬럼 딕셔너리
+            source (str): 명령어 출처 (CLICommand.SOURCE_*)
+
+        Returns:
+            dict: 추가/수정/삭제/변경 없음 건수
+        """
+        stored = {}
+        delete_ids = []
+        owned, legacy_rows = self._source_rows(vendor, source)
+        for cmd in owned:
+            key = CLICommand.identity_key(cmd)
+            if key in stored:
+                # 같은 식별 키의 중복 행은 하나만 유지
+                delete_ids.append(cmd.id)
+            else:
+                stored[key] = cmd
+        legacy = {}
+        for cmd in legacy_rows:
+            legacy.setdefault(CLICommand.identity_key(cmd), cmd)
+
+        inserts = []
+        updates = []
+        unchanged = 0
+        now = datetime.utcnow()
+        for key, row in new_rows.items():
+            row = dict(row, source=source)
+            existing = stored.pop(key, None)
+            if existing is None:
+                adopted = legacy.pop(key, None)
+                if adopted is None:
+                    inserts.append(row)
+                else:
+                    updates.append(dict(row, id=adopted.id, updated_at=now))
+            elif CLICommand.content_hash(existing) != CLICommand.content_hash(row):
+                updates.append(dict(row, id=existing.id, updated_at=now))
+            else:
+                unchanged += 1
+        delete_ids.extend(cmd.id for cmd in stored.values())
+
         try:
+            last_id = self._max_command_id()
+            if inserts:
+                db.session.execute(insert(CLICommand), inserts)
+            if updates:
+                db.session.execute(update(CLICommand), updates)
+            # bulk 실행은 ORM 이벤트가 발생하지 않으므로 파라미터 연결 테이블을 직접 동기화
+            connection = db.session.connection()
+            CommandParameter.sync(connection, after_id=last_id)
+            CommandParameter.sync(connection, command_ids=[row['id'] for row in updates])
+            CommandParameter.delete_for(connection, delete_ids)
+            for i in range(0, len(delete_ids), DIFF_DELETE_CHUNK_SIZE):
+                chunk = delete_ids[i:i + DIFF_DELETE_CHUNK_SIZE]
+                db.session.execute(
+                    delete(CLICommandAlias).where(CLICommandAlias.command_id.in_(chunk)),
+                    execution_options={'synchronize_session': False}
+                )
+                db.session.execute(
+                    delete(CLICommand).where(CLICommand.id.in_(chunk)),
+                    execution_options={'synchronize_session': False}
+                )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        return {
+            'inserted': len(inserts),
+            'updated': len(updates),
+            'deleted': len(delete_ids),
+            'unchanged': unchanged
+        }
+
+    def _max_command_id(self):
+        """현재 가장 큰 명령어 ID (bulk insert 로 새로 추가된 행을 구분하는 기준)."""
+        return db.session.query(func.max(CLICommand.id)).scalar() or 0
+
+    def _validate_bulk_batch(self, batch):
+        """대량 등록 배치를 검증하여 (저장할 행 목록, 오류 목록)을 반환합니다."""
+        rows = []
+        errors = []
+        for position, record in batch:
+            if not isinstance(record, dict):
+                errors.append({'index': position, 'error': 'JSON 객체가 아닙니다.'})
+                continue
+            missing = [field for field in BULK_REQUIRED_FIELDS
+                       if not isinstance(record.get(field), str) or not record[field].strip()]
+            if missing:
+                errors.append({'index': position, 'error': f"필수 필드 누락: {', '.join(missing)}"})
+                continue
+            parameters = record.get('parameters')
+            if parameters is not None and not isinstance(parameters, (list, dict)):
+                errors.append({'index': position, 'error': 'parameters 는 배열 또는 객체여야 합니다.'})
+                continue
+            rows.append({
+                'vendor': record['vendor'].strip().lower(),
+                'device_type': record['device_type'].strip(),
+                'task_type': record['task_type'].strip(),
+                'subtask': record['subtask'].strip(),
+                'command': record['command'],
+                'parameters': parameters,
+                'description': record.get('description'),
+                'source': CLICommand.SOURCE_BULK
+            })
+        return rows, errors
+
+    def bulk_import_commands(self, records, chunk_size=BULK_CHUNK_SIZE):
+        """명령어를 대량으로 등록합니다.
+
+        레코드를 chunk_size 단위로 검증한 뒤 Core insert() 의 executemany 로 저장하며,
+        전체 등록은 하나의 트랜잭션으로 처리됩니다.
+
+        Args:
+            records (iterable): 명령어 딕셔너리 (NDJSON 스트림에서 순차적으로 읽은 값 가능)
+            chunk_size (int): 한 번에 검증/저장할 행 수
+
+        Returns:
+            dict: 등록/거부 건수, 소요 시간, 초당 처리 행 수, 오류 목록
+        """
+        started = time.perf_counter()
+        inserted = 0
+        rejected = 0
+        errors = []
+        stmt = CLICommand.__table__.insert()
+
+        def flush(batch):
+            nonlocal inserted, rejected
+            rows, batch_errors = self._validate_bulk_batch(batch)
+            rejected += len(batch_errors)
+            errors.extend(batch_errors[:max(BULK_MAX_REPORTED_ERRORS - len(errors), 0)])
+            if rows:
+                db.session.execute(stmt, rows)
+                inserted += len(rows)
+
+        try:
+            last_id = self._max_command_id()
+            batch = []
+            for position, record in enumerate(records):
+                batch.append((position, record))
+                if len(batch) >= chunk_size:
+                    flush(batch)
+                    batch = []
+            if batch:
+                flush(batch)
+            CommandParameter.sync(db.session.connection(), after_id=last_id)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"명령어 대량 등록 중 오류 발생: {str(e)}")
+            raise
+
+        # 커밋된 행만 행 ID 로 색인 (색인이 아직 생성되지 않았다면 최초 검색 시 DB 에서 함께 색인됨)
+        if self._db_indexed and inserted:
+            for row in self._index_rows(after_id=last_id):
+                self.register_command(row)
+
+        elapsed = time.perf_counter() - started
+        rows_per_sec = round(inserted / elapsed, 1) if elapsed > 0 else float(inserted)
+        logger.info(f"명령어 대량 등록 완료: {inserted}개 등록, {rejected}개 거부, {rows_per_sec} rows/s")
+        return {
+            'inserted': inserted,
+            'rejected': rejected,
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_sec': rows_per_sec,
+            'errors': errors
+        }
+
+    def _upsert_commands(self, vendor, rows, source):
+        """(vendor, source, command) 기준으로 명령어를 추가하거나 내용이 바뀐 경우에만 수정합니다.
+
+        다른 출처의 같은 명령어는 수정하지 않습니다. 출처 기록 이전(NULL) 행은 이
+        출처로 이어받습니다.
+
+        Returns:
+            dict: 추가/수정/변경 없음 건수
+        """
+        existing = {}
+        legacy = {}
+        commands = [row['command'] for row in rows]
+        for i in range(0, len(commands), DIFF_DELETE_CHUNK_SIZE):
+            chunk = commands[i:i + DIFF_DELETE_CHUNK_SIZE]
+            for cmd in CLICommand.query.filter(CLICommand.vendor == vendor,
+                                               or_(CLICommand.source == source, CLICommand.source.is_(None)),
+                                               CLICommand.command.in_(chunk)).all():
+                (legacy if cmd.source is None else existing).setdefault(cmd.command, cmd)
+
+        inserts = []
+        updates = []
+        now = datetime.utcnow()
+        for row in rows:
+            row = dict(row, source=source)
+            current = existing.get(row['command'])
+            if current is None:
+                adopted = legacy.get(row['command'])
+                if adopted is None:
+                    inserts.append(row)
+                else:
+                    updates.append(dict(row, id=adopted.id, updated_at=now))
+            elif CLICommand.content_hash(current) != CLICommand.content_hash(row):
+                updates.append(dict(row, id=current.id, updated_at=now))
+
+        try:
+            last_id = self._max_command_id()
+            for i in range(0, len(inserts), BULK_CHUNK_SIZE):
+                db.session.execute(CLICommand.__table__.insert(), inserts[i:i + BULK_CHUNK_SIZE])
+            if updates:
+                db.session.execute(update(CLICommand), updates)
+            connection = db.session.connection()
+            CommandParameter.sync(connection, after_id=last_id)
+            CommandParameter.sync(connection, command_ids=[row['id'] for row in updates])
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        return {
+            'inserted': len(inserts),
+            'updated': len(updates),
+            'unchanged': len(rows) - len(inserts) - len(updates)
+        }
+
+    def learn_from_running_configs(self, vendor, paths=None, device_type='스위치',
+                                   min_frequency=1, workers=None, device_ids=None):
+        """저장된 running-config 출력에서 명령어 템플릿을 학습합니다.
+
+        Args:
+            vendor (str): 벤더
+            paths (list): running-config 파일 경로 목록 (없으면 device_ids 장비의 실행 결과 디렉토리에서 수집)
+            device_type (str): 학습된 명령어에 기록할 장비 유형
+            min_frequency (int): 저장할 최소 관찰 빈도
+            workers (int): 프로세스 풀 크기 (None 이면 CPU 수)
+            device_ids (list): 이 벤더 장비의 ID/이름 목록 (다른 벤더의 설정이 섞이지 않도록 수집 범위 제한)
+
+        Returns:
+            dict: 처리 파일 수, 템플릿 수, 추가/수정 건수, 실패 파일 목록
+        """
+        vendor = vendor.lower()
+        if not paths:
+            if device_ids is None:
+                raise ValidationError('학습할 파일 경로(paths) 또는 장비 목록(device_ids)이 필요합니다.')
+            paths = collect_running_configs(device_ids=device_ids)
+        logger.info(f"{vendor} running-config 학습 시작: 파일 {len(paths)}개")
+
+        counts, processed, failed = learn_config_templates(paths, workers=workers)
+
+        rows = []
+        for template, frequency in counts.items():
+            if frequency < min_frequency:
+                continue
+            classification = self._classify_command_type(template, vendor)
+            if classification:
+                task_type = classification['category']
+                subtask = classification['subcategory']
+            else:
+                task_type = 'running-config'
+                subtask = template.split()[0]
+            rows.append({
+                'vendor': vendor,
+                'device_type': device_type,
+                'task_type': task_type,
+                'subtask': subtask,
+                'command': template,
+                'parameters': sorted(self._extract_parameters(template)),
+                'description': f'running-config 에서 학습된 명령어 ({frequency}회 관찰)'
+            })
+
+        changes = self._upsert_commands(vendor, rows, CLICommand.SOURCE_RUNNING_CONFIG)
+        self.reindex_vendor(vendor)
+        logger.info(
+            f"{vendor} running-config 학습 완료: 템플릿 {len(rows)}개, "
+            f"추가 {changes['inserted']}개, 수정 {changes['updated']}개"
+        )
+        return {
+            'files_processed': processed,
+            'files_failed': failed,
+            'templates': len(rows),
+            'changes': changes
+        }
+
+    def ingest_offline_docs(self, vendor, root, device_type='스위치', workers=None,
+                            batch_files=DOC_INGEST_BATCH_FILES):
+        """로컬에 미러링된 벤더 문서(HTML/텍스트)에서 명령어를 학습합니다.
+
+        파일마다 추출/분류를 프로세스 풀로 나누어 처리하고, 완료된 결과를 배치 단위로
+        저장소에 병합합니다. 처리한 파일은 내용 해시 매니페스트에 기록되어 재실행 시
+        내용이 바뀌지 않은 파일은 건너뜁니다.
+
+        Args:
+            vendor (str): 벤더
+            root (str): 문서 디렉토리
+            device_type (str): 학습된 명령어에 기록할 장비 유형
+            workers (int): 프로세스 풀 크기 (None 이면 CPU 수)
+            batch_files (int): 저장 단위 파일 수
+
+        Returns:
+            dict: 대상/건너뜀/처리/실패 파일 수, 추출 명령어 수, 추가/수정 건수
+        """
+        vendor = vendor.lower()
+        if not os.path.isdir(root):
+            raise ValidationError(f'문서 디렉토리를 찾을 수 없습니다: {root}')
+
+        manifest = DocManifest(os.path.join(self.base_dir, f'doc_manifest_{vendor}.json'))
+        pending = {}  # 경로 -> 내용 해시
+        pending_hashes = set()
+        skipped = 0
+        for path in iter_doc_files(root):
+            content_hash = file_sha256(path)
+            if content_hash in manifest or content_hash in pending_hashes:
+                skipped += 1
+                continue
+            pending[path] = content_hash
+            pending_hashes.add(content_hash)
+        logger.info(f"{vendor} 오프라인 문서 학습 시작: 대상 {len(pending)}개, 건너뜀 {skipped}개")
+
+        stats = {'files_total': len(pending) + skipped, 'files_skipped': skipped,
+                 'files_processed': 0, 'files_failed': [], 'commands_extracted': 0,
+                 'inserted': 0, 'updated': 0, 'unchanged': 0}
+        batch_rows = {}
+        batch_done = []
+
+        def flush():
+            if batch_rows:
+                changes = self._upsert_commands(vendor, list(batch_rows.values()), CLICommand.SOURCE_DOCS)
+                for key in ('inserted', 'updated', 'unchanged'):
+                    stats[key] += changes[key]
+            for path, count in batch_done:
+                manifest.record(pending[path], path, count)
+            manifest.save()
+            batch_rows.clear()
+            batch_done.clear()
+
+        canonicalize = self.canonicalize_command
+
+        def collect(path, rows):
+            for row in rows:
+                command = canonicalize(vendor, row['command'])
+                batch_rows[command] = dict(
+                    row, command=command, vendor=vendor, device_type=device_type,
+                    description=f"{os.path.basename(path)} 문서에서 학습된 명령어")
+            batch_done.append((path, len(rows)))
+            stats['files_processed'] += 1
+            stats['commands_extracted'] += len(rows)
+            if len(batch_done) >= batch_files:
+                flush()
+
+        paths = list(pending)
+        if len(paths) < PARALLEL_MIN_FILES or workers == 1:
+            for path in paths:
+                try:
+                    collect(*process_doc_file(path, vendor))
+                except Exception as e:
+                    stats['files_failed'].append({'path': path, 'error': str(e)})
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(process_doc_file, path, vendor): path for path in paths}
+                for future in as_completed(futures):
+                    try:
+                        collect(*future.result())
+                    except Exception as e:
+                        stats['files_failed'].append({'path': futures[future], 'error': str(e)})
+        flush()
+
+        self.reindex_vendor(vendor)
+        logger.info(
+            f"{vendor} 오프라인 문서 학습 완료: 처리 {stats['files_processed']}개, "
+            f"추가 {stats['inserted']}개, 수정 {stats['updated']}개"
+        )
+        return stats
+
+    def deduplicate_commands(self, vendor=None, threshold=DEFAULT_SIMILARITY, dry_run=True):
+        """유사 명령어를 군집으로 묶어 대표 명령어 하나와 별칭으로 병합합니다.
+
+        같은 (벤더, 작업 유형, 상세 작업) 안에서만 병합합니다. 군집마다 대표 정규화 형태를
+        가진 가장 오래된 행을 원문 그대로 남기고, 나머지 행은 삭제한 뒤 원문을 별칭으로
+        기록합니다. 기본값은 dry_run 으로, 군집만 계산하고 DB 는 바꾸지 않습니다.
+
+        Returns:
+            dict: 검사한 명령어 수, 군집 수, 병합(삭제)된 행 수, 군집 목록
+        """
+        query = db.session.query(CLICommand.id, CLICommand.vendor, CLICommand.task_type,
+                                 CLICommand.subtask, CLICommand.command)
+        if vendor:
+            query = query.filter(CLICommand.vendor == vendor.lower())
+        groups = {}
+        for row in query.order_by(CLICommand.id):
+            groups.setdefault((row.vendor, row.task_type, row.subtask), []).append(row)
+
+        summary = {'scanned': 0, 'clusters': 0, 'merged': 0, 'items': []}
+        keep_of = {}  # 병합되는 행 ID -> 남길 행 ID
+        new_aliases = []
+        now = datetime.utcnow()
+        for (cmd_vendor, task_type, subtask), rows in groups.items():
+            summary['scanned'] += len(rows)
+            if len(rows) < 2:
+                continue
+            for cluster in cluster_commands([row.command for row in rows], threshold):
+                members = [rows[i] for i in cluster['members']]
+                keep = rows[cluster['representative']]
+                aliases = sorted({row.command for row in members if row.command != keep.command})
+
+                summary['clusters'] += 1
+                summary['merged'] += len(members) - 1
+                summary['items'].append({'vendor': cmd_vendor, 'task_type': task_type, 'subtask': subtask,
+                                         'id': keep.id, 'command': keep.command,
+                                         'canonical': cluster['canonical'], 'aliases': aliases})
+                keep_of.update((row.id, keep.id) for row in members if row.id != keep.id)
+                new_aliases.extend({'command_id': keep.id, 'vendor': cmd_vendor,
+                                    'alias': alias, 'created_at': now} for alias in aliases)
+
+        if dry_run or not summary['clusters']:
+            return summary
+
+        try:
+            merged_ids = list(keep_of)
+            for i in range(0, len(merged_ids), DIFF_DELETE_CHUNK_SIZE):
+                chunk = merged_ids[i:i + DIFF_DELETE_CHUNK_SIZE]
+                # 병합되는 행에 이미 달린 별칭은 남길 행으로 옮김
+                moved = [{'id': alias_id, 'command_id': keep_of[command_id]}
+                         for alias_id, command_id in db.session.query(
+                             CLICommandAlias.id, CLICommandAlias.command_id
+                         ).filter(CLICommandAlias.command_id.in_(chunk))]
+                if moved:
+                    db.session.execute(update(CLICommandAlias), moved)
+                CommandParameter.delete_for(db.session.connection(), chunk)
+                db.session.execute(
+                    delete(CLICommand).where(CLICommand.id.in_(chunk)),
+                    execution_options={'synchronize_session': False}
+                )
+            for i in range(0, len(new_aliases), BULK_CHUNK_SIZE):
+                db.session.execute(CLICommandAlias.__table__.insert(), new_aliases[i:i + BULK_CHUNK_SIZE])
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        for cmd_vendor in {cmd_vendor for cmd_vendor, _, _ in groups}:
+            self.reindex_vendor(cmd_vendor)
+        logger.info(f"유사 명령어 병합 완료: 군집 {summary['clusters']}개, 병합 {summary['merged']}개")
+        return summary
+
+    # 명령어 목록 API 에서 fields= 로 선택할 수 있는 필드 (기본 응답 필드는 LEARNED_COMMAND_FIELDS)
+    COMMAND_LIST_COLUMNS = {
+        'id': CLICommand.id,
+        'vendor': CLICommand.vendor,
+        'device_type': CLICommand.device_type,
+        'task_type': CLICommand.task_type,
+        'subtask': CLICommand.subtask,
+        'command': CLICommand.command,
+        'description': CLICommand.description,
+        'parameters': CLICommand.parameters,
+        'created_at': CLICommand.created_at,
+        'updated_at': CLICommand.updated_at
+    }
+    LEARNED_COMMAND_FIELDS = ('vendor', 'task_type', 'subtask', 'command', 'parameters', 'updated_at')
+
+    def _learned_commands_query(self, vendor=None, parameter=None, task_type=None, subtask=None,
+                                device_type=None):
+        if parameter:
+            query = CLICommand.query.join(
+                CommandParameter, CommandParameter.command_id == CLICommand.id
+            ).filter(CommandParameter.name == parameter)
+            model = CommandParameter
+        else:
             query = CLICommand.query
-            
-            if vendor:
-                query = query.filter_by(vendor=vendor)
-            
-            commands = query.all()
+            model = CLICommand
+
+        if vendor:
+            query = query.filter(model.vendor == vendor)
+        if task_type:
+            query = query.filter(model.task_type == task_type)
+        if subtask:
+            query = query.filter(model.subtask == subtask)
+        if device_type:
+            query = query.filter(CLICommand.device_type == device_type)
+        return query
+
+    def get_learned_commands(self, vendor=None, parameter=None, task_type=None, subtask=None):
+        """학습된 명령어 목록을 반환합니다.
+
+        parameter 를 지정하면 파라미터 연결 테이블의 색인으로 해당 파라미터를 받는 명령어만 조회합니다.
+        """
+        try:
+            commands = self._learned_commands_query(vendor, parameter, task_type, subtask).all()
             return [{
                 'vendor': cmd.vendor,
                 'task_type': cmd.task_type,
                 'subtask': cmd.subtask,
                 'command': cmd.command,
                 'parameters': cmd.parameters,
-                'updated_at': cmd.updated_at.isoformat()
+                'updated_at': cmd.updated_at
             } for cmd in commands]
             
         except Exception as e:
             logger.error(f"명령어 목록 조회 중 오류 발생: {str(e)}")
             raise
 
+    def get_learned_commands_page(self, page, vendor=None, parameter=None, task_type=None, subtask=None,
+                                  device_type=None):
+        """학습된 명령어를 id 키셋 페이지 단위로 조회합니다. 요청된 필드의 컬럼만 선택합니다.
+
+        Returns:
+            tuple: (명령어 dict 목록, 다음 페이지 cursor 또는 None)
+        """
+        query = self._learned_commands_query(vendor, parameter, task_type, subtask, device_type)
+        return fetch_page(query, CLICommand.id, self.COMMAND_LIST_COLUMNS, page)
+
+    def iter_learned_commands(self, fields, after=None, vendor=None, parameter=None, task_type=None,
+                              subtask=None, device_type=None):
+        """학습된 명령어를 서버 측 커서로 한 행씩 반환합니다 (전체 코퍼스 내보내기용)."""
+        query = self._learned_commands_query(vendor, parameter, task_type, subtask, device_type)
+        return iter_query_rows(query, CLICommand.id, self.COMMAND_LIST_COLUMNS, fields, after=after)
+
+    def get_parameter_usage(self, vendor=None, task_type=None, subtask=None):
+        """파라미터 이름별로 해당 파라미터를 받는 명령어 수를 반환합니다."""
+        query = db.session.query(CommandParameter.name, func.count(CommandParameter.command_id))
+        if vendor:
+            query = query.filter(CommandParameter.vendor == vendor)
+        if task_type:
+            query = query.filter(CommandParameter.task_type == task_type)
+        if subtask:
+            query = query.filter(CommandParameter.subtask == subtask)
+        rows = query.group_by(CommandParameter.name).order_by(CommandParameter.name).all()
+        return [{'name': name, 'count': count} for name, count in rows]
+
     def get_vendor_templates(self, vendor):
         """특정 벤더의 명령어 템플릿 목록을 반환합니다."""
         try:
@@ -0,0 +1,235 @@
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# 파일 단위 병렬 처리를 시작하는 최소 파일 수
+PARALLEL_MIN_FILES = 4
+
+# 장비별 실행 결과 디렉토리의 상위 디렉토리 (<RESULTS_ROOT>/<장비 ID>/results/)
+RESULTS_ROOT = 'config/tasks'
+
+# 학습에서 제외할 줄 (주석, 배너, 장비 출력 머리말 등)
+SKIP_LINE_PATTERN = re.compile(
+    r'^(!|#|end$|exit$|Building configuration|Current configuration|version |\S+[#>]\s*$)'
+)
+
+# 키워드 다음 토큰을 자리표시자로 치환하는 규칙 (키워드 -> 파라미터 이름)
+KEYWORD_PARAMS = {
+    'vlan': 'vlan_id',
+    'vlans': 'vlan_name',
+    'vlan-id': 'vlan_id',
+    'hostname': 'hostname',
+    'host-name': 'hostname',
+    'name': 'name',
+    'username': 'username',
+    'area': 'area_id',
+    'ospf': 'process_id',
+    'eigrp': 'as_number',
+    'bgp': 'as_number',
+    'remote-as': 'remote_as',
+    'community': 'community',
+    'priority': 'priority',
+    'channel-group': 'channel_group',
+    'access-list': 'acl_id',
+    'access-group': 'acl_id',
+    'unit': 'unit',
+    'members': 'vlan_id',
+}
+
+# 이후 줄 끝까지를 하나의 자리표시자로 치환하는 키워드
+REST_OF_LINE_PARAMS = {
+    'description': 'description',
+    'banner': 'banner',
+    'secret': 'password',
+    'password': 'password',
+    'key': 'key',
+}
+
+# 값 형태에 따른 자리표시자 치환 규칙 (순서대로 적용)
+VALUE_PATTERNS = [
+    (re.compile(r'^\d{1,3}(\.\d{1,3}){3}/\d{1,2}$'), 'ip_prefix'),
+    (re.compile(r'^255(\.\d{1,3}){3}$'), 'subnet_mask'),
+    (re.compile(r'^(?!0\.0\.0\.0$)0(\.\d{1,3}){3}$'), 'wildcard_mask'),
+    (re.compile(r'^\d{1,3}(\.\d{1,3}){3}$'), 'ip_address'),
+    (re.compile(r'^[0-9a-f]{4}\.[0-9a-f]{4}\.[0-9a-f]{4}$', re.I), 'mac_address'),
+    (re.compile(
+        r'^(GigabitEthernet|FastEthernet|TenGigabitEthernet|TwentyFiveGigE|FortyGigabitEthernet|'
+        r'HundredGigE|Ethernet|Port-channel|Vlan|Loopback|Tunnel|Management|mgmt|'
+        r'Gi|Fa|Te|Eth?|Po|Lo)\d[\d/.:]*$', re.I), 'interface_name'),
+    (re.compile(r'^(ge|xe|et|ae|irb|lo|me|em|fxp)-?\d[\d/.:]*$', re.I), 'interface_name'),
+    (re.compile(r'^\d+([,-]\d+)*$'), 'number'),
+    (re.compile(r'^".*"$'), 'text'),
+]
+
+PLACEHOLDER_PATTERN = re.compile(r'\{(\w+)\}')
+
+
+def number_placeholders(template):
+    """템플릿에 두 번 이상 나오는 자리표시자에 순번을 붙입니다.
+
+    (예: 'ip route {ip_address} {subnet_mask} {ip_address}'
+         -> 'ip route {ip_address_1} {subnet_mask} {ip_address_2}')
+    """
+    counts = Counter(PLACEHOLDER_PATTERN.findall(template))
+    if not counts or max(counts.values()) < 2:
+        return template
+    seen = Counter()
+
+    def replace(match):
+        name = match.group(1)
+        if counts[name] < 2:
+            return match.group(0)
+        seen[name] += 1
+        return '{%s_%d}' % (name, seen[name])
+
+    return PLACEHOLDER_PATTERN.sub(replace, template)
+
+
+def abstract_line(line):
+    """설정 한 줄의 값을 자리표시자로 치환하여 명령어 템플릿을 반환합니다."""
+    return number_placeholders(_abstract_line(line))
+
+
+def _abstract_line(line):
+    tokens = line.split()
+    result = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        lowered = token.lower()
+        result.append(token)
+
+        if lowered in REST_OF_LINE_PARAMS and i + 1 < len(tokens):
+            result.append('{' + REST_OF_LINE_PARAMS[lowered] + '}')
+            break
+
+        param = KEYWORD_PARAMS.get(lowered)
+        if param and i + 1 < len(tokens):
+            following = tokens[i + 1]
+            if any(pattern.match(following) for pattern, _ in VALUE_PATTERNS) or lowered in (
+                    'vlans', 'hostname', 'host-name', 'name', 'username', 'community'):
+                result.append('{' + param + '}')
+                i += 2
+                continue
+
+        if i > 0:
+            for pattern, name in VALUE_PATTERNS:
+                if pattern.match(token):
+                    result[-1] = '{' + name + '}'
+                    break
+        i += 1
+    return ' '.join(result)
+
+
+def iter_config_templates(lines):
+    """설정 줄을 순차적으로 읽어 계층형 명령어 템플릿을 생성합니다.
+
+    들여쓰기로 표현된 하위 설정은 모든 상위 템플릿과 줄바꿈으로 연결되며, 연결된
+    템플릿 안에서 반복되는 자리표시자에는 순번을 붙입니다.
+    (예: 'router bgp {as_number}\\naddress-family ipv4\\nneighbor {ip_address} activate')
+    """
+    stack = []  # [(들여쓰기, 템플릿)] (순번을 붙이기 전)
+    for raw in lines:
+        line = raw.rstrip('\r\n')
+        stripped = line.strip()
+        if not stripped or SKIP_LINE_PATTERN.match(stripped):
+            if stripped.startswith('!') or not stripped:
+                stack = []
+            continue
+
+        indent = len(line) - len(line.lstrip(' '))
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+
+        stack.append((indent, _abstract_line(stripped)))
+        yield number_placeholders('\n'.join(template for _, template in stack))
+
+
+def parse_config_file(path):
+    """running-config 파일 하나를 스트리밍으로 파싱하여 템플릿 빈도를 반환합니다."""
+    counts = Counter()
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for template in iter_config_templates(f):
+            counts[template] += 1
+    return path, counts
+
+
+def is_result_path(path, results_root=RESULTS_ROOT):
+    """경로가 실행 결과 디렉토리(<results_root>/<장비 ID>/results/) 안에 있는지 확인합니다.
+
+    심볼릭 링크와 '..' 를 해석한 실제 경로로 비교합니다.
+    """
+    try:
+        relative = os.path.relpath(os.path.realpath(path), os.path.realpath(results_root))
+    except ValueError:  # 다른 드라이브의 경로 (Windows)
+        return False
+    parts = relative.split(os.sep)
+    return parts[0] != os.pardir and len(parts) >= 3 and parts[1] == 'results'
+
+
+def collect_running_configs(results_root=RESULTS_ROOT, device_ids=None):
+    """실행 결과 디렉토리에서 running-config 출력 파일을 찾습니다.
+
+    device_ids 가 주어지면 해당 장비의 결과 디렉토리만 확인합니다.
+    """
+    paths = []
+    if not os.path.isdir(results_root):
+        return paths
+    names = os.listdir(results_root)
+    if device_ids is not None:
+        wanted = {str(device_id) for device_id in device_ids}
+        names = [name for name in names if name in wanted]
+    for device_id in sorted(names):
+        result_dir = os.path.join(results_root, device_id, 'results')
+        if not os.path.isdir(result_dir):
+            continue
+        for filename in sorted(os.listdir(result_dir)):
+            path = os.path.join(result_dir, filename)
+            if not os.path.isfile(path):
+                continue
+            lowered = filename.lower()
+            if 'running' in lowered or lowered.endswith(('.cfg', '.conf')):
+                paths.append(path)
+                continue
+            if lowered.startswith('result_') and lowered.endswith('.txt'):
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    head = f.read(4096)
+                if 'Building configuration' in head or 'Current configuration' in head:
+                    paths.append(path)
+    return paths
+
+
+def learn_config_templates(paths, workers=None):
+    """여러 running-config 파일을 프로세스 풀로 나누어 파싱하고 템플릿 빈도를 합산합니다.
+
+    Returns:
+        tuple: (템플릿 빈도 Counter, 처리한 파일 수, 실패한 파일 목록)
+    """
+    totals = Counter()
+    failed = []
+    processed = 0
+
+    if len(paths) < PARALLEL_MIN_FILES or workers == 1:
+        for path in paths:
+            try:
+                _, counts = parse_config_file(path)
+            except OSError as e:
+                failed.append({'path': path, 'error': str(e)})
+                continue
+            totals.update(counts)
+            processed += 1
+        return totals, processed, failed
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(parse_config_file, path): path for path in paths}
+        # 완료된 순서대로 합산하여 결과를 모두 메모리에 쌓아두지 않음
+        for future in as_completed(futures):
+            try:
+                _, counts = future.result()
+            except Exception as e:
+                failed.append({'path': futures[future], 'error': str(e)})
+                continue
+            totals.update(counts)
+            processed += 1
+    return totals, processed, failed
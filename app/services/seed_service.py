@@ -0,0 +1,105 @@
+import hashlib
+import json
+from datetime import datetime
+
+from app.database import db
+from ..models.seed_version import SeedVersion
+from ..models.task_type import TaskType
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 기본 작업 유형 (seed). 내용이 바뀌면 다음 적용 시 upsert 됩니다.
+DEFAULT_TASK_TYPES = [
+    {"name": "VLAN 관리", "description": "VLAN 생성/삭제, 인터페이스 VLAN 할당, 트렁크 설정", "vendor": "all"},
+    {"name": "포트 설정", "description": "액세스/트렁크 모드 설정, 포트 속도/듀플렉스 조정, 인터페이스 활성화", "vendor": "all"},
+    {"name": "라우팅 설정", "description": "정적 라우팅, OSPF, EIGRP, BGP 설정 및 관리", "vendor": "all"},
+    {"name": "보안 설정", "description": "Port Security, SSH/Telnet 제한, AAA 인증, ACL 설정", "vendor": "all"},
+    {"name": "STP 및 LACP", "description": "STP(RSTP/PVST) 설정, LACP/포트 채널 구성", "vendor": "all"},
+    {"name": "QoS 및 트래픽 제어", "description": "QoS 정책 적용, 트래픽 제한, 서비스 정책 설정", "vendor": "all"},
+    {"name": "라우팅 상태 모니터링", "description": "라우팅 테이블, OSPF 이웃, BGP 요약 정보 확인", "vendor": "all"},
+    {"name": "네트워크 상태 점검", "description": "인터페이스 상태 확인, 트래픽 모니터링", "vendor": "all"},
+    {"name": "로그 수집", "description": "로깅 명령 실행 후 파일 저장", "vendor": "all"},
+    {"name": "구성 백업 및 복원", "description": "Running-config/Startup-config 백업 및 복원, TFTP 설정", "vendor": "all"},
+    {"name": "SNMP 및 모니터링", "description": "SNMP 설정, CDP/LLDP 정보 수집", "vendor": "all"},
+    {"name": "자동화 스크립트 확장", "description": "여러 장비에 설정 배포, 특정 조건 검증 후 자동 변경 적용", "vendor": "all"}
+]
+
+TASK_TYPES_SEED = 'task_types'
+
+
+def seed_hash(rows):
+    """seed 내용의 SHA-256 해시 (행 순서와 키 순서에 무관)"""
+    canonical = json.dumps(sorted(rows, key=lambda row: (row['name'], row.get('vendor') or '')),
+                           ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class SeedService:
+    """기본 데이터를 버전이 있는 fixture 로 적용합니다.
+
+    seed 내용 해시를 seed_versions 테이블에 기록하고, 해시가 같으면 조회 한 번으로
+    끝나므로 반복 호출해도 쓰기가 발생하지 않습니다. 해시가 바뀌면 전체 삭제 대신
+    (name, vendor) 기준으로 upsert 하여 기존 행의 ID 를 유지하고, 이전 seed 에만 있던
+    행만 삭제합니다. 사용자가 추가한 작업 유형은 건드리지 않습니다.
+    """
+
+    def get_version(self, name=TASK_TYPES_SEED):
+        return db.session.get(SeedVersion, name)
+
+    def apply_task_types(self, rows=None, force=False):
+        """기본 작업 유형 seed 를 적용합니다.
+
+        Args:
+            rows: seed 행 목록 (기본값 DEFAULT_TASK_TYPES)
+            force: 해시가 같아도 upsert 를 수행 (테이블이 비어 있는 경우 등)
+
+        Returns:
+            dict: {'applied': bool, 'inserted', 'updated', 'deleted', 'content_hash'}
+        """
+        rows = rows if rows is not None else DEFAULT_TASK_TYPES
+        content_hash = seed_hash(rows)
+        version = self.get_version(TASK_TYPES_SEED)
+        result = {'applied': False, 'inserted': 0, 'updated': 0, 'deleted': 0, 'content_hash': content_hash}
+        if version is not None and version.content_hash == content_hash and not force:
+            return result
+
+        try:
+            keys = [[row['name'], row.get('vendor')] for row in rows]
+            existing = {(task_type.name, task_type.vendor): task_type
+                        for task_type in TaskType.query.filter(TaskType.name.in_([row['name'] for row in rows]))}
+
+            for row in rows:
+                task_type = existing.get((row['name'], row.get('vendor')))
+                if task_type is None:
+                    db.session.add(TaskType(name=row['name'], description=row.get('description'),
+                                            vendor=row.get('vendor'), template_key=row.get('template_key')))
+                    result['inserted'] += 1
+                elif task_type.description != row.get('description') or \
+                        task_type.template_key != row.get('template_key'):
+                    task_type.description = row.get('description')
+                    task_type.template_key = row.get('template_key')
+                    result['updated'] += 1
+
+            # 이전 seed 에만 있던 행 삭제
+            current = {tuple(key) for key in keys}
+            for name, vendor in (version.keys or []) if version is not None else []:
+                if (name, vendor) not in current:
+                    result['deleted'] += TaskType.query.filter_by(name=name, vendor=vendor).delete()
+
+            if version is None:
+                version = SeedVersion(name=TASK_TYPES_SEED, content_hash=content_hash)
+                db.session.add(version)
+            version.content_hash = content_hash
+            version.keys = keys
+            version.applied_at = datetime.utcnow()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"작업 유형 seed 적용 실패: {str(e)}")
+            raise
+
+        result['applied'] = True
+        logger.info(f"작업 유형 seed 적용: 추가 {result['inserted']}, 수정 {result['updated']}, "
+                    f"삭제 {result['deleted']} ({content_hash[:8]})")
+        return result
@@ -0,0 +1,142 @@
+import json
+import logging
+import os
+from collections import defaultdict
+
+from ..utils.file_handler import ensure_directory_exists
+
+logger = logging.getLogger(__name__)
+
+# 실행 결과 파일(result_*.txt) 옆에 저장하는 단계별 소요 시간 파일 확장자
+TIMING_SUFFIX = '.timing.json'
+PERCENTILES = (50, 90, 95, 99)
+GROUP_BY_FIELDS = ('vendor', 'device')
+
+
+def percentile(sorted_values, q):
+    """정렬된 값 목록의 q 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(values):
+    """소요 시간(ms) 목록의 개수, 백분위수, 최댓값"""
+    ordered = sorted(values)
+    summary = {'count': len(ordered)}
+    for q in PERCENTILES:
+        value = percentile(ordered, q)
+        summary[f'p{q}'] = round(value, 3) if value is not None else None
+    summary['max'] = ordered[-1] if ordered else None
+    return summary
+
+
+class TimingService:
+    """장비 실행별 단계 소요 시간 저장 및 벤더/장비별 백분위수 요약
+
+    실행 한 번의 기록은 config/tasks/<장비>/results/<결과 파일>.timing.json 에
+    결과 파일과 나란히 저장합니다.
+    """
+
+    def __init__(self, base_dir='config/tasks'):
+        self.base_dir = base_dir
+
+    def _result_dir(self, device_id):
+        """장비의 결과 디렉토리 경로. 경로 구분자나 '..' 가 들어간 장비 ID 는 거부합니다."""
+        device_id = str(device_id)
+        if not device_id or device_id in ('.', '..') or '/' in device_id or '\\' in device_id:
+            raise ValueError(f"잘못된 장비 ID 입니다: {device_id}")
+        return os.path.join(self.base_dir, device_id, 'results')
+
+    def save(self, device_id, result_filename, timings, vendor=None, status='success'):
+        """실행 한 번의 소요 시간 기록을 결과 파일 옆에 저장하고 경로를 반환합니다.
+
+        Args:
+            device_id (str): 장비 ID
+            result_filename (str): 같은 디렉토리의 실행 결과 파일 이름
+            timings (dict): PhaseTimer.to_dict() 결과
+            vendor (str): 장비 벤더
+            status (str): 실행 결과 상태
+        """
+        result_dir = self._result_dir(device_id)
+        ensure_directory_exists(result_dir)
+        record = dict(timings, device_id=str(device_id), vendor=vendor or 'unknown',
+                      status=status, result_file=result_filename)
+        path = os.path.join(result_dir, os.path.splitext(result_filename)[0] + TIMING_SUFFIX)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, indent=2)
+        return path
+
+    def iter_records(self, device_id=None, vendor=None):
+        """저장된 소요 시간 기록을 하나씩 반환합니다 (장비/벤더로 필터링)."""
+        if device_id is not None:
+            result_dirs = [self._result_dir(device_id)]
+        elif os.path.isdir(self.base_dir):
+            result_dirs = [os.path.join(self.base_dir, name, 'results') for name in sorted(os.listdir(self.base_dir))]
+        else:
+            return
+        for result_dir in result_dirs:
+            if not os.path.isdir(result_dir):
+                continue
+            for name in sorted(os.listdir(result_dir)):
+                if not name.endswith(TIMING_SUFFIX):
+                    continue
+                try:
+                    with open(os.path.join(result_dir, name), 'r', encoding='utf-8') as f:
+                        record = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"소요 시간 기록을 읽을 수 없습니다: {name} ({str(e)})")
+                    continue
+                if vendor and record.get('vendor') != vendor:
+                    continue
+                yield record
+
+    def summary(self, group_by='vendor', device_id=None, vendor=None, slowest=10):
+        """벤더 또는 장비별 단계/명령어 소요 시간 백분위수 요약
+
+        Returns:
+            dict: groups (그룹별 전체/단계별/명령어 왕복 요약),
+                  slow_commands (p95 가 큰 명령어), slowest_executions (전체 시간이 큰 실행)
+        """
+        if group_by not in GROUP_BY_FIELDS:
+            raise ValueError(f"group_by 는 {', '.join(GROUP_BY_FIELDS)} 중 하나여야 합니다.")
+
+        groups = defaultdict(lambda: {'total': [], 'phases': defaultdict(list), 'commands': []})
+        commands = defaultdict(list)
+        executions = []
+        for record in self.iter_records(device_id=device_id, vendor=vendor):
+            key = record.get('vendor') if group_by == 'vendor' else record.get('device_id')
+            group = groups[key]
+            group['total'].append(record.get('total_ms', 0))
+            for phase, ms in record.get('phases', {}).items():
+                group['phases'][phase].append(ms)
+            for entry in record.get('commands', []):
+                group['commands'].append(entry['ms'])
+                commands[(record.get('vendor'), entry['command'])].append(entry['ms'])
+            executions.append({'device_id': record.get('device_id'), 'vendor': record.get('vendor'),
+                               'started_at': record.get('started_at'), 'total_ms': record.get('total_ms', 0),
+                               'result_file': record.get('result_file')})
+
+        slow_commands = sorted(
+            ({'vendor': command_vendor, 'command': command, **summarize(values)}
+             for (command_vendor, command), values in commands.items()),
+            key=lambda item: item['p95'], reverse=True)
+
+        return {
+            'group_by': group_by,
+            'executions': len(executions),
+            'groups': {
+                key: {
+                    'executions': len(group['total']),
+                    'total_ms': summarize(group['total']),
+                    'phases': {phase: summarize(values) for phase, values in sorted(group['phases'].items())},
+                    'command_round_trip_ms': summarize(group['commands'])
+                }
+                for key, group in sorted(groups.items(), key=lambda item: str(item[0]))
+            },
+            'slow_commands': slow_commands[:slowest],
+            'slowest_executions': sorted(executions, key=lambda item: item['total_ms'], reverse=True)[:slowest]
+        }
@@ -0,0 +1,63 @@
+import hashlib
+import threading
+
+from flask import current_app, request
+
+
+class CatalogEntry:
+    """직렬화된 응답 본문과 내용 해시 ETag"""
+
+    def __init__(self, body):
+        self.body = body
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+
+
+class CatalogCache:
+    """관리자가 수정할 때만 바뀌는 카탈로그 응답(작업 유형, 상세 작업, 파라미터) 캐시
+
+    응답을 한 번만 직렬화하여 보관하고, 내용 해시를 ETag 로 사용하여
+    If-None-Match 요청에는 본문 없이 304 로 응답합니다.
+    데이터가 바뀌면 invalidate() 로 해당 항목을 버립니다.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, builder):
+        """key 의 캐시 항목을 반환합니다. 없으면 builder() 결과를 직렬화하여 저장합니다.
+
+        빈 결과는 저장하지 않습니다 (존재하지 않는 키 요청으로 캐시가 커지지 않도록).
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            data = builder()
+            entry = CatalogEntry((current_app.json.dumps(data) + '\n').encode('utf-8'))
+            if data:
+                with self._lock:
+                    self._entries[key] = entry
+        return entry
+
+    def invalidate(self, namespace=None):
+        """namespace (키 튜플의 첫 요소) 항목을 버립니다. None 이면 전체를 버립니다."""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == namespace]:
+                    del self._entries[key]
+
+    def response(self, key, builder):
+        """캐시된 본문으로 ETag 조건부 응답을 만듭니다 (If-None-Match 일치 시 304)."""
+        entry = self.get(key, builder)
+        response = current_app.response_class(entry.body, mimetype='application/json')
+        response.set_etag(entry.etag)
+        # 캐시는 허용하되 매번 ETag 로 재검증
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
+
+
+catalog_cache = CatalogCache()
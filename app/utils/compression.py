@@ -0,0 +1,78 @@
+import gzip
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # brotli 는 선택 의존성 (없으면 gzip 만 사용)
+    brotli = None
+
+# 압축 대상 MIME 타입
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/javascript',
+    'text/javascript',
+    'text/css',
+    'text/html',
+    'text/plain',
+    'image/svg+xml'
+}
+
+# 이보다 작은 응답은 압축 이득보다 비용이 커서 그대로 전송
+DEFAULT_MIN_SIZE = 1024
+DEFAULT_GZIP_LEVEL = 6
+DEFAULT_BROTLI_QUALITY = 5
+
+
+def compress(data, encoding, gzip_level=DEFAULT_GZIP_LEVEL, brotli_quality=DEFAULT_BROTLI_QUALITY):
+    if encoding == 'br':
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+def available_encodings():
+    """서버가 지원하는 Content-Encoding (선호 순)"""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def choose_encoding(accept_encodings, encodings=None):
+    """Accept-Encoding 헤더에서 클라이언트가 받을 수 있는 가장 좋은 인코딩을 고릅니다."""
+    for encoding in encodings or available_encodings():
+        if accept_encodings[encoding] > 0:
+            return encoding
+    return None
+
+
+def init_compression(app):
+    """임계값 이상의 텍스트/JSON 응답을 brotli 또는 gzip 으로 압축하는 after_request 훅을 등록합니다.
+
+    스트리밍 응답(NDJSON, SSE)과 파일 전송 응답은 압축하지 않습니다.
+    압축하면 바이트가 달라지므로 기존 ETag 는 약한 ETag 로 바꿉니다.
+    """
+    min_size = app.config.get('COMPRESS_MIN_SIZE', DEFAULT_MIN_SIZE)
+    gzip_level = app.config.get('COMPRESS_GZIP_LEVEL', DEFAULT_GZIP_LEVEL)
+    brotli_quality = app.config.get('COMPRESS_BROTLI_QUALITY', DEFAULT_BROTLI_QUALITY)
+
+    @app.after_request
+    def compress_response(response):
+        if not app.config.get('COMPRESS_ENABLED', True):
+            return response
+        if response.status_code != 200 or response.direct_passthrough or response.is_streamed:
+            return response
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES or 'Content-Encoding' in response.headers:
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = choose_encoding(request.accept_encodings)
+        if encoding is None:
+            return response
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+
+        response.set_data(compress(data, encoding, gzip_level, brotli_quality))
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
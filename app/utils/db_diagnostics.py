@@ -0,0 +1,140 @@
+from sqlalchemy import inspect, select, text
+from sqlalchemy.exc import IntegrityError, OperationalError, SQLAlchemyError
+
+from app.database import db
+from app.models.cli_command import CLICommand, CommandParameter
+from app.models.device import Device
+from app.models.task import Task
+from app.models.task_type import TaskType
+from app.models.subtask import Subtask
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def hot_queries():
+    """자주 실행되는 조회 쿼리 목록 (이름, SELECT 문)
+
+    값은 실행 계획에 영향을 주지 않으므로 임의의 예시 값을 사용합니다.
+    """
+    return [
+        ('cli_commands.get_by_task',
+         select(CLICommand).where(CLICommand.task_type == 'VLAN 관리', CLICommand.subtask == 'VLAN 생성')),
+        ('cli_commands.get_by_vendor',
+         select(CLICommand).where(CLICommand.vendor == 'cisco')),
+        ('cli_commands.get_by_device_type',
+         select(CLICommand).where(CLICommand.device_type == 'switch')),
+        ('cli_commands.identity',
+         select(CLICommand).where(CLICommand.vendor == 'cisco', CLICommand.device_type == 'switch',
+                                  CLICommand.task_type == 'VLAN 관리', CLICommand.subtask == 'VLAN 생성')),
+        ('cli_command_parameters.by_name',
+         select(CommandParameter.command_id).where(CommandParameter.name == 'vlan_id')),
+        ('devices.ip_address',
+         select(Device).where(Device.ip_address == '192.168.0.1')),
+        ('tasks.by_device',
+         select(Task).where(Task.device_id == 1)),
+        ('task_types.name_vendor',
+         select(TaskType).where(TaskType.name == 'VLAN 관리', TaskType.vendor == 'cisco')),
+        ('subtasks.by_task_type',
+         select(Subtask).where(Subtask.task_type == 'VLAN 관리'))
+    ]
+
+
+def ensure_columns(engine):
+    """모델에 선언된 컬럼 중 기존 테이블에 없는 컬럼을 추가합니다.
+
+    create_all 은 이미 있는 테이블을 변경하지 않으므로 컬럼이 추가되기 전의 DB 에
+    ALTER TABLE ADD COLUMN 으로 보완합니다. 기존 행에 채울 값이 없는 NOT NULL 컬럼은
+    추가하지 않고 경고만 남깁니다.
+
+    Returns:
+        list: 추가한 '테이블.컬럼' 이름 목록
+    """
+    inspector = inspect(engine)
+    quote = engine.dialect.identifier_preparer.quote
+    added = []
+    with engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                name = f'{table.name}.{column.name}'
+                if not column.nullable:
+                    logger.warning(f"컬럼 추가 불가 ({name}): NOT NULL 컬럼은 DB 를 다시 만들어야 합니다.")
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(text(
+                    f'ALTER TABLE {quote(table.name)} ADD COLUMN {quote(column.name)} {column_type}'))
+                added.append(name)
+                logger.info(f"컬럼 추가: {name}")
+    return added
+
+
+def ensure_indexes(engine):
+    """모델에 선언된 인덱스 중 기존 DB 에 없는 인덱스를 생성합니다.
+
+    create_all 은 이미 있는 테이블에 인덱스를 추가하지 않으므로 기존 DB 에서도
+    인덱스를 보장하기 위해 사용합니다. 중복 데이터 때문에 고유 인덱스를 만들 수
+    없는 경우 경고만 남깁니다.
+
+    Returns:
+        list: 생성하지 못한 인덱스 이름 목록
+    """
+    failed = []
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except (IntegrityError, OperationalError) as e:
+                failed.append(index.name)
+                logger.warning(f"인덱스 생성 실패 ({index.name}): 중복 데이터를 정리해야 합니다. {str(e.orig)}")
+    return failed
+
+
+def explain_query_plans(engine):
+    """핫 쿼리의 SQLite EXPLAIN QUERY PLAN 결과를 반환합니다.
+
+    스키마가 모델보다 오래된 DB (컬럼 누락 등) 에서는 해당 쿼리만 건너뛰고
+    'error' 에 사유를 남깁니다.
+
+    Returns:
+        list: [{'name', 'sql', 'plan': [str, ...], 'full_scan': bool, 'error': str|None}, ...]
+            SQLite 가 아닌 DB 에서는 빈 목록
+    """
+    if engine.dialect.name != 'sqlite':
+        return []
+
+    reports = []
+    with engine.connect() as connection:
+        for name, statement in hot_queries():
+            sql = str(statement.compile(dialect=engine.dialect, compile_kwargs={'literal_binds': True}))
+            try:
+                rows = connection.execute(text(f'EXPLAIN QUERY PLAN {sql}')).fetchall()
+            except SQLAlchemyError as e:
+                connection.rollback()
+                error = str(getattr(e, 'orig', None) or e)
+                logger.warning(f"실행 계획 확인 실패 ({name}): {error}")
+                reports.append({'name': name, 'sql': sql, 'plan': [], 'full_scan': False, 'error': error})
+                continue
+            plan = [row[-1] for row in rows]
+            reports.append({
+                'name': name,
+                'sql': sql,
+                'plan': plan,
+                # 'SCAN tbl' 은 전체 스캔, 'SCAN tbl USING INDEX ..' 는 인덱스 순회
+                'full_scan': any(detail.startswith('SCAN ') and 'USING' not in detail for detail in plan),
+                'error': None
+            })
+    return reports
+
+
+def report_query_plans(engine):
+    """핫 쿼리 실행 계획을 확인하고 전체 테이블 스캔으로 바뀐 쿼리를 경고로 기록합니다."""
+    reports = explain_query_plans(engine)
+    for report in reports:
+        if report['full_scan']:
+            logger.warning(f"전체 테이블 스캔 쿼리: {report['name']} -> {' / '.join(report['plan'])}")
+    return reports
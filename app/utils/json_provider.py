@@ -0,0 +1,81 @@
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date, datetime, time
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson 은 선택 의존성 (없으면 표준 json 사용)
+    orjson = None
+
+
+def _default(obj):
+    """표준 json 이 직접 직렬화하지 못하는 값 변환 (datetime 은 ISO 8601 문자열)"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def dumps_bytes(obj, sort_keys=False, indent=False):
+    """obj 를 UTF-8 JSON 바이트로 직렬화합니다.
+
+    orjson 이 설치되어 있으면 orjson 을 사용하고, orjson 이 처리하지 못하는 값
+    (64비트를 넘는 정수 등)이나 orjson 이 없는 경우에는 표준 json 으로 처리합니다.
+    두 경우 모두 datetime 은 ISO 8601 문자열로 직렬화됩니다.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_default, option=option)
+        except TypeError:
+            pass
+    return json.dumps(obj, default=_default, ensure_ascii=False, sort_keys=sort_keys,
+                      indent=2 if indent else None,
+                      separators=None if indent else (',', ':')).encode('utf-8')
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """jsonify / app.json 용 JSON 공급자
+
+    orjson 이 설치되어 있으면 orjson 으로 직렬화하고 응답 본문을 문자열 변환 없이
+    바이트로 바로 만듭니다. datetime 은 (Flask 기본값인 HTTP 날짜 대신) ISO 8601
+    문자열로 직렬화하므로 to_dict 에서 isoformat() 을 호출하지 않아도 됩니다.
+    비ASCII 문자는 이스케이프하지 않고 UTF-8 그대로 내보냅니다.
+    """
+
+    default = staticmethod(_default)
+
+    def dumps(self, obj, **kwargs):
+        # cls, indent=4 등 표준 json 옵션을 직접 넘긴 호출은 표준 json 으로 처리
+        if kwargs:
+            kwargs.setdefault('default', _default)
+            kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+            kwargs.setdefault('sort_keys', self.sort_keys)
+            return json.dumps(obj, **kwargs)
+        return dumps_bytes(obj, sort_keys=self.sort_keys).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        body = dumps_bytes(obj, sort_keys=self.sort_keys, indent=indent) + b'\n'
+        return self._app.response_class(body, mimetype=self.mimetype)
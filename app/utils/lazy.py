@@ -0,0 +1,48 @@
+import threading
+
+
+class LazyService:
+    """첫 사용 시점에 서비스 인스턴스를 만드는 지연 팩토리
+
+    라우트 모듈에서 `learning_service = LazyService(LearningService)` 처럼 선언하면
+    모듈 import 시에는 아무 작업도 하지 않고, 속성에 처음 접근할 때 factory() 를
+    한 번만 호출하여 만든 인스턴스로 위임합니다. 따라서 앱 import / create_app 이
+    서비스 초기화(디렉토리 탐색, JSON 파일 로드)를 기다리지 않습니다.
+    """
+
+    __slots__ = ('_factory', '_instance', '_lock')
+
+    def __init__(self, factory):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def get(self):
+        """서비스 인스턴스를 반환합니다 (처음 호출 시 생성)."""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = self._factory()
+                    object.__setattr__(self, '_instance', instance)
+        return instance
+
+    @property
+    def initialized(self):
+        return self._instance is not None
+
+    def reset(self):
+        """생성된 인스턴스를 버립니다. 다음 접근 시 다시 생성합니다."""
+        with self._lock:
+            object.__setattr__(self, '_instance', None)
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.get(), name, value)
+
+    def __repr__(self):
+        state = repr(self._instance) if self._instance is not None else 'not initialized'
+        return f'<LazyService {getattr(self._factory, "__name__", self._factory)}: {state}>'
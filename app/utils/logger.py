@@ -1,35 +1,207 @@
+import atexit
+import itertools
+import json
 import logging
 import os
+import queue
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_DIR = 'logs'
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# DEBUG 이하 레코드는 같은 호출 위치(로거, 줄 번호)마다 처음 DEBUG_SAMPLE_BURST 개를
+# 기록한 뒤에는 DEBUG_SAMPLE_RATE 개 중 1개만 기록 (1 이면 샘플링 안 함)
+DEFAULT_DEBUG_SAMPLE_RATE = 10
+DEBUG_SAMPLE_BURST = 20
+
+# 로그에 남기는 페이로드/장비 출력의 최대 길이 (문자 수, 초과분은 잘라냄)
+MAX_LOG_PAYLOAD = 2000
+MAX_DEVICE_OUTPUT_LOG = 4000
+
+
+class DebugSamplingFilter(logging.Filter):
+    """대량으로 발생하는 DEBUG 레코드를 호출 위치별로 샘플링합니다.
+
+    큐에 넣기 전에 적용되므로 버려지는 레코드는 복사/포맷 비용이 들지 않습니다.
+    카운터는 itertools.count 로 증가시켜 요청 스레드에서 잠금을 잡지 않습니다.
+    """
+
+    def __init__(self, rate=DEFAULT_DEBUG_SAMPLE_RATE, burst=DEBUG_SAMPLE_BURST):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self._counters = {}
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.rate <= 1:
+            return True
+        key = (record.name, record.lineno)
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters.setdefault(key, itertools.count())
+        seen = next(counter)
+        return seen < self.burst or (seen - self.burst) % self.rate == 0
+
+
+class LoggingPipeline:
+    """루트 로거의 QueueHandler 와 단일 QueueListener(쓰기 스레드)로 구성된 로깅 파이프라인
+
+    요청 처리 스레드는 레코드를 큐에 넣기만 하고, 파일/콘솔 쓰기는 리스너 스레드가
+    전담합니다. 핸들러는 프로세스당 한 번만 만들며 같은 파일을 다시 등록해도
+    중복되지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queue = queue.SimpleQueue()
+        self._handlers = {}  # 키 (파일 경로 등) -> 출력 핸들러
+        self._listener = None
+        self.queue_handler = None
+        self.sampling_filter = DebugSamplingFilter()
+
+    @property
+    def configured(self):
+        return self.queue_handler is not None
+
+    def configure(self, level=None, log_dir=LOG_DIR, debug_sample_rate=None):
+        """파이프라인을 설치합니다. 이미 설치되어 있으면 레벨과 샘플링 비율만 바꿉니다."""
+        with self._lock:
+            if not self.configured:
+                os.makedirs(log_dir, exist_ok=True)
+                formatter = logging.Formatter(LOG_FORMAT)
+                console_handler = logging.StreamHandler()
+                console_handler.setFormatter(formatter)
+                self._handlers['console'] = console_handler
+                for path in (os.path.join(log_dir, 'app.log'),
+                             os.path.join(log_dir, f'{datetime.now().strftime("%Y%m%d")}.log')):
+                    file_handler = logging.FileHandler(path, encoding='utf-8', delay=True)
+                    file_handler.setFormatter(formatter)
+                    self._handlers[os.path.abspath(path)] = file_handler
+
+                self.queue_handler = QueueHandler(self._queue)
+                self.queue_handler.addFilter(self.sampling_filter)
+                root = logging.getLogger()
+                # basicConfig 등으로 직접 붙은 핸들러는 큐 파이프라인으로 대체
+                for handler in list(root.handlers):
+                    root.removeHandler(handler)
+                root.addHandler(self.queue_handler)
+                if root.level == logging.WARNING:
+                    root.setLevel(logging.INFO)
+                self._restart_listener()
+                atexit.register(self.shutdown)
+
+            if level is not None:
+                logging.getLogger().setLevel(level)
+            if debug_sample_rate is not None:
+                self.sampling_filter.rate = debug_sample_rate
+
+    def add_file_handler(self, path, max_bytes, backup_count, level=logging.NOTSET, fmt=LOG_FORMAT,
+                         logger_name=None):
+        """회전 파일 출력을 추가합니다. 같은 경로는 한 번만 등록됩니다.
+
+        logger_name 을 주면 해당 로거 계층의 레코드만 이 파일에 기록합니다.
+        """
+        self.configure()
+        key = os.path.abspath(path)
+        with self._lock:
+            if key in self._handlers:
+                return self._handlers[key]
+            os.makedirs(os.path.dirname(key), exist_ok=True)
+            handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count,
+                                          encoding='utf-8', delay=True)
+            handler.setFormatter(logging.Formatter(fmt))
+            handler.setLevel(level)
+            if logger_name:
+                handler.addFilter(logging.Filter(logger_name))
+            self._handlers[key] = handler
+            self._restart_listener()
+            return handler
+
+    def _restart_listener(self):
+        # 리스너의 핸들러 목록은 생성 시 고정되므로 출력이 바뀌면 새로 시작 (stop 은 큐를 비운 뒤 반환)
+        if self._listener is not None:
+            self._listener.stop()
+        self._listener = QueueListener(self._queue, *self._handlers.values(), respect_handler_level=True)
+        self._listener.start()
+
+    def shutdown(self):
+        """남은 레코드를 모두 쓰고 리스너 스레드를 종료합니다."""
+        with self._lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+            for handler in self._handlers.values():
+                try:
+                    handler.flush()
+                except (OSError, ValueError):
+                    # 종료 시점에 이미 닫힌 스트림 (테스트 러너의 stderr 캡처 등)
+                    pass
+
+
+pipeline = LoggingPipeline()
+
+
+def configure_logging(level=None, log_dir=LOG_DIR, debug_sample_rate=None):
+    """큐 기반 로깅 파이프라인을 설치합니다 (여러 번 호출해도 핸들러는 한 번만 생성)."""
+    pipeline.configure(level=level, log_dir=log_dir, debug_sample_rate=debug_sample_rate)
+
 
 def setup_logger(name):
-    # 로그 디렉토리 생성
-    log_dir = 'logs'
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-    # 로그 파일명 설정
-    log_file = os.path.join(log_dir, f'{datetime.now().strftime("%Y%m%d")}.log')
-    
-    # 로거 생성
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-    
-    # 파일 핸들러 설정
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(logging.INFO)
-    
-    # 콘솔 핸들러 설정
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    
-    # 포맷터 설정
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-    
-    # 핸들러 추가
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
-    return logger 
\ No newline at end of file
+    """모듈 로거를 반환합니다.
+
+    핸들러는 루트 로거의 큐 파이프라인 하나만 사용하므로 호출할 때마다
+    핸들러나 파일 디스크립터가 늘어나지 않습니다. 레벨은 지정하지 않으므로
+    (NOTSET) 루트 로거의 레벨(LOG_LEVEL)을 따릅니다.
+    """
+    configure_logging()
+    return logging.getLogger(name)
+
+
+def truncate(text, limit=MAX_LOG_PAYLOAD):
+    """limit 문자를 넘는 텍스트를 잘라내고 원래 길이를 표시합니다."""
+    if limit is None or len(text) <= limit:
+        return text
+    return f'{text[:limit]}... (총 {len(text)}자, {len(text) - limit}자 생략)'
+
+
+class LazyText:
+    """로그 레코드가 실제로 출력될 때만 문자열로 변환되고 길이가 제한되는 값
+
+    logger.debug('실행 결과: %s', LazyText(output)) 처럼 % 인자로 넘기면
+    로그 레벨이나 샘플링으로 버려지는 레코드는 변환/복사 비용이 없습니다.
+    """
+
+    __slots__ = ('value', 'limit')
+
+    def __init__(self, value, limit=MAX_DEVICE_OUTPUT_LOG):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self):
+        return truncate(str(self.value), self.limit)
+
+
+class LazyJSON(LazyText):
+    """출력될 때만 JSON 으로 직렬화되는 로그 인자 (한 줄, 길이 제한)"""
+
+    __slots__ = ()
+
+    def __init__(self, value, limit=MAX_LOG_PAYLOAD):
+        super().__init__(value, limit)
+
+    def __str__(self):
+        return truncate(json.dumps(self.value, ensure_ascii=False, default=str), self.limit)
+
+
+def log_event(logger, level, event, **fields):
+    """구조화된 로그 이벤트를 남깁니다.
+
+    메시지는 '<event> <fields JSON>' 형태이며, 필드는 record.event / record.fields 로도
+    전달되어 핸들러가 구조화된 형식으로 기록할 수 있습니다. 필드 직렬화는 레코드가
+    출력될 때까지 미뤄집니다.
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, '%s %s', event, LazyJSON(fields), stacklevel=2,
+                   extra={'event': event, 'fields': fields})
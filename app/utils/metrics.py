@@ -0,0 +1,209 @@
+import bisect
+import threading
+import time
+
+from flask import Response, g, request
+
+PROMETHEUS_MIMETYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 요청 처리 시간 (초) / 응답 크기 (bytes) 히스토그램 버킷
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000)
+
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+class Metric:
+    """레이블별 값을 보관하는 메트릭 기본 클래스
+
+    갱신은 메트릭마다 하나인 잠금 안에서 dict 값 하나만 바꾸므로 잠금 구간이
+    매우 짧습니다 (운영 환경에서 항상 켜 두어도 되는 수준).
+    """
+
+    type_name = 'untyped'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(labels.get(name, '') for name in self.labelnames)
+
+    def samples(self):
+        """(접미사, 레이블 문자열, 값) 목록"""
+        with self._lock:
+            values = dict(self._values)
+        return [('', _format_labels(self.labelnames, key), value) for key, value in sorted(values.items())]
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type_name}']
+        lines.extend(f'{self.name}{suffix}{labels} {value}' for suffix, labels, value in self.samples())
+        return lines
+
+
+class Counter(Metric):
+    type_name = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    type_name = 'gauge'
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        if not self.labelnames:
+            self._values[()] = 0
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    type_name = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # 버킷별 개수 (+Inf 포함), 합계
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def samples(self):
+        with self._lock:
+            values = {key: (list(counts), total) for key, (counts, total) in self._values.items()}
+        samples = []
+        for key, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                samples.append(('_bucket', _format_labels(self.labelnames, key, ('le', le)), cumulative))
+            samples.append(('_sum', _format_labels(self.labelnames, key), total))
+            samples.append(('_count', _format_labels(self.labelnames, key), cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self):
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)"""
+        lines = []
+        for metric in list(self._metrics):
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+# HTTP 요청
+http_requests_total = registry.counter(
+    'http_requests_total', 'HTTP 요청 수', ('method', 'endpoint', 'status'))
+http_request_duration_seconds = registry.histogram(
+    'http_request_duration_seconds', 'HTTP 요청 처리 시간 (초)', ('method', 'endpoint'))
+http_response_size_bytes = registry.histogram(
+    'http_response_size_bytes', 'HTTP 응답 본문 크기 (bytes, 길이를 모르는 스트리밍 응답 제외)', ('endpoint',), SIZE_BUCKETS)
+http_requests_in_flight = registry.gauge(
+    'http_requests_in_flight', '처리 중인 HTTP 요청 수')
+http_request_errors_total = registry.counter(
+    'http_request_errors_total', '5xx 로 끝난 HTTP 요청 수', ('endpoint', 'status'))
+
+# 장비 작업
+device_connections_total = registry.counter(
+    'device_connections_total', '장비 SSH 연결 시도 수', ('device_type', 'result'))
+device_commands_total = registry.counter(
+    'device_commands_total', '장비로 보낸 명령어 수', ('device_type', 'result'))
+script_renders_total = registry.counter(
+    'script_renders_total', '설정 스크립트 생성 수', ('vendor', 'result'))
+
+
+def _endpoint_label():
+    # URL 대신 엔드포인트 이름을 사용하여 레이블 종류가 라우트 수로 제한되도록 함
+    return request.endpoint or 'unmatched'
+
+
+def init_metrics(app):
+    """요청 지표 수집 훅과 /metrics 엔드포인트를 등록합니다 (METRICS_ENABLED 로 끌 수 있음).
+
+    다른 after_request 훅(압축 등)보다 나중에 실행되도록 create_app 에서 가장 먼저
+    등록해야 실제 전송되는 응답 크기가 기록됩니다.
+    """
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+
+    @app.before_request
+    def start_request_timer():
+        g._metrics_started = time.perf_counter()
+        g._metrics_in_flight = True
+        http_requests_in_flight.inc()
+
+    @app.after_request
+    def record_request_metrics(response):
+        started = g.pop('_metrics_started', None)
+        if started is None:
+            return response
+        endpoint = _endpoint_label()
+        status = str(response.status_code)
+        http_request_duration_seconds.observe(time.perf_counter() - started, method=request.method, endpoint=endpoint)
+        http_requests_total.inc(method=request.method, endpoint=endpoint, status=status)
+        if response.status_code >= 500:
+            http_request_errors_total.inc(endpoint=endpoint, status=status)
+        # 스트리밍 응답은 Content-Length 헤더가 있을 때만 (파일 전송 등) 기록
+        size = response.content_length if response.is_streamed else response.calculate_content_length()
+        if size is not None:
+            http_response_size_bytes.observe(size, endpoint=endpoint)
+        return response
+
+    @app.teardown_request
+    def finish_request(exc):
+        # after_request 가 실행되지 않는 경우에도 처리 중 요청 수는 항상 되돌림
+        if g.pop('_metrics_in_flight', False):
+            http_requests_in_flight.dec()
+
+    @app.route('/metrics')
+    def metrics():
+        return Response(registry.render(), mimetype=PROMETHEUS_MIMETYPE)
@@ -0,0 +1,162 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from app.exceptions import ValidationError
+
+# 한 페이지 기본/최대 행 수
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# 페이지네이션 모드로 전환하는 쿼리 파라미터 (없으면 기존 전체 배열 응답)
+PAGINATION_ARGS = ('limit', 'cursor')
+
+
+class PageRequest:
+    """목록 API 의 페이지 요청 (limit, 커서, fields 프로젝션)
+
+    cursor 는 직전 페이지 마지막 행의 정렬 키이며, 키 이후의 행만 조회하는
+    키셋(커서) 방식이므로 OFFSET 과 달리 뒤쪽 페이지도 조회 비용이 일정합니다.
+    """
+
+    def __init__(self, limit=None, cursor=None, fields=None, paginated=False):
+        self.limit = limit
+        self.cursor = cursor
+        self.fields = fields
+        self.paginated = paginated
+
+
+def encode_cursor(key):
+    """정렬 키 (튜플)를 URL 에 안전한 불투명 문자열로 변환합니다."""
+    raw = json.dumps(list(key), separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """encode_cursor 로 만든 문자열을 정렬 키 튜플로 되돌립니다."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValidationError('잘못된 cursor 값입니다.')
+    if not isinstance(key, list) or not key:
+        raise ValidationError('잘못된 cursor 값입니다.')
+    return tuple(key)
+
+
+def parse_page_request(args, allowed_fields, default_fields=None):
+    """요청 쿼리 파라미터에서 limit, cursor, fields 를 읽습니다.
+
+    Args:
+        args: request.args
+        allowed_fields: fields= 로 선택할 수 있는 필드 이름 목록
+        default_fields: fields 가 없을 때 반환할 필드 (None 이면 항목 전체)
+
+    Raises:
+        ValidationError: limit, cursor, fields 값이 잘못된 경우
+    """
+    paginated = any(args.get(name) for name in PAGINATION_ARGS)
+
+    limit = DEFAULT_PAGE_SIZE
+    if args.get('limit'):
+        try:
+            limit = int(args['limit'])
+        except ValueError:
+            raise ValidationError('limit 은 정수여야 합니다.')
+        if limit < 1 or limit > MAX_PAGE_SIZE:
+            raise ValidationError(f'limit 은 1 이상 {MAX_PAGE_SIZE} 이하여야 합니다.')
+
+    cursor = decode_cursor(args['cursor']) if args.get('cursor') else None
+
+    fields = list(default_fields) if default_fields is not None else None
+    if args.get('fields'):
+        fields = []
+        for name in args['fields'].split(','):
+            name = name.strip()
+            if not name or name in fields:
+                continue
+            if name not in allowed_fields:
+                raise ValidationError(f'알 수 없는 필드입니다: {name}')
+            fields.append(name)
+
+    return PageRequest(limit=limit if paginated else None, cursor=cursor, fields=fields, paginated=paginated)
+
+
+def serialize_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def fetch_page(query, key_column, columns, page):
+    """SQLAlchemy 쿼리에서 요청된 필드의 컬럼만 선택하여 키셋 페이지를 조회합니다.
+
+    Args:
+        query: 필터가 적용된 Model.query
+        key_column: 고유하고 정렬 가능한 키 컬럼 (보통 id)
+        columns: 필드 이름 -> 컬럼 매핑
+        page: PageRequest
+
+    Returns:
+        tuple: (행 dict 목록, 다음 페이지 cursor 또는 None)
+    """
+    query = query.with_entities(key_column.label('_page_key'),
+                                *(columns[name].label(name) for name in page.fields))
+    if page.cursor is not None:
+        query = query.filter(key_column > page.cursor[0])
+    query = query.order_by(key_column)
+    if page.paginated:
+        query = query.limit(page.limit + 1)
+
+    rows = query.all()
+    next_cursor = None
+    if page.paginated and len(rows) > page.limit:
+        rows = rows[:page.limit]
+        next_cursor = encode_cursor((rows[-1]._page_key,))
+
+    return [{name: row._mapping[name] for name in page.fields} for row in rows], next_cursor
+
+
+def paginate_items(items, key, page, value=None):
+    """파일/메모리에 있는 목록을 키셋 방식으로 나누고 요청된 필드만 남깁니다.
+
+    Args:
+        items: 항목 목록 (기본은 dict)
+        key: 항목 -> 고유 정렬 키 튜플 (JSON 으로 표현 가능한 값)
+        page: PageRequest
+        value: (항목, 필드 이름) -> 값. 없으면 dict.get 사용
+    """
+    ordered = sorted(items, key=key)
+    if page.cursor is not None:
+        try:
+            ordered = [item for item in ordered if key(item) > page.cursor]
+        except TypeError:
+            raise ValidationError('잘못된 cursor 값입니다.')
+
+    next_cursor = None
+    if page.paginated and len(ordered) > page.limit:
+        ordered = ordered[:page.limit]
+        next_cursor = encode_cursor(key(ordered[-1]))
+
+    return project_items(ordered, page.fields, value), next_cursor
+
+
+def project_items(items, fields, value=None):
+    """항목마다 요청된 필드만 담은 dict 를 만듭니다. fields 가 None 이면 항목을 그대로 반환합니다."""
+    if fields is None:
+        return list(items)
+    if value is None:
+        return [{name: item.get(name) for name in fields} for item in items]
+    return [{name: value(item, name) for name in fields} for item in items]
+
+
+def page_payload(items, next_cursor, page):
+    """페이지네이션 응답 본문"""
+    return {
+        'items': items,
+        'count': len(items),
+        'limit': page.limit,
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None
+    }
@@ -0,0 +1,51 @@
+import logging
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfile:
+    """애플리케이션 시작 단계별 소요 시간 기록 (python -X importtime 의 단계 단위 요약)
+
+    app 패키지 import 부터 create_app 완료까지 각 단계를 phase() 로 감싸 측정하고,
+    report() 로 단계별 시간과 비율을 로그에 남깁니다. 워커/테스트 부팅이 느려질 때
+    어느 단계가 원인인지 바로 확인할 수 있습니다.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = []  # (단계 이름, 초)
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def reset(self):
+        """다음 create_app 측정을 위해 기록을 비웁니다 (import 단계 기록은 유지)."""
+        self.phases = [(name, seconds) for name, seconds in self.phases if name.startswith('import')]
+        self.started = time.perf_counter()
+
+    def summary(self):
+        total = sum(seconds for _, seconds in self.phases)
+        return {
+            'total_ms': round(total * 1000, 1),
+            'phases': [{'name': name, 'ms': round(seconds * 1000, 1),
+                        'percent': round(seconds / total * 100, 1) if total else 0.0}
+                       for name, seconds in self.phases]
+        }
+
+    def report(self, log=None):
+        """단계별 소요 시간을 한 번에 로그로 남기고 요약을 반환합니다."""
+        summary = self.summary()
+        lines = [f"  {phase['name']:<28s} {phase['ms']:>8.1f} ms  {phase['percent']:>5.1f}%"
+                 for phase in summary['phases']]
+        (log or logger).info("애플리케이션 시작 시간: %.1f ms\n%s", summary['total_ms'], '\n'.join(lines))
+        return summary
+
+
+startup_profile = StartupProfile()
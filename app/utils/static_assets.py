@@ -0,0 +1,125 @@
+import hashlib
+import mimetypes
+import os
+
+from flask import request, send_file, send_from_directory
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+
+from app.utils.compression import COMPRESSIBLE_MIMETYPES, available_encodings, choose_encoding, compress
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 지문(내용 해시)이 붙은 정적 파일의 캐시 기간 (1년, 내용이 바뀌면 이름이 바뀜)
+IMMUTABLE_MAX_AGE = 31536000
+FINGERPRINT_LENGTH = 12
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def fingerprinted_name(filename, digest):
+    """'js/config.js' -> 'js/config.<해시>.js'"""
+    root, ext = os.path.splitext(filename)
+    return f'{root}.{digest[:FINGERPRINT_LENGTH]}{ext}'
+
+
+class StaticAssets:
+    """정적 파일 지문 매니페스트와 미리 압축한 파일을 관리합니다.
+
+    시작 시 정적 폴더를 한 번 훑어 파일마다 내용 해시로 지문 이름을 만들고,
+    압축 가능한 파일은 캐시 디렉토리에 .gz/.br 을 미리 만들어 둡니다 (내용이
+    바뀐 파일만 다시 압축). url_for('static', ...) 는 지문 이름을 생성하며,
+    지문 이름 요청에는 immutable 캐시 헤더와 미리 압축한 본문으로 응답합니다.
+    """
+
+    def __init__(self, static_folder, cache_dir):
+        self.static_folder = static_folder
+        self.cache_dir = cache_dir
+        self.manifest = {}  # 원래 이름 -> 지문 이름
+        self.originals = {}  # 지문 이름 -> 원래 이름
+
+    def build(self):
+        """매니페스트를 만들고 압축 가능한 파일을 미리 압축합니다."""
+        manifest, compressed = {}, 0
+        if not self.static_folder or not os.path.isdir(self.static_folder):
+            return manifest
+        for dirpath, dirnames, filenames in os.walk(self.static_folder):
+            dirnames[:] = [d for d in dirnames if d != '__pycache__']
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                filename = os.path.relpath(path, self.static_folder).replace(os.sep, '/')
+                with open(path, 'rb') as f:
+                    data = f.read()
+                digest = hashlib.sha256(data).hexdigest()
+                manifest[filename] = fingerprinted_name(filename, digest)
+                mimetype = mimetypes.guess_type(filename)[0]
+                if mimetype in COMPRESSIBLE_MIMETYPES:
+                    compressed += self._precompress(filename, data, digest)
+        self.manifest = manifest
+        self.originals = {fingerprinted: filename for filename, fingerprinted in manifest.items()}
+        logger.info(f"정적 파일 매니페스트 생성: {len(manifest)}개 파일, {compressed}개 압축 파일 갱신")
+        return manifest
+
+    def _precompress(self, filename, data, digest):
+        """내용 해시가 바뀐 경우에만 압축 파일을 다시 만듭니다. 갱신한 파일 수를 반환합니다."""
+        base = os.path.join(self.cache_dir, digest[:FINGERPRINT_LENGTH], filename)
+        updated = 0
+        for encoding in available_encodings():
+            target = base + ENCODING_SUFFIXES[encoding]
+            if os.path.exists(target):
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            # 원자적 교체로 동시에 시작하는 워커가 덜 쓰인 파일을 읽지 않도록 함
+            tmp_path = f'{target}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(compress(data, encoding, gzip_level=9, brotli_quality=11))
+            os.replace(tmp_path, target)
+            updated += 1
+        return updated
+
+    def url_defaults(self, endpoint, values):
+        """url_for('static', filename=...) 가 지문 이름을 생성하도록 합니다."""
+        if endpoint == 'static' and 'filename' in values:
+            values['filename'] = self.manifest.get(values['filename'], values['filename'])
+
+    def send_static_file(self, filename):
+        """정적 파일 뷰. 지문 이름이면 원래 파일(또는 미리 압축한 파일)을 장기 캐시 헤더로 보냅니다."""
+        original = self.originals.get(filename)
+        if original is None:
+            return send_from_directory(self.static_folder, filename)
+
+        digest = self.manifest[original].rsplit('.', 2)[-2]
+        encoding = choose_encoding(request.accept_encodings)
+        compressed = None
+        if encoding:
+            compressed = safe_join(self.cache_dir, digest, original + ENCODING_SUFFIXES[encoding])
+        if compressed and os.path.exists(compressed):
+            response = send_file(compressed, mimetype=mimetypes.guess_type(original)[0],
+                                 max_age=IMMUTABLE_MAX_AGE, conditional=True)
+            response.headers['Content-Encoding'] = encoding
+        else:
+            path = safe_join(self.static_folder, original)
+            if path is None or not os.path.isfile(path):
+                raise NotFound()
+            response = send_file(path, max_age=IMMUTABLE_MAX_AGE, conditional=True)
+        response.vary.add('Accept-Encoding')
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+
+
+def init_static_assets(app):
+    """정적 파일 지문/사전 압축을 적용합니다 (STATIC_FINGERPRINT 설정으로 끌 수 있음)."""
+    if not app.config.get('STATIC_FINGERPRINT', True) or not app.static_folder:
+        return None
+    cache_dir = app.config.get('STATIC_CACHE_DIR') or os.path.join(app.instance_path, 'static-cache')
+    assets = StaticAssets(app.static_folder, cache_dir)
+    try:
+        assets.build()
+    except OSError as e:
+        logger.warning(f"정적 파일 사전 압축 실패, 원본 파일로 제공합니다: {str(e)}")
+        return None
+    app.url_defaults(assets.url_defaults)
+    app.view_functions['static'] = assets.send_static_file
+    app.extensions['static_assets'] = assets
+    return assets
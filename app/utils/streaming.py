@@ -0,0 +1,49 @@
+from flask import Response, request, stream_with_context
+
+from app.utils.logger import setup_logger
+from app.utils.json_provider import dumps_bytes
+
+logger = setup_logger(__name__)
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# 서버 측 커서에서 한 번에 가져오는 행 수
+STREAM_BATCH_SIZE = 500
+
+
+def wants_ndjson():
+    """요청의 Accept 헤더가 JSON 보다 NDJSON 을 우선하는지 확인합니다."""
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def iter_query_rows(query, key_column, columns, fields, after=None, batch_size=STREAM_BATCH_SIZE):
+    """요청된 필드의 컬럼만 선택하여 키 순서대로 행을 하나씩 반환합니다.
+
+    yield_per 로 서버 측 커서에서 batch_size 행씩 가져오므로 전체 결과를
+    메모리에 올리지 않습니다.
+    """
+    query = query.with_entities(*(columns[name].label(name) for name in fields))
+    if after is not None:
+        query = query.filter(key_column > after)
+    for row in query.order_by(key_column).yield_per(batch_size):
+        yield {name: row._mapping[name] for name in fields}
+
+
+def ndjson_lines(rows):
+    """행마다 JSON 한 줄을 생성합니다. 전송 중 오류는 마지막 줄에 오류 객체로 기록합니다."""
+    count = 0
+    try:
+        for row in rows:
+            yield dumps_bytes(row) + b'\n'
+            count += 1
+    except Exception as e:
+        logger.error(f"NDJSON 스트리밍 중 오류 발생 ({count}행 전송 후): {str(e)}", exc_info=True)
+        yield dumps_bytes({'status': 'error', 'message': str(e)}) + b'\n'
+
+
+def ndjson_response(rows, filename=None):
+    """행 생성기를 NDJSON 스트리밍 응답으로 만듭니다. filename 을 주면 첨부 파일로 내려받습니다."""
+    headers = {'X-Accel-Buffering': 'no'}  # 프록시 버퍼링 없이 바로 전송
+    if filename:
+        headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return Response(stream_with_context(ndjson_lines(rows)), mimetype=NDJSON_MIMETYPE, headers=headers)
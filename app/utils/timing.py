@@ -0,0 +1,54 @@
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+def _ms(ns):
+    return round(ns / 1e6, 3)
+
+
+class PhaseTimer:
+    """장비 작업 한 번의 단계별 소요 시간 (perf_counter_ns 기반 고해상도 타이머)
+
+    단계(phase)는 TCP 연결, SSH 핸드셰이크, 인증, 셸 준비, 연결 종료처럼 이름으로
+    누적하고, 명령어는 왕복 시간을 명령어마다 따로 기록합니다.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self._started_ns = time.perf_counter_ns()
+        self.phases = {}  # 단계 이름 -> ns (같은 단계를 여러 번 측정하면 합산)
+        self.commands = []  # {'command', 'ns', 'output_bytes'}
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0) + time.perf_counter_ns() - started
+
+    @contextmanager
+    def command(self, command):
+        """명령어 왕복 시간을 기록합니다.
+
+        yield 된 dict 에 출력 크기(output_bytes) 등 추가 정보를 넣을 수 있으며,
+        블록 안에서 예외가 나면 ok 가 False 로 기록됩니다.
+        """
+        entry = {'command': command, 'ns': 0, 'ok': False, 'output_bytes': None}
+        started = time.perf_counter_ns()
+        try:
+            yield entry
+            entry['ok'] = True
+        finally:
+            entry['ns'] = time.perf_counter_ns() - started
+            self.commands.append(entry)
+
+    def to_dict(self):
+        return {
+            'started_at': self.started_at.isoformat(),
+            'total_ms': _ms(time.perf_counter_ns() - self._started_ns),
+            'phases': {name: _ms(ns) for name, ns in self.phases.items()},
+            'commands': [dict({key: value for key, value in entry.items() if key != 'ns'}, ms=_ms(entry['ns']))
+                         for entry in self.commands]
+        }
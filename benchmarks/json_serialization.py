@@ -0,0 +1,87 @@
+"""대용량 목록 API 응답 직렬화 벤치마크
+
+학습된 명령어 목록 / 디바이스 목록 / 작업 목록 크기의 응답을 Flask 기본 JSON
+공급자(to_dict 에서 isoformat() 호출)와 app.utils.json_provider.FastJSONProvider
+(datetime 그대로 전달)로 각각 jsonify 하여 응답 생성 시간을 비교합니다.
+
+사용법:
+    python benchmarks/json_serialization.py --rows 50000 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask, jsonify
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.utils.json_provider import FastJSONProvider, orjson  # noqa: E402
+
+VENDORS = ('cisco', 'juniper', 'arista', 'hp')
+BASE_TIME = datetime(2024, 1, 1, 9, 0, 0)
+
+
+def command_rows(count, iso):
+    rows = []
+    for i in range(count):
+        updated_at = BASE_TIME + timedelta(seconds=i, microseconds=i % 1000)
+        rows.append({
+            'vendor': VENDORS[i % len(VENDORS)],
+            'task_type': 'VLAN 관리',
+            'subtask': 'VLAN 생성',
+            'command': f'vlan {i}\n name 사용자-VLAN-{i}',
+            'parameters': ['vlan_id', 'vlan_name'],
+            'updated_at': updated_at.isoformat() if iso else updated_at
+        })
+    return rows
+
+
+def device_rows(count, iso):
+    rows = []
+    for i in range(count):
+        created_at = BASE_TIME + timedelta(minutes=i)
+        rows.append({
+            'id': i,
+            'name': f'스위치-{i:05d}',
+            'ip_address': f'10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}',
+            'vendor': VENDORS[i % len(VENDORS)],
+            'device_type': 'switch',
+            'status': 'active',
+            'created_at': created_at.isoformat() if iso else created_at,
+            'updated_at': created_at.isoformat() if iso else created_at
+        })
+    return rows
+
+
+def measure(app, payload, repeat):
+    timings = []
+    with app.app_context():
+        for _ in range(repeat):
+            started = time.perf_counter()
+            response = jsonify(payload)
+            timings.append(time.perf_counter() - started)
+    return statistics.median(timings), len(response.get_data())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    default_app = Flask('default')
+    fast_app = Flask('fast')
+    fast_app.json = FastJSONProvider(fast_app)
+    print(f"orjson: {'사용' if orjson is not None else '미설치 (표준 json 대체)'}")
+
+    for name, build in (('commands', command_rows), ('devices', device_rows)):
+        before, before_size = measure(default_app, build(args.rows, iso=True), args.repeat)
+        after, after_size = measure(fast_app, build(args.rows, iso=False), args.repeat)
+        print(f"{name:9s} {args.rows}행  기본: {before * 1000:8.1f} ms ({before_size} bytes)  "
+              f"FastJSONProvider: {after * 1000:8.1f} ms ({after_size} bytes)  {before / after:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""SQLite 동시 읽기/쓰기 처리량 벤치마크
+
+기본 SQLite 설정(롤백 저널)과 app.database 의 성능 프로필(WAL, synchronous=NORMAL,
+cache_size, mmap_size, busy_timeout)을 같은 부하로 비교합니다.
+
+사용법:
+    python benchmarks/sqlite_concurrency.py --writers 4 --readers 8 --duration 10
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.database import SQLITE_DEFAULTS, apply_sqlite_pragmas, sqlite_pragmas  # noqa: E402
+
+SEED_ROWS = 20000
+VENDORS = ('cisco', 'juniper', 'arista', 'hp')
+
+
+def make_engine(path, profile, pool_size):
+    engine = create_engine(f'sqlite:///{path}', pool_size=pool_size, max_overflow=pool_size,
+                           connect_args={'check_same_thread': False})
+    if profile == 'tuned':
+        apply_sqlite_pragmas(engine, sqlite_pragmas(SQLITE_DEFAULTS))
+    return engine
+
+
+def seed(engine):
+    with engine.begin() as conn:
+        conn.execute(text('CREATE TABLE commands (id INTEGER PRIMARY KEY, vendor TEXT, command TEXT)'))
+        conn.execute(text('CREATE INDEX ix_commands_vendor ON commands (vendor)'))
+        conn.execute(text('INSERT INTO commands (vendor, command) VALUES (:vendor, :command)'),
+                     [{'vendor': VENDORS[i % len(VENDORS)], 'command': f'vlan {i}\n name v{i}'}
+                      for i in range(SEED_ROWS)])
+
+
+def worker(engine, kind, stop, stats, index):
+    latencies = stats[kind]
+    i = 0
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            with engine.begin() as conn:
+                if kind == 'writes':
+                    conn.execute(text('INSERT INTO commands (vendor, command) VALUES (:vendor, :command)'),
+                                 {'vendor': VENDORS[i % len(VENDORS)], 'command': f'vlan {index}-{i}'})
+                else:
+                    conn.execute(text('SELECT count(*), max(id) FROM commands WHERE vendor = :vendor'),
+                                 {'vendor': VENDORS[i % len(VENDORS)]}).fetchall()
+        except OperationalError:
+            stats['errors'].append(kind)
+            continue
+        latencies.append(time.perf_counter() - started)
+        i += 1
+
+
+def run_profile(profile, writers, readers, duration):
+    directory = tempfile.mkdtemp(prefix='sqlite-bench-')
+    path = os.path.join(directory, 'bench.db')
+    engine = make_engine(path, profile, writers + readers)
+    seed(engine)
+
+    stats = {'writes': [], 'reads': [], 'errors': []}
+    stop = threading.Event()
+    threads = [threading.Thread(target=worker, args=(engine, 'writes', stop, stats, i)) for i in range(writers)]
+    threads += [threading.Thread(target=worker, args=(engine, 'reads', stop, stats, i)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    with engine.connect() as conn:
+        journal_mode = conn.execute(text('PRAGMA journal_mode')).scalar()
+    engine.dispose()
+
+    def p95(values):
+        return statistics.quantiles(values, n=20)[-1] * 1000 if len(values) >= 20 else 0.0
+
+    return {
+        'profile': profile,
+        'journal_mode': journal_mode,
+        'writes_per_sec': len(stats['writes']) / duration,
+        'reads_per_sec': len(stats['reads']) / duration,
+        'write_p95_ms': p95(stats['writes']),
+        'read_p95_ms': p95(stats['reads']),
+        'errors': len(stats['errors'])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite 동시 읽기/쓰기 처리량 비교')
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10.0)
+    args = parser.parse_args()
+
+    print(f'writers={args.writers} readers={args.readers} duration={args.duration}s')
+    print(f"{'profile':<8} {'journal':<8} {'writes/s':>10} {'reads/s':>10} {'w p95 ms':>10} {'r p95 ms':>10} {'errors':>7}")
+    for profile in ('default', 'tuned'):
+        r = run_profile(profile, args.writers, args.readers, args.duration)
+        print(f"{r['profile']:<8} {r['journal_mode']:<8} {r['writes_per_sec']:>10.1f} {r['reads_per_sec']:>10.1f} "
+              f"{r['write_p95_ms']:>10.2f} {r['read_p95_ms']:>10.2f} {r['errors']:>7}")
+
+
+if __name__ == '__main__':
+    main()
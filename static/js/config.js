@@ -3,6 +3,8 @@ let devices = [];
 let selectedDevice = null;
 let taskTypes = {};
 let subtasks = {};
+// /config/api/bootstrap 로 받은 초기 데이터 (상세 작업 트리, 파라미터 정의)
+let catalog = null;
 
 // 이벤트 리스너 관리를 위한 Map
 const eventListenerMap = new Map();
@@ -106,14 +108,29 @@ function initializeUI() {
     }
 }
 
-// 초기 데이터 로드
+// 초기 데이터 로드 (장비, 작업 유형, 상세 작업, 파라미터를 한 번의 요청으로 받음)
 async function loadInitialData() {
     console.log('초기 데이터 로드 시작');
     try {
-        await loadDevices();
-        await loadTaskTypes();
+        showLoading();
+        const response = await fetch('/config/api/bootstrap');
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        catalog = await response.json();
+        applyDevices(catalog.devices || []);
+        renderTaskTypes((catalog.task_types || []).map(type => type.name));
     } catch (error) {
-        console.error('초기 데이터 로드 중 오류:', error);
+        console.error('초기 데이터 로드 중 오류, 개별 API 로 재시도:', error);
+        catalog = null;
+        try {
+            await loadDevices();
+            await loadTaskTypes();
+        } catch (fallbackError) {
+            console.error('초기 데이터 로드 중 오류:', fallbackError);
+        }
+    } finally {
+        hideLoading();
     }
 }
 
@@ -148,20 +165,7 @@ async function loadDevices() {
         }
 
         console.log('변환된 장비 목록:', deviceList);
-        
-        devices = deviceList.map(device => ({
-            ...device,
-            id: device.name // name을 id로 사용
-        }));
-
-        displayDevices();
-        
-        // 장비가 있으면 첫 번째 장비 자동 선택
-        if (devices.length > 0) {
-            selectDevice(devices[0].id);
-        } else {
-            console.log('장비 목록이 비어있습니다');
-        }
+        applyDevices(deviceList);
     } catch (error) {
         console.error('장비 목록 로드 중 오류:', error);
         showToast('장비 목록을 불러오는데 실패했습니다', 'error');
@@ -170,6 +174,23 @@ async function loadDevices() {
     }
 }
 
+// 장비 목록 적용
+function applyDevices(deviceList) {
+    devices = deviceList.map(device => ({
+        ...device,
+        id: device.name // name을 id로 사용
+    }));
+
+    displayDevices();
+    
+    // 장비가 있으면 첫 번째 장비 자동 선택
+    if (devices.length > 0) {
+        selectDevice(devices[0].id);
+    } else {
+        console.log('장비 목록이 비어있습니다');
+    }
+}
+
 // 장비 목록 표시
 function displayDevices() {
     console.log('장비 목록 표시 시작');
@@ -227,24 +248,8 @@ async function loadTaskTypes() {
         // 기존 localStorage 데이터 초기화
         localStorage.removeItem('taskTypes');
         
-        // 첫 번째로 작업 유형 테이블 초기화 요청 (reset=true)
+        // 기본 작업 유형은 서버에서 seed 로 관리되므로 초기화 요청 없이 바로 로드
         const timestamp = new Date().getTime();
-        console.log('작업 유형 테이블 초기화 요청');
-        const resetResponse = await fetch(`/config/api/task-types?reset=true&_=${timestamp}`, {
-            cache: 'no-store',
-            headers: {
-                'Cache-Control': 'no-cache, no-store, must-revalidate',
-                'Pragma': 'no-cache',
-                'Expires': '0'
-            }
-        });
-        
-        if (!resetResponse.ok) {
-            console.warn('작업 유형 테이블 초기화 실패, 정상 로드 시도');
-        } else {
-            const resetData = await resetResponse.json();
-            console.log('작업 유형 테이블 초기화 응답:', resetData);
-        }
         
         // 작업 유형 데이터 로드 (이름만 요청)
         console.log('작업 유형 데이터 로드 요청');
@@ -269,36 +274,41 @@ async function loadTaskTypes() {
             taskTypes = taskTypes.map(type => type.name || type);
         }
         
-        // 작업 유형이 비어있으면 오류 표시
-        if (!Array.isArray(taskTypes) || taskTypes.length === 0) {
-            console.error('작업 유형 목록이 비어있거나 유효하지 않음:', taskTypes);
-            showToast('작업 유형 목록을 불러오는데 실패했습니다', 'error');
-            return;
-        }
-        
-        const container = document.getElementById('task-type-container');
-        if (!container) return;
-
-        container.innerHTML = taskTypes.map(type => `
-            <div class="form-check mb-2">
-                <input class="form-check-input task-type-checkbox" type="checkbox" 
-                       id="task-type-${type}" value="${type}">
-                <label class="form-check-label" for="task-type-${type}">
-                    ${type}
-                </label>
-            </div>
-        `).join('');
-
-        // 작업 유형 체크박스 이벤트 리스너 등록
-        document.querySelectorAll('.task-type-checkbox').forEach(checkbox => {
-            checkbox.addEventListener('change', handleTaskTypeChange);
-        });
+        renderTaskTypes(taskTypes);
     } catch (error) {
         console.error('작업 유형을 불러오는 중 오류 발생:', error);
         showToast('작업 유형을 불러오는데 실패했습니다', 'error');
     }
 }
 
+// 작업 유형 체크박스 표시
+function renderTaskTypes(taskTypes) {
+    // 작업 유형이 비어있으면 오류 표시
+    if (!Array.isArray(taskTypes) || taskTypes.length === 0) {
+        console.error('작업 유형 목록이 비어있거나 유효하지 않음:', taskTypes);
+        showToast('작업 유형 목록을 불러오는데 실패했습니다', 'error');
+        return;
+    }
+    
+    const container = document.getElementById('task-type-container');
+    if (!container) return;
+
+    container.innerHTML = taskTypes.map(type => `
+        <div class="form-check mb-2">
+            <input class="form-check-input task-type-checkbox" type="checkbox" 
+                   id="task-type-${type}" value="${type}">
+            <label class="form-check-label" for="task-type-${type}">
+                ${type}
+            </label>
+        </div>
+    `).join('');
+
+    // 작업 유형 체크박스 이벤트 리스너 등록
+    document.querySelectorAll('.task-type-checkbox').forEach(checkbox => {
+        checkbox.addEventListener('change', handleTaskTypeChange);
+    });
+}
+
 // 작업 유형 선택 변경 처리
 async function handleTaskTypeChange(e) {
     const taskType = e.target.value;
@@ -345,6 +355,15 @@ async function loadSubtasks(taskType) {
         mappedTaskType = taskTypeMapping[safeTaskType];
     }
     
+    // 부트스트랩 데이터에 상세 작업이 있으면 요청 없이 사용
+    if (catalog && catalog.subtasks && Array.isArray(catalog.subtasks[safeTaskType])) {
+        if (selectedTasks.has(safeTaskType)) {
+            selectedTasks.get(safeTaskType).subtasks = extractSubtaskNames(catalog.subtasks[safeTaskType]);
+        }
+        updateSubtaskContainer(safeTaskType);
+        return;
+    }
+    
     try {
         console.log(`상세 작업 API 요청: /api/subtasks/${encodeURIComponent(mappedTaskType)}`);
         const response = await fetch(`/api/subtasks/${encodeURIComponent(mappedTaskType)}`);
@@ -556,6 +575,18 @@ async function loadParameters(taskType, subtaskName) {
         });
     }
     
+    // 부트스트랩 데이터의 상세 작업에 파라미터 정의가 있으면 요청 없이 사용
+    const cachedSubtask = catalog && catalog.subtasks && (catalog.subtasks[safeTaskType] || [])
+        .find(subtask => subtask && subtask.name === safeSubtaskName);
+    if (cachedSubtask && Array.isArray(cachedSubtask.parameters)) {
+        const taskData = selectedTasks.get(safeTaskType);
+        if (taskData && taskData.parameters) {
+            taskData.parameters[safeSubtaskName] = cachedSubtask.parameters;
+        }
+        addParameterFieldsToDevices(safeTaskType, safeSubtaskName, cachedSubtask.parameters);
+        return;
+    }
+    
     try {
         // API 요청에서 문자열 사용
         const response = await fetch(`/api/parameters/${safeTaskType}/${safeSubtaskName}`);
@@ -0,0 +1,36 @@
+import pytest
+
+
+@pytest.fixture
+def app_config(tmp_path, monkeypatch):
+    """테스트용 설정 클래스 (임시 디렉터리의 SQLite DB, 로그/작업 파일도 임시 디렉터리)"""
+    from app.config import Config
+
+    monkeypatch.chdir(tmp_path)
+
+    class TestConfig(Config):
+        TESTING = True
+        SECRET_KEY = 'test'
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+        SECURITY_HEADERS = {}
+        STARTUP_PROFILE = False
+        STATIC_CACHE_DIR = str(tmp_path / 'static-cache')
+        LOG_FILE = str(tmp_path / 'logs' / 'test.log')
+
+    return TestConfig
+
+
+@pytest.fixture
+def app(app_config):
+    from app import create_app, db
+
+    app = create_app(app_config)
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
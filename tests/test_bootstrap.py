@@ -0,0 +1,43 @@
+import pytest
+
+from app.routes import config_routes
+from app.utils.catalog_cache import catalog_cache
+
+
+@pytest.fixture
+def devices(monkeypatch):
+    records = [{'id': 1, 'name': 'sw-01', 'ip': '10.0.0.1', 'vendor': 'cisco', 'device_type': 'switch',
+                'username': 'admin', 'password': 'secret', 'enable_password': 'secret', 'status': 'active'}]
+    signature = {'value': (1, 100)}
+    monkeypatch.setattr(config_routes.device_service, 'get_all_devices', lambda: [dict(row) for row in records])
+    monkeypatch.setattr(config_routes, '_devices_signature', lambda: signature['value'])
+    catalog_cache.invalidate()
+    yield records, signature
+    catalog_cache.invalidate()
+
+
+def test_bootstrap_returns_catalog_without_secrets(client, devices):
+    response = client.get('/config/api/bootstrap')
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [device['name'] for device in data['devices']] == ['sw-01']
+    assert all('password' not in device and 'enable_password' not in device for device in data['devices'])
+    # 빈 작업 유형 테이블은 기본 seed 로 채워짐
+    assert 'VLAN 관리' in [task_type['name'] for task_type in data['task_types']]
+    assert set(data['subtasks']) == {task_type['name'] for task_type in data['task_types']}
+    assert data['parameter_schemas'] == config_routes.PARAMETER_SCHEMAS
+
+
+def test_bootstrap_revalidates_until_devices_change(client, devices):
+    records, signature = devices
+    first = client.get('/config/api/bootstrap')
+
+    cached = client.get('/config/api/bootstrap', headers={'If-None-Match': first.headers['ETag']})
+    assert cached.status_code == 304
+
+    records.append(dict(records[0], id=2, name='sw-02'))
+    signature['value'] = (2, 200)
+    changed = client.get('/config/api/bootstrap', headers={'If-None-Match': first.headers['ETag']})
+    assert changed.status_code == 200
+    assert [device['name'] for device in changed.get_json()['devices']] == ['sw-01', 'sw-02']
@@ -0,0 +1,69 @@
+import logging
+import sqlite3
+
+from sqlalchemy import create_engine, inspect
+
+from app import create_app, db
+from app.utils.db_diagnostics import explain_query_plans
+from app.utils.logger import configure_logging, setup_logger
+
+
+def create_legacy_db(path):
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE devices (id INTEGER NOT NULL, name VARCHAR(100) NOT NULL, '
+                       'ip_address VARCHAR(15) NOT NULL, PRIMARY KEY (id))')
+    connection.commit()
+    connection.close()
+
+
+def test_query_plans_tolerate_missing_columns(tmp_path):
+    path = tmp_path / 'legacy.db'
+    create_legacy_db(path)
+    engine = create_engine(f'sqlite:///{path}')
+
+    reports = {report['name']: report for report in explain_query_plans(engine)}
+    engine.dispose()
+
+    assert 'no such column' in reports['devices.ip_address']['error']
+    assert reports['devices.ip_address']['plan'] == []
+
+
+def test_startup_on_legacy_schema(app_config, tmp_path):
+    """모델보다 오래된 스키마(devices.model 등 컬럼 없음)에서도 앱이 시작되고 컬럼이 보완되어야 함"""
+    path = tmp_path / 'legacy.db'
+    create_legacy_db(path)
+
+    class LegacyConfig(app_config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        QUERY_PLAN_CHECK_ON_STARTUP = True
+
+    app = create_app(LegacyConfig)
+    with app.app_context():
+        columns = {column['name'] for column in inspect(db.engine).get_columns('devices')}
+        reports = explain_query_plans(db.engine)
+        db.engine.dispose()
+
+    assert {'model', 'vendor', 'password'} <= columns
+    assert all(report['error'] is None for report in reports)
+
+    response = app.test_client().get('/api/diagnostics/query-plans')
+    assert response.status_code == 200
+    assert response.get_json()['errors'] == []
+
+
+def test_query_plan_check_is_opt_in(app):
+    assert app.config['QUERY_PLAN_CHECK_ON_STARTUP'] is False
+
+
+def test_module_loggers_follow_root_level():
+    root = logging.getLogger()
+    previous = root.level
+    logger = setup_logger('tests.level')
+    try:
+        configure_logging(level='DEBUG')
+        assert logger.level == logging.NOTSET
+        assert logger.isEnabledFor(logging.DEBUG)
+        configure_logging(level='WARNING')
+        assert not logger.isEnabledFor(logging.INFO)
+    finally:
+        root.setLevel(previous)
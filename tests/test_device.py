@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from app.routes import device_routes
+
+NDJSON = {'Accept': 'application/x-ndjson'}
+
+
+class FileDevices:
+    def __init__(self, devices):
+        self.devices = devices
+
+    def get_all_devices(self):
+        return [dict(device) for device in self.devices]
+
+
+@pytest.fixture
+def devices(monkeypatch):
+    records = [
+        {'id': 2, 'name': 'sw-02', 'ip': '10.0.0.2', 'vendor': 'cisco', 'device_type': 'switch',
+         'username': 'admin', 'password': 'secret', 'status': 'active'},
+        {'id': 1, 'name': 'sw-01', 'ip': '10.0.0.1', 'vendor': 'juniper', 'device_type': 'switch',
+         'username': 'admin', 'password': 'secret', 'enable_password': 'secret', 'status': 'active'},
+    ]
+    monkeypatch.setattr(device_routes, 'device_service', FileDevices(records))
+    return records
+
+
+def ndjson_rows(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_ndjson_streams_same_devices_as_json(client, devices):
+    listed = client.get('/device/api/devices').get_json()
+    streamed = ndjson_rows(client.get('/device/api/devices', headers=NDJSON))
+
+    assert [row['id'] for row in streamed] == [1, 2]
+    assert {row['ip_address'] for row in streamed} == {device['ip_address'] for device in listed}
+    assert all('password' not in row and 'enable_password' not in row for row in streamed)
+
+
+def test_ndjson_filters_and_projects_allowed_fields(client, devices):
+    response = client.get('/device/api/devices?vendor=cisco&fields=name,ip_address', headers=NDJSON)
+    assert ndjson_rows(response) == [{'name': 'sw-02', 'ip_address': '10.0.0.2'}]
+
+    response = client.get('/device/api/devices/export?fields=password')
+    assert response.status_code == 400
@@ -0,0 +1,51 @@
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from flask import jsonify
+
+from app.utils import json_provider
+from app.utils.json_provider import dumps_bytes
+
+PAYLOAD = {'name': '스위치', 'created_at': datetime(2024, 1, 2, 3, 4, 5), 'tags': {'core'},
+           'id': uuid.UUID(int=1), 'octets': 2 ** 70}
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def backend(request, monkeypatch):
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(json_provider, 'orjson', None)
+    return request.param
+
+
+def test_dumps_bytes_handles_non_native_values(backend):
+    data = json.loads(dumps_bytes(PAYLOAD))
+
+    assert data == {'name': '스위치', 'created_at': '2024-01-02T03:04:05', 'tags': ['core'],
+                    'id': '00000000-0000-0000-0000-000000000001', 'octets': 2 ** 70}
+    assert '스위치'.encode('utf-8') in dumps_bytes(PAYLOAD)
+
+
+def test_dumps_bytes_sort_keys_and_indent(backend):
+    assert dumps_bytes({'b': 1, 'a': 2}, sort_keys=True) == b'{"a":2,"b":1}'
+    assert json.loads(dumps_bytes({'a': [1]}, indent=True)) == {'a': [1]}
+    assert b'\n' in dumps_bytes({'a': [1]}, indent=True)
+
+
+def test_jsonify_uses_iso_datetimes_and_utf8(app, backend):
+    with app.test_request_context():
+        response = jsonify(PAYLOAD)
+
+    assert response.mimetype == 'application/json'
+    assert response.get_json()['created_at'] == '2024-01-02T03:04:05'
+    assert '스위치'.encode('utf-8') in response.get_data()
+
+
+def test_provider_round_trip_and_stdlib_options(app, backend):
+    assert app.json.loads(app.json.dumps(PAYLOAD))['octets'] == 2 ** 70
+    assert app.json.dumps({'a': 1}, indent=4) == json.dumps({'a': 1}, indent=4)
+    with pytest.raises(TypeError):
+        app.json.dumps({'value': object()})
@@ -0,0 +1,626 @@
+import json
+import os
+import random
+import threading
+
+import pytest
+
+from app import db
+from app.models.cli_command import CLICommand, CommandParameter
+from app.services.cli_canonicalizer import CommandCanonicalizer
+from app.services.cli_grammar import CommandGrammar
+from app.services.command_dedup import cluster_commands
+from app.services.command_index import CommandIndex, IndexedCommand
+from app.services.command_trie import CommandTrie
+from app.models.learning_run import LearningRun
+from app.services.learning_runner import LearningRunner
+from app.services.learning_service import LearningService
+from app.services.running_config_parser import abstract_line, iter_config_templates
+
+
+def web_command(subtask, command, parameters=None):
+    return {'vendor': 'cisco', 'device_type': '스위치', 'task_type': 'VLAN 관리', 'subtask': subtask,
+            'command': command, 'parameters': parameters or []}
+
+
+@pytest.fixture
+def service(app):
+    with app.app_context():
+        yield LearningService()
+
+
+def stored_commands(vendor='cisco'):
+    return {(cmd.source, cmd.command) for cmd in CLICommand.query.filter_by(vendor=vendor)}
+
+
+def test_relearn_keeps_bulk_imported_rows(service, monkeypatch):
+    service.bulk_import_commands([{'vendor': 'cisco', 'device_type': '스위치', 'task_type': 'VLAN 관리',
+                                   'subtask': 'VLAN 생성', 'command': 'vlan {vlan_id}'}])
+    collected = [web_command('VLAN 생성', 'vlan {vlan_id}\n name {vlan_name}', ['vlan_id', 'vlan_name'])]
+    monkeypatch.setattr(service, 'search_vendor_commands', lambda vendor: list(collected))
+
+    first = service.start_learning('cisco')
+    assert first['changes']['inserted'] == 1
+
+    collected[:] = [web_command('VLAN 삭제', 'no vlan {vlan_id}', ['vlan_id'])]
+    second = service.start_learning('cisco')
+
+    assert second['changes'] == {'inserted': 1, 'updated': 0, 'deleted': 1, 'unchanged': 0}
+    assert stored_commands() == {(CLICommand.SOURCE_BULK, 'vlan {vlan_id}'),
+                                 (CLICommand.SOURCE_WEB, 'no vlan {vlan_id}')}
+
+
+def test_relearn_keeps_commands_sharing_a_subtask(service, monkeypatch):
+    collected = [web_command('VLAN 생성', 'vlan {vlan_id}', ['vlan_id']),
+                 web_command('VLAN 생성', 'name {vlan_name}', ['vlan_name'])]
+    monkeypatch.setattr(service, 'search_vendor_commands', lambda vendor: list(collected))
+
+    service.start_learning('cisco')
+    result = service.start_learning('cisco')
+
+    assert result['changes']['unchanged'] == 2
+    assert len(stored_commands()) == 2
+
+
+def test_relearn_adopts_legacy_rows_without_deleting_them(service, monkeypatch):
+    legacy = dict(web_command('VLAN 생성', 'vlan {vlan_id}', ['vlan_id']), source=None)
+    manual = dict(web_command('VLAN 이름', 'name {vlan_name}', ['vlan_name']), source=None)
+    db.session.execute(CLICommand.__table__.insert(), [legacy, manual])
+    db.session.commit()
+    monkeypatch.setattr(service, 'search_vendor_commands',
+                        lambda vendor: [web_command('VLAN 생성', 'vlan {vlan_id}', ['vlan_id'])])
+
+    result = service.start_learning('cisco')
+
+    assert result['changes'] == {'inserted': 0, 'updated': 1, 'deleted': 0, 'unchanged': 0}
+    assert stored_commands() == {(None, 'name {vlan_name}'), (CLICommand.SOURCE_WEB, 'vlan {vlan_id}')}
+
+
+class FakeLearner:
+    """start_learning 만 흉내 내는 학습 서비스 (release 가 설정될 때까지 추출 단계에서 대기)"""
+
+    def __init__(self, fail=(), block=False):
+        self.fail = set(fail)
+        self.release = threading.Event()
+        self.started = threading.Event()
+        if not block:
+            self.release.set()
+
+    def start_learning(self, vendor, progress=None):
+        self.started.set()
+        progress('fetched', pages_fetched=2)
+        self.release.wait(5)
+        if vendor in self.fail:
+            raise RuntimeError(f'{vendor} 검색 실패')
+        progress('extracted', commands_extracted=3)
+        progress('saved', inserted=3)
+        return {'count': 3, 'changes': {'inserted': 3, 'updated': 0, 'deleted': 0, 'unchanged': 0}}
+
+
+def finish(runner, run_id):
+    runner._threads[run_id].join(5)
+    db.session.expire_all()
+    return db.session.get(LearningRun, run_id)
+
+
+def test_learning_run_records_progress_and_vendor_failures(app):
+    with app.app_context():
+        runner = LearningRunner(FakeLearner(fail={'juniper'}))
+        run, started = runner.start(app, ['cisco', 'juniper'])
+        assert started
+
+        run = finish(runner, run.id)
+        assert run.status == LearningRun.COMPLETED
+        assert (run.vendors_done, run.pages_fetched, run.commands_extracted, run.inserted) == (2, 4, 3, 3)
+        assert run.results['cisco']['status'] == 'success'
+        assert run.results['juniper'] == {'status': 'error', 'message': 'juniper 검색 실패'}
+        assert run.to_dict()['progress'] == 100
+
+
+def test_learning_run_allows_one_run_and_can_be_cancelled(app):
+    with app.app_context():
+        learner = FakeLearner(block=True)
+        runner = LearningRunner(learner)
+        run, _ = runner.start(app, ['cisco', 'arista'])
+        learner.started.wait(5)
+
+        same, started = runner.start(app, ['arista'])
+        assert not started and same.id == run.id
+        assert runner.active_run_id() == run.id
+
+        runner.cancel(run.id)
+        learner.release.set()
+        run = finish(runner, run.id)
+        assert run.status == LearningRun.CANCELLED
+        assert run.cancel_requested and run.vendors_done == 0
+
+
+def test_learning_run_without_thread_is_interrupted(app):
+    with app.app_context():
+        db.session.add(LearningRun(id='orphan', status=LearningRun.RUNNING, vendors=['cisco']))
+        db.session.commit()
+
+        run = LearningRunner(FakeLearner()).get_run('orphan')
+
+        assert run.status == LearningRun.INTERRUPTED and run.finished_at is not None
+
+
+def bulk_record(command, **fields):
+    return dict({'vendor': 'Cisco', 'device_type': '스위치', 'task_type': 'VLAN 관리', 'subtask': 'VLAN 생성',
+                 'command': command, 'parameters': ['vlan_id']}, **fields)
+
+
+def test_bulk_import_reports_rejected_records(app, client):
+    records = [bulk_record('vlan {vlan_id}'), 'not an object', bulk_record('vlan {vlan_id} name x', subtask=' '),
+               bulk_record('no vlan {vlan_id}', parameters='vlan_id'), bulk_record('no vlan {vlan_id}')]
+
+    response = client.post('/api/learning/commands/bulk?chunk_size=2', json=records)
+
+    data = response.get_json()['data']
+    assert response.status_code == 200
+    assert (data['inserted'], data['rejected']) == (2, 3)
+    assert [error['index'] for error in data['errors']] == [1, 2, 3]
+    with app.app_context():
+        rows = CLICommand.query.order_by(CLICommand.id).all()
+        assert [(row.vendor, row.source, row.command) for row in rows] == [
+            ('cisco', CLICommand.SOURCE_BULK, 'vlan {vlan_id}'), ('cisco', CLICommand.SOURCE_BULK, 'no vlan {vlan_id}')]
+        # 파라미터 연결 행도 같은 트랜잭션에서 생성
+        assert {(param.command_id, param.name) for param in CommandParameter.query} == \
+            {(row.id, 'vlan_id') for row in rows}
+
+
+def test_bulk_import_accepts_ndjson_stream(client):
+    body = '\n'.join([json.dumps(bulk_record('vlan {vlan_id}')), '{broken', '', json.dumps(bulk_record('show vlan'))])
+
+    response = client.post('/api/learning/commands/bulk', data=body, content_type='application/x-ndjson')
+
+    data = response.get_json()['data']
+    assert (data['inserted'], data['rejected']) == (2, 1)
+    assert data['errors'][0]['index'] == 1
+
+
+def test_bulk_import_rejects_non_array_body(client):
+    response = client.post('/api/learning/commands/bulk', json={'command': 'vlan 10'})
+    assert response.status_code == 400
+
+
+def test_bulk_rows_are_indexed_by_row_id(service):
+    service.search_commands_ranked('vlan')  # 색인 생성 후 등록
+    service.bulk_import_commands([bulk_record('show vlan brief', device_type=device_type)
+                                  for device_type in ('스위치', '라우터')])
+
+    rows = CLICommand.query.order_by(CLICommand.id).all()
+    result = service.search_commands_ranked('vlan brief', vendor='cisco')
+    assert sorted(payload.id for payload, _ in result['items']) == [row.id for row in rows]
+
+    service.unregister_command(rows[0])
+    result = service.search_commands_ranked('vlan brief', vendor='cisco')
+    assert [payload.id for payload, _ in result['items']] == [rows[1].id]
+
+
+def parameter_rows():
+    return sorted((param.command_id, param.position, param.name, param.vendor, param.subtask)
+                  for param in CommandParameter.query)
+
+
+def test_parameter_names_accept_every_json_shape():
+    assert CommandParameter.parameter_names(['vlan_id', 'vlan_id', 'name']) == ['vlan_id', 'name']
+    assert CommandParameter.parameter_names({'vlan_id': {'type': 'int'}, 'name': {}}) == ['vlan_id', 'name']
+    assert CommandParameter.parameter_names([{'name': 'vlan_id'}, {'type': 'x'}, None]) == ['vlan_id']
+    assert CommandParameter.parameter_names(None) == []
+
+
+def test_orm_writes_keep_parameter_rows_in_sync(service):
+    command = CLICommand(vendor='cisco', device_type='스위치', task_type='VLAN 관리', subtask='VLAN 생성',
+                         command='vlan {vlan_id}\n name {vlan_name}', parameters=['vlan_id', 'vlan_name'])
+    db.session.add(command)
+    db.session.commit()
+    assert parameter_rows() == [(command.id, 0, 'vlan_id', 'cisco', 'VLAN 생성'),
+                                (command.id, 1, 'vlan_name', 'cisco', 'VLAN 생성')]
+
+    command.parameters = {'vlan_id': {}}
+    command.subtask = 'VLAN 수정'
+    db.session.commit()
+    assert parameter_rows() == [(command.id, 0, 'vlan_id', 'cisco', 'VLAN 수정')]
+
+    db.session.delete(command)
+    db.session.commit()
+    assert parameter_rows() == []
+
+
+def test_parameter_backfill_fills_an_empty_table_once(service):
+    db.session.execute(CLICommand.__table__.insert(), [web_command('VLAN 생성', 'vlan {vlan_id}', ['vlan_id'])])
+    db.session.execute(CommandParameter.__table__.delete())
+    db.session.commit()
+
+    assert CommandParameter.backfill(db.session.connection()) == 1
+    assert CommandParameter.backfill(db.session.connection()) == 0
+    assert [name for _, _, name, _, _ in parameter_rows()] == ['vlan_id']
+
+
+def test_commands_filter_by_parameter_and_report_usage(client):
+    records = [bulk_record('vlan {vlan_id}'), bulk_record('vlan {vlan_id}\n name {vlan_name}',
+                                                          parameters=['vlan_id', 'vlan_name']),
+               bulk_record('interface {interface}', task_type='포트 설정', subtask='포트 활성화',
+                           parameters=['interface'])]
+    client.post('/api/learning/commands/bulk', json=records)
+
+    filtered = client.get('/api/learning/commands?parameter=vlan_name').get_json()
+    assert [row['command'] for row in filtered] == ['vlan {vlan_id}\n name {vlan_name}']
+    assert len(client.get('/api/learning/commands?parameter=vlan_id&task_type=VLAN 관리').get_json()) == 2
+
+    usage = client.get('/api/learning/parameters?vendor=cisco').get_json()
+    assert usage == [{'name': 'interface', 'count': 1}, {'name': 'vlan_id', 'count': 2},
+                     {'name': 'vlan_name', 'count': 1}]
+
+
+def write_result(device_id, name, text):
+    directory = f'config/tasks/{device_id}/results'
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return path
+
+
+def test_running_config_learning_accepts_result_files(client):
+    path = write_result(1, 'running-config.txt', 'hostname sw1\nvlan 10\n name users\n')
+
+    response = client.post('/api/learning/running-configs', json={'vendor': 'cisco', 'paths': [path]})
+
+    assert response.status_code == 200
+    assert response.get_json()['data']['files_processed'] == 1
+
+
+@pytest.mark.parametrize('path', ['/etc/passwd', 'config/tasks/1/results/../../../../secret.cfg',
+                                  'config/tasks/1/other.cfg', 'config/cli_learning/cli_learning.json', 42])
+def test_running_config_learning_rejects_paths_outside_results(client, path):
+    write_result(1, 'running-config.txt', 'hostname sw1\n')
+
+    response = client.post('/api/learning/running-configs', json={'vendor': 'cisco', 'paths': [path]})
+
+    assert response.status_code == 400
+
+
+def test_running_config_learning_rejects_symlink_escape(client, tmp_path):
+    outside = tmp_path / 'outside.cfg'
+    outside.write_text('hostname secret\n')
+    write_result(1, 'running-config.txt', '')
+    link = 'config/tasks/1/results/link.cfg'
+    os.symlink(outside, link)
+
+    response = client.post('/api/learning/running-configs', json={'vendor': 'cisco', 'paths': [link]})
+
+    assert response.status_code == 400
+
+
+def test_running_config_learning_collects_only_vendor_devices(app, client, monkeypatch):
+    from app.routes import learning_routes
+
+    monkeypatch.setattr(learning_routes.device_service, 'get_all_devices', lambda: [
+        {'id': 1, 'name': 'sw1', 'vendor': 'cisco'}, {'id': 2, 'name': 'srx1', 'vendor': 'juniper'}])
+    write_result(1, 'running-config.txt', 'hostname sw1\nvlan 10\n name users\n')
+    write_result(2, 'running-config.txt', 'set system host-name srx1\n')
+
+    response = client.post('/api/learning/running-configs', json={'vendor': 'cisco'})
+
+    assert response.status_code == 200
+    assert response.get_json()['data']['files_processed'] == 1
+    with app.app_context():
+        commands = {cmd.command for cmd in CLICommand.query.filter_by(vendor='cisco')}
+    assert commands and not any(command.startswith('set system') for command in commands)
+
+
+@pytest.mark.parametrize('body', [{'workers': 'many'}, {'workers': 0}, {'workers': -2},
+                                  {'min_frequency': 'x'}, {'min_frequency': 0}])
+def test_running_config_learning_validates_numeric_options(client, body):
+    path = write_result(1, 'running-config.txt', 'hostname sw1\n')
+
+    response = client.post('/api/learning/running-configs', json=dict(body, vendor='cisco', paths=[path]))
+
+    assert response.status_code == 400
+
+
+def test_running_config_learning_clamps_workers_to_cpu_count(client, monkeypatch):
+    from app.services import learning_service as learning_service_module
+
+    seen = []
+    original = learning_service_module.learn_config_templates
+    monkeypatch.setattr(learning_service_module, 'learn_config_templates',
+                        lambda paths, workers=None: seen.append(workers) or original(paths, workers=1))
+    path = write_result(1, 'running-config.txt', 'hostname sw1\n')
+
+    response = client.post('/api/learning/running-configs',
+                           json={'vendor': 'cisco', 'paths': [path], 'workers': 10000})
+
+    assert response.status_code == 200
+    assert seen == [os.cpu_count() or 1]
+
+
+def test_doc_ingestion_resolves_root_under_docs_dir(client):
+    os.makedirs('config/docs/cisco', exist_ok=True)
+    os.makedirs('config/cli_learning', exist_ok=True)
+    with open('config/docs/cisco/vlan.txt', 'w', encoding='utf-8') as f:
+        f.write('Switch(config)# vlan 10\nSwitch(config-vlan)# name users\n')
+
+    response = client.post('/api/learning/ingest-docs', json={'vendor': 'cisco', 'root': 'cisco'})
+
+    assert response.status_code == 200
+    assert response.get_json()['data']['files_total'] == 1
+
+
+@pytest.mark.parametrize('root', ['/etc', '..', 'cisco/../../tasks', ['cisco']])
+def test_doc_ingestion_rejects_root_outside_docs_dir(client, root):
+    os.makedirs('config/docs/cisco', exist_ok=True)
+
+    response = client.post('/api/learning/ingest-docs', json={'vendor': 'cisco', 'root': root})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize('workers', ['many', 0, -1])
+def test_doc_ingestion_validates_workers(client, workers):
+    os.makedirs('config/docs/cisco', exist_ok=True)
+
+    response = client.post('/api/learning/ingest-docs', json={'vendor': 'cisco', 'root': 'cisco', 'workers': workers})
+
+    assert response.status_code == 400
+
+
+def test_cluster_keeps_negated_commands_apart():
+    commands = ['interface {interface}\n switchport mode access\n switchport access vlan {vlan_id}\n spanning-tree portfast',
+                'interface {interface}\n switchport mode access\n switchport access vlan {vlan_id}\n no spanning-tree portfast',
+                'no vlan {vlan_id}',
+                'vlan {vlan_id}']
+
+    assert cluster_commands(commands, threshold=0.5) == []
+
+
+def test_cluster_representative_is_first_member_of_canonical_form():
+    clusters = cluster_commands(['Show IP Route', 'show ip route', 'show  ip  route '])
+
+    assert clusters == [{'canonical': 'show ip route', 'representative': 0, 'members': [0, 1, 2]}]
+
+
+def add_commands(*rows):
+    db.session.execute(CLICommand.__table__.insert(), [
+        dict(web_command(subtask, command), source=CLICommand.SOURCE_BULK) for subtask, command in rows])
+    db.session.commit()
+
+
+def test_dedup_defaults_to_dry_run(service):
+    add_commands(('VLAN 생성', 'VLAN {vlan_id}'), ('VLAN 생성', 'vlan {vlan_id}'))
+
+    result = service.deduplicate_commands('cisco')
+
+    assert result['merged'] == 1
+    assert len(stored_commands()) == 2
+
+
+def test_dedup_preserves_original_text_and_scope(service):
+    add_commands(('VLAN 생성', 'VLAN {VLAN_ID}'), ('VLAN 생성', 'vlan {vlan_id}'),
+                 ('VLAN 생성', 'no vlan {vlan_id}'), ('VLAN 수정', 'vlan {vlan_id}'))
+
+    result = service.deduplicate_commands('cisco', dry_run=False)
+
+    assert result['merged'] == 1
+    assert result['items'][0]['command'] == 'VLAN {VLAN_ID}'
+    assert result['items'][0]['aliases'] == ['vlan {vlan_id}']
+    assert sorted((cmd.subtask, cmd.command) for cmd in CLICommand.query) == [
+        ('VLAN 생성', 'VLAN {VLAN_ID}'), ('VLAN 생성', 'no vlan {vlan_id}'), ('VLAN 수정', 'vlan {vlan_id}')]
+
+
+def test_dedup_route_defaults_to_dry_run(client, app):
+    with app.app_context():
+        add_commands(('VLAN 생성', 'VLAN {vlan_id}'), ('VLAN 생성', 'vlan {vlan_id}'))
+
+    response = client.post('/api/learning/commands/dedup', json={'vendor': 'cisco'})
+
+    assert response.get_json()['data']['merged'] == 1
+    with app.app_context():
+        assert CLICommand.query.count() == 2
+
+
+def build_grammar(*scripts):
+    grammar = CommandGrammar('cisco')
+    for script in scripts:
+        grammar.add_script(script)
+    return grammar
+
+
+def test_grammar_extension_matches_full_rebuild():
+    base = ['show vlan brief', 'show version', 'interface {interface}\n description {description}']
+    added = ['show vrf', 'show vlan id {vlan_id}', 'vlan {vlan_id}\n name {vlan_name}', 'show version']
+    queries = ['sh vl br', 'sh vr', 'sh vlan id 10', 'int gi0/1\n desc uplink', 'vlan 10\n name users']
+    grammar = build_grammar(*base)
+    canonicalizer = CommandCanonicalizer(grammar)
+    before = {query: canonicalizer.canonicalize(query) for query in queries}
+    assert not grammar.validate_script('show vrf')['valid']
+
+    changes = [grammar.extend(script) for script in added]
+    for change in changes:
+        canonicalizer.apply_changes(change)
+
+    rebuilt = CommandCanonicalizer(build_grammar(*base, *added))
+    after = {query: canonicalizer.canonicalize(query) for query in queries}
+    assert after == {query: rebuilt.canonicalize(query) for query in queries}
+    assert before['sh vr'] != after['sh vr'] == 'show vrf'
+    assert changes[-1] == []
+    assert grammar.validate_script('show vrf')['valid']
+
+
+def test_register_command_extends_grammar_in_place(service):
+    grammar = service.get_grammar('cisco')
+    assert service.canonicalize_command('cisco', 'sh vr') != 'show vrf'
+
+    service.register_command(web_command('VRF', 'show vrf'))
+
+    assert service.get_grammar('cisco') is grammar
+    assert service.canonicalize_command('cisco', 'sh vr') == 'show vrf'
+    assert service.find_equivalent_command('cisco', 'sh vr') == 'show vrf'
+
+
+def index_row(row_id, command, vendor='cisco', subtask='VLAN 생성', device_type='스위치'):
+    return {'id': row_id, 'vendor': vendor, 'device_type': device_type, 'task_type': 'VLAN 관리',
+            'subtask': subtask, 'command': command, 'description': f'{subtask} 명령어'}
+
+
+def test_index_keys_rows_by_id_and_stores_plain_values():
+    index = CommandIndex()
+    index.add(index_row(1, 'vlan {vlan_id}', subtask='VLAN 생성'))
+    index.add(index_row(2, 'vlan {vlan_id}', subtask='VLAN 수정'))
+
+    result = index.search('vlan')
+    assert result['total'] == 2
+    assert all(isinstance(payload, IndexedCommand) for payload, _ in result['items'])
+    assert index.keys() == [('cisco', 'vlan {vlan_id}')]
+
+    assert index.remove('cisco', 'vlan {vlan_id}')
+    assert len(index) == 0 and ('cisco', 'vlan {vlan_id}') not in index
+
+
+def test_index_remove_key_keeps_rows_sharing_the_text():
+    index = CommandIndex()
+    index.add(index_row(1, 'show vlan brief', device_type='스위치'))
+    index.add(index_row(2, 'show vlan brief', device_type='라우터'))
+
+    assert index.remove_key(1)
+    assert not index.remove_key(1)
+    result = index.search('vlan brief')
+    assert [payload.id for payload, _ in result['items']] == [2]
+    assert ('cisco', 'show vlan brief') in index
+
+
+def test_deleting_one_row_keeps_its_sibling_searchable(service):
+    rows = [CLICommand(vendor='cisco', device_type=device_type, task_type='VLAN 관리', subtask='VLAN 조회',
+                       command='show vlan brief') for device_type in ('스위치', '라우터')]
+    db.session.add_all(rows)
+    db.session.commit()
+    assert service.search_commands_ranked('vlan brief', vendor='cisco')['total'] == 2
+    service.complete_command('cisco', 'show vl')
+
+    # delete_command 라우트와 같은 순서 (삭제 커밋 후 색인에서 제거)
+    db.session.delete(rows[0])
+    db.session.commit()
+    service.unregister_command(rows[0])
+
+    result = service.search_commands_ranked('vlan brief', vendor='cisco')
+    assert [payload.id for payload, _ in result['items']] == [rows[1].id]
+    assert [item['completion'] for item in service.complete_command('cisco', 'show vl')] == ['show vlan brief']
+
+
+def test_completions_are_ranked_by_row_count(service):
+    def add_rows(command, count):
+        rows = [CLICommand(vendor='cisco', device_type=f'장비{i}', task_type='VLAN 관리', subtask='VLAN 조회',
+                           command=command) for i in range(count)]
+        db.session.add_all(rows)
+        db.session.commit()
+        return rows
+
+    add_rows('show vlan id {vlan_id}', 1)
+    add_rows('show vlan brief', 3)
+    assert [item['next'] for item in service.complete_command('cisco', 'show vlan ')] == ['brief', 'id']
+    assert service.complete_command('cisco', 'show vlan ')[0]['count'] == 3
+
+    # 등록/삭제도 행 단위로 빈도를 반영
+    for row in add_rows('show vlan id {vlan_id}', 3):
+        service.register_command(row)
+    assert [item['next'] for item in service.complete_command('cisco', 'show vlan ')] == ['id', 'brief']
+    removed = CLICommand.query.filter_by(command='show vlan id {vlan_id}').first()
+    service.unregister_command(removed)
+    assert [item['count'] for item in service.complete_command('cisco', 'show vlan ')] == [3, 3]
+
+
+def test_trie_completion_during_concurrent_updates():
+    trie = CommandTrie()
+    for i in range(200):
+        trie.insert('cisco', f'interface vlan {i}')
+    errors = []
+    done = threading.Event()
+
+    def churn():
+        try:
+            while not done.is_set():
+                for i in range(200, 260):
+                    trie.insert('cisco', f'interface vlan {i} extra{i}')
+                for i in range(200, 260):
+                    trie.remove('cisco', f'interface vlan {i} extra{i}')
+        except Exception as e:  # pragma: no cover - 실패 시 원인 보고
+            errors.append(e)
+
+    thread = threading.Thread(target=churn)
+    thread.start()
+    try:
+        for _ in range(300):
+            assert trie.complete('cisco', 'interface vl')
+    finally:
+        done.set()
+        thread.join()
+    assert not errors
+
+
+def test_index_top_k_matches_full_ranking():
+    rng = random.Random(7)
+    words = ['vlan', 'interface', 'switchport', 'trunk', 'access', 'name', 'spanning', 'ospf', 'area']
+    index = CommandIndex()
+    for row_id in range(500):
+        command = ' '.join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+        index.add(index_row(row_id, command, vendor=rng.choice(['cisco', 'arista']),
+                            device_type=rng.choice(['스위치', '라우터'])))
+
+    for query, filters in (('vlan', {}), ('vlan trunk', {}), ('interface access', {'vendor': 'cisco'}),
+                           ('swit', {}), ('name area', {'device_type': '라우터'})):
+        full = index.search(query, **filters)
+        for page in (1, 2, 3):
+            paged = index.search(query, page=page, per_page=7, **filters)
+            assert paged['total'] == full['total']
+            expected = [round(score, 9) for _, score in full['items'][(page - 1) * 7:page * 7]]
+            assert [round(score, 9) for _, score in paged['items']] == expected
+
+
+def test_index_search_during_concurrent_reindex():
+    index = CommandIndex()
+    rows = [index_row(row_id, f'vlan {row_id} name users') for row_id in range(300)]
+    index.replace_vendor('cisco', rows)
+    errors = []
+    done = threading.Event()
+
+    def reindex():
+        try:
+            while not done.is_set():
+                index.replace_vendor('cisco', rows)
+        except Exception as e:  # pragma: no cover - 실패 시 원인 보고
+            errors.append(e)
+
+    thread = threading.Thread(target=reindex)
+    thread.start()
+    try:
+        for _ in range(200):
+            assert index.search('vlan users', per_page=10)['total'] == 300
+    finally:
+        done.set()
+        thread.join()
+    assert not errors
+
+
+def test_abstract_line_numbers_repeated_placeholders():
+    assert abstract_line('ip route 10.0.0.0 255.0.0.0 192.168.1.1') == \
+        'ip route {ip_address_1} {subnet_mask} {ip_address_2}'
+    assert abstract_line('ip address 10.1.1.1 255.255.255.0') == 'ip address {ip_address} {subnet_mask}'
+
+
+def test_config_templates_keep_full_parent_stack():
+    lines = ['router bgp 65000',
+             ' neighbor 10.0.0.2 remote-as 65001',
+             ' address-family ipv4',
+             '  neighbor 10.0.0.1 activate',
+             '!',
+             'interface Vlan10',
+             ' ip address 10.1.1.1 255.255.255.0',
+             ' ip helper-address 10.2.2.2']
+
+    templates = list(iter_config_templates(lines))
+
+    assert 'router bgp {as_number}\naddress-family ipv4\nneighbor {ip_address} activate' in templates
+    assert 'interface {interface_name}\nip helper-address {ip_address}' in templates
+    assert 'address-family ipv4\nneighbor {ip_address} activate' not in templates
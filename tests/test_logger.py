@@ -0,0 +1,105 @@
+import logging
+import time
+
+from app.utils.logger import (DEBUG_SAMPLE_BURST, DebugSamplingFilter, LazyJSON, LazyText, configure_logging,
+                              log_event, pipeline, truncate)
+
+
+def make_record(level=logging.DEBUG, lineno=10, name='tests.sampling'):
+    return logging.LogRecord(name, level, __file__, lineno, 'message', None, None)
+
+
+def wait_for(path, text, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists() and text in path.read_text(encoding='utf-8'):
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_debug_sampling_keeps_burst_then_one_in_rate():
+    sampler = DebugSamplingFilter(rate=5)
+
+    kept = [sampler.filter(make_record()) for _ in range(DEBUG_SAMPLE_BURST + 20)]
+
+    assert all(kept[:DEBUG_SAMPLE_BURST])
+    assert sum(kept[DEBUG_SAMPLE_BURST:]) == 4
+    # 호출 위치별로 따로 세고, INFO 이상은 샘플링하지 않음
+    assert sampler.filter(make_record(lineno=11))
+    assert all(sampler.filter(make_record(logging.INFO)) for _ in range(100))
+
+
+def test_debug_sampling_disabled_with_rate_one():
+    sampler = DebugSamplingFilter(rate=1)
+    assert all(sampler.filter(make_record()) for _ in range(DEBUG_SAMPLE_BURST * 3))
+
+
+def test_app_config_sets_sample_rate(app_config):
+    from app import create_app
+
+    class SampledConfig(app_config):
+        LOG_DEBUG_SAMPLE_RATE = 3
+
+    previous = pipeline.sampling_filter.rate
+    try:
+        create_app(SampledConfig)
+        assert pipeline.sampling_filter.rate == 3
+    finally:
+        configure_logging(debug_sample_rate=previous)
+
+
+def test_file_handler_is_registered_once_and_scoped(tmp_path):
+    path = tmp_path / 'scoped.log'
+    handler = pipeline.add_file_handler(str(path), max_bytes=1024, backup_count=1, logger_name='tests.scoped')
+
+    assert pipeline.add_file_handler(str(path), max_bytes=1024, backup_count=1) is handler
+    assert logging.getLogger().handlers.count(pipeline.queue_handler) == 1
+
+    logging.getLogger('tests.other').warning('다른 로거')
+    logging.getLogger('tests.scoped').warning('범위 로거')
+    assert wait_for(path, '범위 로거')
+    assert '다른 로거' not in path.read_text(encoding='utf-8')
+
+
+class Counted:
+    calls = 0
+
+    def __str__(self):
+        Counted.calls += 1
+        return 'x' * 50
+
+
+def test_truncate_reports_dropped_length():
+    assert truncate('abc', 5) == 'abc'
+    assert truncate('a' * 10, 4) == 'aaaa... (총 10자, 6자 생략)'
+
+
+def test_lazy_arguments_are_formatted_only_when_emitted():
+    logger = logging.getLogger('tests.lazy')
+    logger.setLevel(logging.INFO)
+    try:
+        Counted.calls = 0
+        logger.debug('출력: %s', LazyText(Counted()))
+        assert Counted.calls == 0
+        assert str(LazyText(Counted(), limit=10)).startswith('x' * 10 + '...')
+        assert Counted.calls == 1
+    finally:
+        logger.setLevel(logging.NOTSET)
+
+
+def test_lazy_json_is_single_line_and_capped():
+    text = str(LazyJSON({'이름': '스위치', 'items': list(range(1000))}, limit=100))
+    assert text.startswith('{"이름": "스위치"')
+    assert '\n' not in text and '생략' in text
+
+
+def test_log_event_passes_structured_fields(caplog):
+    logger = logging.getLogger('tests.event')
+    with caplog.at_level(logging.INFO, logger='tests.event'):
+        log_event(logger, logging.INFO, 'device.connected', host='10.0.0.1')
+        log_event(logger, logging.DEBUG, 'device.debug', host='10.0.0.1')
+
+    [record] = caplog.records
+    assert record.event == 'device.connected' and record.fields == {'host': '10.0.0.1'}
+    assert record.getMessage() == 'device.connected {"host": "10.0.0.1"}'
@@ -0,0 +1,56 @@
+from app.utils.metrics import (PROMETHEUS_MIMETYPE, Histogram, MetricsRegistry, http_requests_in_flight,
+                               http_requests_total)
+
+
+def sample_values(metric):
+    return {suffix + labels: value for suffix, labels, value in metric.samples()}
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram('latency_seconds', '지연', ('endpoint',), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, endpoint='a')
+
+    values = sample_values(histogram)
+    assert values['_bucket{endpoint="a",le="0.1"}'] == 2
+    assert values['_bucket{endpoint="a",le="1.0"}'] == 3
+    assert values['_bucket{endpoint="a",le="+Inf"}'] == 4
+    assert values['_count{endpoint="a"}'] == 4
+    assert abs(values['_sum{endpoint="a"}'] - 3.65) < 1e-9
+
+
+def test_registry_renders_exposition_format():
+    registry = MetricsRegistry()
+    counter = registry.counter('jobs_total', '작업 수', ('name',))
+    counter.inc(name='say "hi"\n')
+    counter.inc(2, name='say "hi"\n')
+    registry.gauge('workers', '작업자 수').inc(3)
+
+    text = registry.render()
+    assert '# TYPE jobs_total counter' in text
+    assert 'jobs_total{name="say \\"hi\\"\\n"} 3' in text
+    assert 'workers 3' in text and text.endswith('\n')
+
+
+def test_requests_are_recorded_and_exposed(client):
+    key = ('GET', 'unmatched', '404')
+    before = sample_values(http_requests_total).get('{method="GET",endpoint="unmatched",status="404"}', 0)
+
+    assert client.get('/no-such-page').status_code == 404
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.mimetype == PROMETHEUS_MIMETYPE.split(';')[0]
+    assert http_requests_total._values[key] == before + 1
+    text = response.get_data(as_text=True)
+    assert 'http_request_duration_seconds_bucket{method="GET",endpoint="unmatched",le="+Inf"}' in text
+    assert sample_values(http_requests_in_flight)[''] == 0
+
+
+def test_metrics_can_be_disabled(app_config):
+    from app import create_app
+
+    class NoMetricsConfig(app_config):
+        METRICS_ENABLED = False
+
+    assert create_app(NoMetricsConfig).test_client().get('/metrics').status_code == 404
@@ -0,0 +1,65 @@
+import pytest
+
+from app.exceptions import ValidationError
+from app.utils.pagination import decode_cursor, encode_cursor, paginate_items, parse_page_request
+
+
+def test_cursor_round_trip():
+    token = encode_cursor(('스위치-01', 7))
+    assert '=' not in token
+    assert decode_cursor(token) == ('스위치-01', 7)
+
+
+@pytest.mark.parametrize('token', ['!!!', encode_cursor(()), 'e30'])
+def test_invalid_cursor_is_rejected(token):
+    with pytest.raises(ValidationError):
+        decode_cursor(token)
+
+
+def test_page_request_defaults_to_unpaginated_full_list():
+    page = parse_page_request({}, ('id', 'name'), default_fields=('name',))
+    assert not page.paginated and page.limit is None and page.fields == ['name']
+
+
+@pytest.mark.parametrize('args', [{'limit': 'x'}, {'limit': '0'}, {'limit': '1001'}, {'fields': 'name,secret'}])
+def test_page_request_validates_arguments(args):
+    with pytest.raises(ValidationError):
+        parse_page_request(args, ('id', 'name'))
+
+
+def test_paginate_items_walks_every_item_once():
+    items = [{'name': f'sw{i:02d}', 'ip': f'10.0.0.{i}'} for i in range(7)]
+    seen, cursor = [], None
+    while True:
+        args = {'limit': '3', 'fields': 'name'}
+        if cursor:
+            args['cursor'] = cursor
+        page = parse_page_request(args, ('name', 'ip'))
+        rows, cursor = paginate_items(reversed(items), lambda item: (item['name'],), page)
+        assert all(set(row) == {'name'} for row in rows)
+        seen.extend(row['name'] for row in rows)
+        if cursor is None:
+            break
+    assert seen == [item['name'] for item in items]
+
+
+def test_command_list_keyset_pages(client):
+    records = [{'vendor': 'cisco', 'device_type': '스위치', 'task_type': 'VLAN 관리', 'subtask': 'VLAN 생성',
+                'command': f'vlan {i}'} for i in range(5)]
+    client.post('/api/learning/commands/bulk', json=records)
+
+    first = client.get('/api/learning/commands?limit=2&fields=command').get_json()
+    assert first['items'] == [{'command': 'vlan 0'}, {'command': 'vlan 1'}]
+    assert first['has_more'] and first['count'] == 2
+
+    commands = [item['command'] for item in first['items']]
+    cursor = first['next_cursor']
+    while cursor:
+        page = client.get(f'/api/learning/commands?limit=2&fields=command&cursor={cursor}').get_json()
+        commands.extend(item['command'] for item in page['items'])
+        cursor = page['next_cursor']
+    assert commands == [f'vlan {i}' for i in range(5)]
+
+    assert client.get('/api/learning/commands?cursor=!!!').status_code == 400
+    assert client.get('/api/learning/commands?fields=password').status_code == 400
+    assert isinstance(client.get('/api/learning/commands').get_json(), list)
@@ -0,0 +1,21 @@
+from flask import url_for
+
+
+def test_static_folder_serves_js_bundles(app, client):
+    """템플릿이 참조하는 최상위 static/ 의 JS 가 지문 이름으로 제공되어야 함"""
+    assets = app.extensions['static_assets']
+    assert 'js/config.js' in assets.manifest
+
+    with app.test_request_context():
+        url = url_for('static', filename='js/config.js')
+    assert url == '/static/' + assets.manifest['js/config.js']
+
+    response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'immutable' in response.headers['Cache-Control']
+
+
+def test_favicon_is_in_static_folder(client):
+    response = client.get('/static/favicon.ico')
+    assert response.status_code == 200
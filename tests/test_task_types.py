@@ -0,0 +1,87 @@
+from app.utils.catalog_cache import catalog_cache
+
+
+def test_unknown_format_is_rejected_before_caching(client):
+    catalog_cache.invalidate()
+
+    response = client.get('/config/api/task-types?format=bogus')
+
+    assert response.status_code == 400
+    assert response.get_json()['status'] == 'error'
+    assert ('task_types', 'bogus') not in catalog_cache
+
+
+def test_known_formats_are_cached(client):
+    catalog_cache.invalidate()
+
+    names = client.get('/config/api/task-types?format=names_only')
+    full = client.get('/config/api/task-types')
+
+    assert names.status_code == 200 and full.status_code == 200
+    assert all(isinstance(name, str) for name in names.get_json())
+    assert ('task_types', 'names_only') in catalog_cache
+    assert ('task_types', 'full') in catalog_cache
+    catalog_cache.invalidate()
+
+
+def test_reset_route_restores_seed_without_changing_ids(app, client):
+    from app import db
+    from app.models.task_type import TaskType
+    from app.services.seed_service import DEFAULT_TASK_TYPES, SeedService, seed_hash
+
+    client.get('/config/api/task-types')
+    with app.app_context():
+        ids = {task_type.name: task_type.id for task_type in TaskType.query}
+        TaskType.query.filter_by(name='VLAN 관리').first().description = '수정됨'
+        db.session.commit()
+
+    response = client.get('/config/api/reset-task-types')
+
+    assert response.status_code == 200
+    assert response.get_json()['updated'] == 1
+    with app.app_context():
+        assert {task_type.name: task_type.id for task_type in TaskType.query} == ids
+        assert TaskType.query.filter_by(name='VLAN 관리').first().description == DEFAULT_TASK_TYPES[0]['description']
+        assert SeedService().get_version().content_hash == seed_hash(DEFAULT_TASK_TYPES)
+        assert not SeedService().apply_task_types()['applied']
+    catalog_cache.invalidate()
+
+
+SEED = [
+    {'name': 'VLAN 관리', 'description': 'VLAN 생성', 'vendor': 'all'},
+    {'name': '포트 설정', 'description': '포트 모드', 'vendor': 'all'},
+    {'name': '로그 수집', 'description': '로그 저장', 'vendor': 'all'},
+]
+
+
+def test_seed_hash_ignores_row_and_key_order():
+    from app.services.seed_service import seed_hash
+
+    reordered = [dict(reversed(list(row.items()))) for row in reversed(SEED)]
+    assert seed_hash(reordered) == seed_hash(SEED)
+    assert seed_hash(SEED[:2]) != seed_hash(SEED)
+
+
+def test_seed_upsert_keeps_ids_and_user_rows(app):
+    from app import db
+    from app.models.task_type import TaskType
+    from app.services.seed_service import SeedService
+
+    with app.app_context():
+        service = SeedService()
+        assert service.apply_task_types(SEED)['inserted'] == 3
+        assert not service.apply_task_types(SEED)['applied']
+
+        db.session.add(TaskType(name='사용자 작업', description='직접 추가', vendor='cisco'))
+        db.session.commit()
+        ids = {task_type.name: task_type.id for task_type in TaskType.query}
+
+        changed = [dict(SEED[0], description='VLAN 생성/삭제'), SEED[1],
+                   {'name': '구성 백업', 'description': '백업', 'vendor': 'all'}]
+        result = service.apply_task_types(changed)
+
+        assert (result['inserted'], result['updated'], result['deleted']) == (1, 1, 1)
+        names = {task_type.name: task_type.id for task_type in TaskType.query}
+        assert '로그 수집' not in names
+        assert all(names[name] == ids[name] for name in ('VLAN 관리', '포트 설정', '사용자 작업'))
+        assert TaskType.query.filter_by(name='VLAN 관리').first().description == 'VLAN 생성/삭제'
@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from app.services import config_service as config_service_module
+from app.services.config_service import ConfigService
+from app.services.timing_service import TIMING_SUFFIX
+
+
+def device_execution(status='success'):
+    """NetworkDevice.execute_script() 반환값 형태"""
+    return {
+        'status': status,
+        'results': {'show version': 'ok'},
+        'timings': {
+            'started_at': '2024-01-01T09:00:00',
+            'total_ms': 120.0,
+            'phases': {'tcp_connect': 10.0, 'ssh_handshake': 40.0, 'auth': 30.0},
+            'commands': [{'command': 'show version', 'ok': True, 'output_bytes': 2, 'ms': 35.0}]
+        }
+    }
+
+
+def test_simulated_execution_records_no_timings(tmp_path):
+    service = ConfigService(base_dir=str(tmp_path / 'tasks'))
+    service.execute_script('sw1', 'show version\nvlan 10')
+
+    result_dir = tmp_path / 'tasks' / 'sw1' / 'results'
+    assert not [name for name in os.listdir(result_dir) if name.endswith(TIMING_SUFFIX)]
+    assert service.timing_service.summary()['executions'] == 0
+
+
+def test_device_execution_timings_are_summarized(tmp_path):
+    service = ConfigService(base_dir=str(tmp_path / 'tasks'))
+    path = service.save_execution_timings('sw1', 'result_20240101_090000.txt', device_execution(),
+                                          vendor='cisco')
+    assert path.endswith('result_20240101_090000' + TIMING_SUFFIX)
+
+    summary = service.timing_service.summary()
+    group = summary['groups']['cisco']
+    assert set(group['phases']) == {'tcp_connect', 'ssh_handshake', 'auth'}
+    assert group['total_ms']['p50'] == 120.0
+
+
+def test_device_execution_persists_network_phases(tmp_path, monkeypatch):
+    executed = []
+
+    def execute_script(self, commands):
+        executed.append((self.host, self.timeout, commands))
+        return device_execution()
+
+    monkeypatch.setattr(config_service_module.NetworkDevice, 'execute_script', execute_script)
+    service = ConfigService(base_dir=str(tmp_path / 'tasks'))
+    device = {'id': 1, 'name': 'sw1', 'ip': '10.0.0.1', 'vendor': 'cisco', 'username': 'admin', 'password': 'pw'}
+
+    result = service.execute_script('sw1', '! comment\nshow version\n', device=device, timeout=5)
+
+    assert executed == [('10.0.0.1', 5, ['show version'])]
+    assert '> show version\nok' in result
+    summary = service.timing_service.summary(device_id='sw1')
+    assert summary['executions'] == 1
+    assert 'ssh_handshake' in summary['groups']['cisco']['phases']
+
+
+def test_failed_device_execution_is_recorded_and_reported(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_service_module.NetworkDevice, 'execute_script',
+                        lambda self, commands: dict(device_execution('error'), message='인증 실패'))
+    service = ConfigService(base_dir=str(tmp_path / 'tasks'))
+
+    with pytest.raises(ValueError, match='인증 실패'):
+        service.execute_script('sw1', 'show version', device={'ip': '10.0.0.1', 'vendor': 'cisco'})
+
+    record = next(service.timing_service.iter_records(device_id='sw1'))
+    assert record['status'] == 'error'
+
+
+@pytest.mark.parametrize('query', ['device_id=..', 'device_id=../../etc', 'device_id=a/b', 'limit=-1'])
+def test_timings_rejects_unsafe_device_id_and_negative_limit(client, query):
+    response = client.get(f'/config/api/timings?{query}')
+    assert response.status_code == 400
+
+
+def test_device_execution_requires_registered_device(app_config, monkeypatch):
+    from app import create_app
+    from app.routes import config_routes
+
+    class DeviceConfig(app_config):
+        DEVICE_EXECUTION_ENABLED = True
+
+    monkeypatch.setattr(config_routes.device_service, 'get_all_devices', lambda: [])
+    client = create_app(DeviceConfig).test_client()
+
+    response = client.post('/config/api/execute-script',
+                           json={'device_id': 'missing', 'script': 'show version', 'validate': False})
+    assert response.status_code == 404